@@ -50,11 +50,8 @@ class StepAssembly:
         an IC with several pins), pass `fused=False` since this leads to much
         more efficient STEP minification (saves several 100MB in total!).
         """
-        dir_path = path.dirname(out_path)
-        if path.exists(dir_path) and not path.isdir(dir_path):
-            raise RuntimeError(f'Path "{dir_path}" exists but is not a directory')
-        if not path.exists(dir_path):
-            makedirs(dir_path)
+        # Raises FileExistsError if the path exists but is not a directory
+        makedirs(path.dirname(out_path), exist_ok=True)
 
         mode = 'fused' if fused else 'default'  # type: cq.occ_impl.exporters.assembly.STEPExportModeLiterals
         self.assembly.save(out_path, 'STEP', mode=mode, write_pcurves=False)
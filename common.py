@@ -1,13 +1,19 @@
 """
 Common functionality for generator scripts.
 """
-import collections
 import csv
+import io
+import multiprocessing
 import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from os import makedirs, path
+from functools import lru_cache
+from glob import glob
+from itertools import repeat
+from os import cpu_count, makedirs, mkdir, path, utime
 
-from typing import Any, Dict, Iterable, List, OrderedDict, Union
+from typing import Any, Dict, List, Sequence, Set, Union
 
 # String escape sequences
 STRING_ESCAPE_SEQUENCES = (
@@ -24,12 +30,11 @@ STRING_ESCAPE_SEQUENCES = (
 
 def init_cache(uuid_cache_file: str) -> Dict[str, str]:
     print('Loading cache: {}'.format(uuid_cache_file))
-    uuid_cache: OrderedDict[str, str] = collections.OrderedDict()
+    uuid_cache: Dict[str, str] = {}  # Keeps the file order like an OrderedDict, but is faster
     try:
         with open(uuid_cache_file, 'r') as f:
             reader = csv.reader(f, delimiter=',', quotechar='"')
-            for row in reader:
-                uuid_cache[row[0]] = row[1]
+            uuid_cache.update((row[0], row[1]) for row in reader)
     except FileNotFoundError:
         pass
     return uuid_cache
@@ -37,16 +42,21 @@ def init_cache(uuid_cache_file: str) -> Dict[str, str]:
 
 def save_cache(uuid_cache_file: str, uuid_cache: Dict[str, str]) -> None:
     print('Saving cache: {}'.format(uuid_cache_file))
-    with open(uuid_cache_file, 'w') as f:
-        writer = csv.writer(f, delimiter=',', quotechar='"', lineterminator='\n')
-        for k, v in sorted(uuid_cache.items()):
-            writer.writerow([k, v])
+    # The file is always sorted, but only rewritten if its content changed
+    content = io.StringIO()
+    writer = csv.writer(content, delimiter=',', quotechar='"', lineterminator='\n')
+    writer.writerows(sorted(uuid_cache.items()))
+    write_if_changed(uuid_cache_file, content.getvalue().encode('utf-8'))
     print('Done, cached {} UUIDs'.format(len(uuid_cache)))
 
 
+@lru_cache(maxsize=None)
 def now() -> str:
     """
-    Return current timestamp as string.
+    Return the timestamp of the current run as string.
+
+    It is determined on the first call, so all library elements created by
+    one generator run get the same timestamp.
     """
     return datetime.utcnow().replace(microsecond=0).isoformat() + 'Z'
 
@@ -60,9 +70,13 @@ def escape_string(string: str) -> str:
     return string
 
 
+@lru_cache(maxsize=4096)
 def format_float(number: float) -> str:
     """
     Format a float according to LibrePCB normalization rules.
+
+    Results are cached since generators format the same coordinates and
+    dimensions over and over again.
     """
     formatted = '{:.3f}'.format(number)
     if formatted == '-0.000':
@@ -90,13 +104,6 @@ def format_ipc_dimension(number: float, decimal_places: int = 2) -> str:
     return str(int(round(number, 6 - decimal_places)))
 
 
-def indent(level: int, lines: Iterable[str]) -> List[str]:
-    """
-    Indent the lines by the specified level.
-    """
-    return [' ' * level + line for line in lines]
-
-
 def sign(val: Union[int, float]) -> int:
     """
     Return 1 for positive or zero values, -1 otherwise.
@@ -107,26 +114,74 @@ def sign(val: Union[int, float]) -> int:
         return -1
 
 
+@lru_cache(maxsize=None)
+def get_y(pin_number: int, pin_count: int, spacing: float, grid_align: bool) -> float:
+    """
+    Return the y coordinate of the specified pin of a pin row. Keep the pins
+    grid aligned, if desired.
+
+    The pin number is 1 index based. Pin 1 is at the top. The middle pin will
+    be at or near 0.
+
+    """
+    if grid_align:
+        mid = float((pin_count + 1) // 2)
+    else:
+        mid = (pin_count + 1) / 2
+    y = -round(pin_number * spacing - mid * spacing, 2)
+    if y == -0.0:  # Returns true for 0.0 too, but that doesn't matter
+        return 0.0
+    return y
+
+
 def get_pad_uuids(base_lib_path: str, pkg_uuid: str) -> Dict[str, str]:
     """
     Return a mapping from pad name to pad UUID.
     """
-    with open(path.join(base_lib_path, 'pkg', pkg_uuid, 'package.lp'), 'r') as f:
-        lines = f.readlines()
-    opt_matches = [
-        re.match(r' \(pad ([^\s]*) \(name "([^"]*)"\)\)$', line)
-        for line in lines
-    ]
-    matches = list(filter(None, opt_matches))
+    # Match the lines while streaming through the file, without collecting
+    # the lines or the matches in intermediate lists first
+    match_pad = re.compile(r' \(pad ([^\s]*) \(name "([^"]*)"\)\)$').match
     mapping = {}
-    for match in matches:
-        uuid = match.group(1)
-        name = match.group(2)
-        mapping[name] = uuid
-    assert len(matches) == len(mapping)
+    count = 0
+    with open(path.join(base_lib_path, 'pkg', pkg_uuid, 'package.lp'), 'r') as f:
+        for line in f:
+            match = match_pad(line)
+            if match:
+                uuid, name = match.groups()
+                mapping[name] = uuid
+                count += 1
+    assert count == len(mapping)
     return mapping
 
 
+def get_sources_mtime(*extra_sources: str) -> float:
+    """
+    Return the newest modification time of the sources shared by all
+    generators (this module and the entities) and the specified extra sources
+    (usually the generator script itself).
+
+    Relative paths are resolved against the directory of this module, so the
+    result doesn't depend on the current working directory.
+    """
+    this_file = path.abspath(__file__)
+    root = path.dirname(this_file)
+    sources = [this_file, *glob(path.join(root, 'entities', '*.py'))]
+    sources.extend(path.join(root, source) for source in extra_sources)
+    return max(path.getmtime(source) for source in sources)
+
+
+def is_up_to_date(output_file: str, sources_mtime: float) -> bool:
+    """
+    Return whether the output file exists and was modified after the
+    specified time (usually the newest modification time of the sources the
+    output file is generated from).
+    """
+    try:
+        return path.getmtime(output_file) > sources_mtime
+    except OSError:
+        return False
+
+
 def human_sort_key(key: str) -> List[Any]:
     """
     Function that can be used for natural sorting, where "PB2" comes before
@@ -138,15 +193,138 @@ def human_sort_key(key: str) -> List[Any]:
     return [_convert(x) for x in re.split(r'(\d+)', key) if x]
 
 
+# Directories which are known to exist (absolute paths), to avoid checking
+# them again
+existing_directories: Set[str] = set()
+
+
+def ensure_directory(dir_path: str) -> bool:
+    """
+    Create the directory (including missing parents) if it doesn't exist yet.
+    Return whether it was newly created.
+
+    Directories created or found by a previous call are remembered, and the
+    parent directory is only checked once, so usually only a single mkdir()
+    is needed for a new element directory. They are remembered by their
+    absolute path, so relative paths stay correct if the working directory
+    changes.
+    """
+    dir_path = path.abspath(dir_path)
+    if dir_path in existing_directories:
+        return False
+    parent = path.dirname(dir_path)
+    if parent and parent not in existing_directories:
+        makedirs(parent, exist_ok=True)
+        existing_directories.add(parent)
+    try:
+        mkdir(dir_path)
+        created = True
+    except FileExistsError:
+        if not path.isdir(dir_path):
+            raise
+        created = False
+    existing_directories.add(dir_path)
+    return created
+
+
 def serialize_common(serializable: Any, output_directory: str, uuid: str, long_type: str, short_type: str) -> None:
     """
     Centralized serialize() implementation shared between Component, Symbol, Device, Package
     """
-    dir_path = path.join(output_directory, uuid)
-    if not (path.exists(dir_path) and path.isdir(dir_path)):
-        makedirs(dir_path)
-    with open(path.join(dir_path, f'.librepcb-{short_type}'), 'w', newline='\n') as f:
-        f.write('1\n')
-    with open(path.join(dir_path, f'{long_type}.lp'), 'w', newline='\n') as f:
-        f.write(str(serializable))
-        f.write('\n')
+    # Encode the whole file at once and write it in binary mode, which skips
+    # the line ending translation of text mode (LibrePCB always uses '\n')
+    write_element_files(
+        path.join(output_directory, uuid),
+        f'.librepcb-{short_type}',
+        b'1\n',
+        f'{long_type}.lp',
+        f'{serializable}\n'.encode('utf-8'),
+    )
+
+
+def write_element_files(
+    dir_path: str,
+    marker_name: str,
+    marker_content: bytes,
+    file_name: str,
+    content: bytes,
+) -> None:
+    """
+    Write the version marker file and the main file of a library element to
+    its directory, which is created if needed. Existing files are only
+    rewritten if their content changed (see `write_if_changed`).
+    """
+    marker_path = path.join(dir_path, marker_name)
+    if ensure_directory(dir_path):
+        with open(marker_path, 'wb') as f:
+            f.write(marker_content)
+    else:
+        write_if_changed(marker_path, marker_content)  # Usually exists already
+    write_if_changed(path.join(dir_path, file_name), content)
+
+
+def write_if_changed(file_path: str, content: bytes) -> None:
+    """
+    Write the content to the file, unless the file already contains exactly
+    this content. In that case, only its modification time is updated, so
+    it is still considered up to date (see `is_up_to_date`).
+    """
+    try:
+        # Compare and (if needed) overwrite through the same file handle, so
+        # an existing file is only opened once
+        with open(file_path, 'r+b') as f:
+            if f.read() != content:
+                f.seek(0)
+                f.write(content)
+                f.truncate()
+                return
+    except FileNotFoundError:
+        with open(file_path, 'wb') as f:
+            f.write(content)
+        return
+    utime(file_path)
+
+
+def _serialize(serializable: Any, output_directory: str) -> None:
+    serializable.serialize(output_directory)
+
+
+# Below this number of elements, serializing them in the calling process is
+# faster than passing them to the worker processes
+SERIALIZE_PARALLEL_MIN_COUNT = 32
+
+
+@lru_cache(maxsize=None)
+def shared_process_pool() -> ProcessPoolExecutor:
+    """
+    Return a process pool for distributing work over all CPU cores. It is
+    created on the first call and then shared by all callers, so the worker
+    processes are started only once per run.
+
+    On Linux, the worker processes are forked. They then inherit the already
+    loaded generator module, including its UUID cache, instead of importing it
+    again (which would load the caches once more). Other platforms keep their
+    default start method, since forking is not safe on e.g. macOS. No other
+    pool must be created, since forking while the management thread of this
+    pool is running could deadlock.
+    """
+    if sys.platform == 'linux':
+        return ProcessPoolExecutor(mp_context=multiprocessing.get_context('fork'))
+    return ProcessPoolExecutor()
+
+
+def serialize_parallel(serializables: Sequence[Any], output_directory: str) -> None:
+    """
+    Serialize several library elements (e.g. packages or symbols) to the
+    output directory, distributed over all CPU cores.
+
+    The elements must be built beforehand since the UUID caches cannot be
+    shared between processes, but serializing them is independent. Few
+    elements, or elements on a single-core machine, are serialized in the
+    calling process since the pool overhead would outweigh the gain.
+    """
+    if len(serializables) < SERIALIZE_PARALLEL_MIN_COUNT or (cpu_count() or 1) < 2:
+        for serializable in serializables:
+            serializable.serialize(output_directory)
+        return
+    list(shared_process_pool().map(_serialize, serializables, repeat(output_directory), chunksize=8))
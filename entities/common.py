@@ -22,6 +22,8 @@ class EnumValue(Enum):
 
 class DateValue():
     """Helper class to represent a single named date value"""
+    __slots__ = ('name', 'date')
+
     def __init__(self, name: str, date: str):
         self.name = name
         self.date = date
@@ -32,6 +34,8 @@ class DateValue():
 
 class UUIDValue():
     """Helper class to represent a single named UUID value"""
+    __slots__ = ('name', 'uuid')
+
     def __init__(self, name: str, uuid: str):
         self.name = name
         self.uuid = uuid
@@ -42,6 +46,8 @@ class UUIDValue():
 
 class BoolValue():
     """Helper class to represent a single named boolean value"""
+    __slots__ = ('name', 'value')
+
     def __init__(self, name: str, value: bool):
         self.name = name
         self.value = str(value).lower()
@@ -52,6 +58,8 @@ class BoolValue():
 
 class StringValue():
     """Helper class to represent a single named string value"""
+    __slots__ = ('name', 'value')
+
     def __init__(self, name: str, value: str):
         self.name = name
         self.value = value
@@ -62,6 +70,8 @@ class StringValue():
 
 class FloatValue():
     """Helper class to represent a single named float value"""
+    __slots__ = ('name', 'value')
+
     def __init__(self, name: str, value: float):
         self.name = name
         self.value = value
@@ -71,51 +81,71 @@ class FloatValue():
 
 
 class Name(StringValue):
+    __slots__ = ()
+
     def __init__(self, name: str):
         super().__init__('name', name)
 
 
 class Description(StringValue):
+    __slots__ = ()
+
     def __init__(self, description: str):
         super().__init__('description', description)
 
 
 class Keywords(StringValue):
+    __slots__ = ()
+
     def __init__(self, keywords: str):
         super().__init__('keywords', keywords)
 
 
 class Author(StringValue):
+    __slots__ = ()
+
     def __init__(self, author: str):
         super().__init__('author', author)
 
 
 class Version(StringValue):
+    __slots__ = ()
+
     def __init__(self, version: str):
         super().__init__('version', version)
 
 
 class Created(DateValue):
+    __slots__ = ()
+
     def __init__(self, created: str):
         super().__init__('created', created)
 
 
 class Deprecated(BoolValue):
+    __slots__ = ()
+
     def __init__(self, deprecated: bool):
         super().__init__('deprecated', deprecated)
 
 
 class GeneratedBy(StringValue):
+    __slots__ = ()
+
     def __init__(self, generated_by: str):
         super().__init__('generated_by', generated_by)
 
 
 class Category(UUIDValue):
+    __slots__ = ()
+
     def __init__(self, category: str):
         super().__init__('category', category)
 
 
 class Position():
+    __slots__ = ('x', 'y')
+
     def __init__(self, x: float, y: float):
         self.x = x
         self.y = y
@@ -125,6 +155,8 @@ class Position():
 
 
 class Position3D():
+    __slots__ = ('x', 'y', 'z')
+
     def __init__(self, x: float, y: float, z: float):
         self.x = x
         self.y = y
@@ -139,11 +171,15 @@ class Position3D():
 
 
 class Rotation(FloatValue):
+    __slots__ = ()
+
     def __init__(self, rotation: float):
         super().__init__('rotation', rotation)
 
 
 class Rotation3D():
+    __slots__ = ('x', 'y', 'z')
+
     def __init__(self, x: float, y: float, z: float):
         self.x = x
         self.y = y
@@ -158,36 +194,50 @@ class Rotation3D():
 
 
 class Length(FloatValue):
+    __slots__ = ()
+
     def __init__(self, length: float):
         super().__init__('length', length)
 
 
 class Width(FloatValue):
+    __slots__ = ()
+
     def __init__(self, width: float):
         super().__init__('width', width)
 
 
 class Height(FloatValue):
+    __slots__ = ()
+
     def __init__(self, height: float):
         super().__init__('height', height)
 
 
 class Angle(FloatValue):
+    __slots__ = ()
+
     def __init__(self, angle: float):
         super().__init__('angle', angle)
 
 
 class Fill(BoolValue):
+    __slots__ = ()
+
     def __init__(self, fill: bool):
         super().__init__('fill', fill)
 
 
 class GrabArea(BoolValue):
+    __slots__ = ()
+
     def __init__(self, grab_area: bool):
         super().__init__('grab_area', grab_area)
 
 
 class Vertex():
+    __slots__ = ('position', 'angle')
+
     def __init__(self, position: Position, angle: Angle):
         self.position = position
         self.angle = angle
@@ -197,6 +247,8 @@ class Vertex():
 
 
 class Layer():
+    __slots__ = ('layer',)
+
     def __init__(self, layer: str):
         self.layer = layer
 
@@ -266,6 +318,8 @@ def generate_courtyard(
 
 
 class Diameter(FloatValue):
+    __slots__ = ()
+
     def __init__(self, diameter: float):
         super().__init__('diameter', diameter)
 
@@ -290,6 +344,8 @@ class Circle():
 
 
 class Value(StringValue):
+    __slots__ = ()
+
     def __init__(self, value: str):
         super().__init__('value', value)
 
@@ -10,16 +10,22 @@ from .helper import indent_entities
 
 
 class DefaultValue(StringValue):
+    __slots__ = ()
+
     def __init__(self, default_value: str):
         super().__init__('default_value', default_value)
 
 
 class Prefix(StringValue):
+    __slots__ = ()
+
     def __init__(self, prefix: str):
         super().__init__('prefix', prefix)
 
 
 class SchematicOnly(BoolValue):
+    __slots__ = ()
+
     def __init__(self, schematic_only: bool):
         super().__init__('schematic_only', schematic_only)
 
@@ -32,21 +38,29 @@ class Role(EnumValue):
 
 
 class Required(BoolValue):
+    __slots__ = ()
+
     def __init__(self, required: bool):
         super().__init__('required', required)
 
 
 class Negated(BoolValue):
+    __slots__ = ()
+
     def __init__(self, negated: bool):
         super().__init__('negated', negated)
 
 
 class Clock(BoolValue):
+    __slots__ = ()
+
     def __init__(self, clock: bool):
         super().__init__('clock', clock)
 
 
 class ForcedNet(StringValue):
+    __slots__ = ()
+
     def __init__(self, forced_net: str):
         super().__init__('forced_net', forced_net)
 
@@ -70,11 +84,15 @@ class Signal():
 
 
 class SymbolUUID(UUIDValue):
+    __slots__ = ()
+
     def __init__(self, symbol_uuid: str):
         super().__init__('symbol', symbol_uuid)
 
 
 class SignalUUID(UUIDValue):
+    __slots__ = ()
+
     def __init__(self, signal_uuid: str):
         super().__init__('signal', signal_uuid)
 
@@ -99,6 +117,8 @@ class PinSignalMap():
 
 
 class Suffix(StringValue):
+    __slots__ = ()
+
     def __init__(self, suffix: str):
         super().__init__('suffix', suffix)
 
@@ -199,11 +219,13 @@ class Component:
             ' {}\n'.format(self.schematic_only) +\
             ' {}\n'.format(self.default_value) +\
             ' {}\n'.format(self.prefix)
-        ret += indent_entities(self.signals)
-        ret += indent_entities(self.variants)
-        ret += indent_entities(sorted(self.approvals))
-        ret += ')'
-        return ret
+        return ''.join((
+            ret,
+            indent_entities(self.signals),
+            indent_entities(self.variants),
+            indent_entities(sorted(self.approvals)),
+            ')',
+        ))
 
     def add_signal(self, signal: Signal) -> None:
         self.signals.append(signal)
@@ -11,11 +11,15 @@ from .helper import indent_entities
 
 
 class ComponentUUID(UUIDValue):
+    __slots__ = ()
+
     def __init__(self, component_uuid: str):
         super().__init__('component', component_uuid)
 
 
 class PackageUUID(UUIDValue):
+    __slots__ = ()
+
     def __init__(self, package_uuid: str):
         super().__init__('package', package_uuid)
 
@@ -30,6 +34,8 @@ class ComponentPad():
 
 
 class Manufacturer(StringValue):
+    __slots__ = ()
+
     def __init__(self, manufacturer: str):
         super().__init__('manufacturer', manufacturer)
 
@@ -94,11 +100,13 @@ class Device():
             ''.join([' {}\n'.format(cat) for cat in self.categories]) +\
             ' {}\n'.format(self.component_uuid) +\
             ' {}\n'.format(self.package_uuid)
-        ret += indent_entities(sorted(self.pads, key=lambda x: str(x.pad_uuid)))
-        ret += indent_entities(self.parts)
-        ret += indent_entities(sorted(self.approvals))
-        ret += ')'
-        return ret
+        return ''.join((
+            ret,
+            indent_entities(sorted(self.pads, key=lambda x: str(x.pad_uuid))),
+            indent_entities(self.parts),
+            indent_entities(sorted(self.approvals)),
+            ')',
+        ))
 
     def serialize(self, output_directory: str) -> None:
         serialize_common(
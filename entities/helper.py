@@ -1,7 +1,5 @@
 from typing import Any, Iterable
 
-from common import indent
-
 
 def indent_entity(entity: Any) -> str:
     """
@@ -12,10 +10,19 @@ def indent_entity(entity: Any) -> str:
     ' (foo "1")\\n'
     >>> indent_entity('(bar "2"\\n (baz "3")\\n)')
     ' (bar "2"\\n  (baz "3")\\n )\\n'
+    >>> indent_entity('(bar "2"\\n)\\n')
+    ' (bar "2"\\n )\\n'
+    >>> indent_entity('')
+    '\\n'
     """
-    result = '\n'.join(indent(1, str(entity).splitlines()))
-    result += '\n'
-    return result
+    # Indent by replacing the line breaks in place instead of splitting the
+    # (potentially large) string into lines and joining them again.
+    string = str(entity)
+    if not string:
+        return '\n'  # Like an empty list of lines, nothing to indent
+    if string.endswith('\n'):
+        string = string[:-1]  # Like splitlines(), ignore a trailing line break
+    return ' ' + string.replace('\n', '\n ') + '\n'
 
 
 def indent_entities(entities: Iterable[Any]) -> str:
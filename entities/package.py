@@ -69,6 +69,8 @@ class PackagePad():
 
 
 class StrokeWidth(FloatValue):
+    __slots__ = ()
+
     def __init__(self, stroke_width: float):
         super().__init__('stroke_width', stroke_width)
 
@@ -88,11 +90,15 @@ class LineSpacing(EnumValue):
 
 
 class AutoRotate(BoolValue):
+    __slots__ = ()
+
     def __init__(self, auto_rotate: bool):
         super().__init__('auto_rotate', auto_rotate)
 
 
 class Mirror(BoolValue):
+    __slots__ = ()
+
     def __init__(self, mirror: bool):
         super().__init__('mirror', mirror)
 
@@ -142,6 +148,8 @@ class Shape(EnumValue):
 
 
 class ShapeRadius(FloatValue):
+    __slots__ = ()
+
     def __init__(self, radius_normalized: float):
         super().__init__('radius', radius_normalized)
 
@@ -172,11 +180,15 @@ class SolderPasteConfig(EnumValue):
 
 
 class CopperClearance(FloatValue):
+    __slots__ = ()
+
     def __init__(self, clearance: float):
         super().__init__('clearance', clearance)
 
 
 class PackagePadUuid(UUIDValue):
+    __slots__ = ()
+
     def __init__(self, package_pad: str):
         super().__init__('package_pad', package_pad)
 
@@ -197,6 +209,8 @@ class PadFunction(EnumValue):
 
 
 class DrillDiameter(FloatValue):
+    __slots__ = ()
+
     def __init__(self, diameter: float):
         super().__init__('diameter', diameter)
 
@@ -276,17 +290,20 @@ class Footprint():
         self.texts.append(text)
 
     def __str__(self) -> str:
-        ret = '(footprint {}\n'.format(self.uuid) +\
-            ' {}\n'.format(self.name) +\
-            ' {}\n'.format(self.description) +\
-            ' {} {}\n'.format(self.position_3d, self.rotation_3d)
-        ret += indent_entities(sorted(self.models_3d))
-        ret += indent_entities(self.pads)
-        ret += indent_entities(self.polygons)
-        ret += indent_entities(self.circles)
-        ret += indent_entities(self.texts)
-        ret += ')'
-        return ret
+        # Joined in one go, the pads of large footprints make up most of the
+        # string and would otherwise be copied by every concatenation
+        return ''.join((
+            '(footprint {}\n'.format(self.uuid),
+            ' {}\n'.format(self.name),
+            ' {}\n'.format(self.description),
+            ' {} {}\n'.format(self.position_3d, self.rotation_3d),
+            indent_entities(sorted(self.models_3d)),
+            indent_entities(self.pads),
+            indent_entities(self.polygons),
+            indent_entities(self.circles),
+            indent_entities(self.texts),
+            ')',
+        ))
 
 
 class Package:
@@ -335,12 +352,14 @@ class Package:
             ' {}\n'.format(self.generated_by) +\
             ''.join([' {}\n'.format(cat) for cat in self.categories]) +\
             ' {}\n'.format(self.assembly_type)
-        ret += indent_entities(self.pads)
-        ret += indent_entities(self.models_3d)
-        ret += indent_entities(self.footprints)
-        ret += indent_entities(sorted(self.approvals))
-        ret += ')'
-        return ret
+        return ''.join((
+            ret,
+            indent_entities(self.pads),
+            indent_entities(self.models_3d),
+            indent_entities(self.footprints),
+            indent_entities(sorted(self.approvals)),
+            ')',
+        ))
 
     def serialize(self, output_directory: str) -> None:
         serialize_common(
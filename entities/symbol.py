@@ -19,11 +19,15 @@ class NamePosition():
 
 
 class NameRotation(FloatValue):
+    __slots__ = ()
+
     def __init__(self, rotation: float):
         super().__init__('name_rotation', rotation)
 
 
 class NameHeight(FloatValue):
+    __slots__ = ()
+
     def __init__(self, height: float):
         super().__init__('name_height', height)
 
@@ -106,13 +110,15 @@ class Symbol:
             ' {}\n'.format(self.deprecated) +\
             ' {}\n'.format(self.generated_by) +\
             ''.join([' {}\n'.format(cat) for cat in self.categories])
-        ret += indent_entities(self.pins)
-        ret += indent_entities(self.polygons)
-        ret += indent_entities(self.circles)
-        ret += indent_entities(self.texts)
-        ret += indent_entities(sorted(self.approvals))
-        ret += ')'
-        return ret
+        return ''.join((
+            ret,
+            indent_entities(self.pins),
+            indent_entities(self.polygons),
+            indent_entities(self.circles),
+            indent_entities(self.texts),
+            indent_entities(sorted(self.approvals)),
+            ')',
+        ))
 
     def serialize(self, output_directory: str) -> None:
         serialize_common(
@@ -35,9 +35,10 @@ uuid_cache = init_cache(uuid_cache_file)
 
 def uuid(category: str, full_name: str, identifier: str) -> str:
     key = '{}-{}-{}'.format(category, full_name, identifier).lower().replace(' ', '~')
-    if key not in uuid_cache:
-        uuid_cache[key] = str(uuid4())
-    return uuid_cache[key]
+    value = uuid_cache.get(key)
+    if value is None:
+        value = uuid_cache[key] = str(uuid4())
+    return value
 
 
 def calculate_pad_hole_diameter(max_leg_diameter: float) -> float:
@@ -129,8 +130,10 @@ Generated with {generator}
         assembly_type=AssemblyType.THT,
     )
 
-    for i, name in enumerate(pad_names):
-        package.add_pad(PackagePad(uuid=_uuid('pad-' + str(i + 1)), name=Name(name)))
+    # Package pad uuids are referenced again by the pads of every footprint
+    uuid_pads = [_uuid('pad-' + str(i + 1)) for i in range(len(pad_names))]
+    for uuid_pad, name in zip(uuid_pads, pad_names):
+        package.add_pad(PackagePad(uuid=uuid_pad, name=Name(name)))
 
     generated_3d_uuids = set()
     for variant in variants:
@@ -167,7 +170,7 @@ Generated with {generator}
                 solder_paste=SolderPasteConfig.OFF,
                 copper_clearance=CopperClearance(0),
                 function=PadFunction.STANDARD_PAD,
-                package_pad=PackagePadUuid(_uuid('pad-' + str(i + 1))),
+                package_pad=PackagePadUuid(uuid_pads[i]),
                 holes=[PadHole(uuid_pad, DrillDiameter(pad_hole_diameter),
                                [Vertex(Position(0.0, 0.0), Angle(0.0))])],
             ))
@@ -613,268 +616,269 @@ if __name__ == '__main__':
         warning = 'Note: Not generating 3D models unless the "--3d" argument is passed in!'
         print(f'\033[1;33m{warning}\033[0m')
 
-    # Resistors (R-THT)
-    generate_pkg(
-        library='LibrePCB_Base.lplib',
-        pkg_type='R',
-        pkg_identifier='r0204',
-        name='R-THT-0204',
-        description='Standard through-hole resistor according DIN 0204.',
-        keywords='',
-        leg_diameter_nom=0.45,
-        body_diameter_nom=1.9,
-        body_length_nom=3.7,
-        polarized=False,
-        pad_names=('1', '2'),
-        pad_hole_diameter=calculate_pad_hole_diameter(0.5),  # max diameter
-        variants=[
-            FootprintVariant(vertical=False, pitch=7.62, compact=True),
-            FootprintVariant(vertical=False, pitch=10.16, compact=True),
-            FootprintVariant(vertical=False, pitch=12.7, compact=True),
-            FootprintVariant(vertical=False, pitch=15.24, compact=True),
-            FootprintVariant(vertical=False, pitch=5.08, compact=True),  # tight!
-            FootprintVariant(vertical=True, pitch=2.54, compact=True),
-        ],
-        author='U. Bruhin',
-        pkgcat='72ceb547-9e68-4d6b-8c96-283d325e1abf',
-        version='0.4',
-        create_date='2018-10-11T22:24:42Z',
-        generate_3d_models=generate_3d_models,
-    )
-    generate_pkg(
-        library='LibrePCB_Base.lplib',
-        pkg_type='R',
-        pkg_identifier='r0207',
-        name='R-THT-0207',
-        description='Standard through-hole resistor according DIN 0207.',
-        keywords='',
-        leg_diameter_nom=0.6,
-        body_diameter_nom=2.5,
-        body_length_nom=6.5,
-        polarized=False,
-        pad_names=('1', '2'),
-        pad_hole_diameter=calculate_pad_hole_diameter(0.65),  # max diameter
-        variants=[
-            FootprintVariant(vertical=False, pitch=10.16, compact=True),
-            FootprintVariant(vertical=False, pitch=12.7, compact=True),
-            FootprintVariant(vertical=False, pitch=15.24, compact=True),
-            FootprintVariant(vertical=False, pitch=17.78, compact=True),
-            FootprintVariant(vertical=False, pitch=7.62, compact=True),  # tight!
-            FootprintVariant(vertical=True, pitch=2.54, compact=True),
-            FootprintVariant(vertical=True, pitch=5.08, compact=True),
-        ],
-        author='U. Bruhin',
-        pkgcat='72ceb547-9e68-4d6b-8c96-283d325e1abf',
-        version='0.4',
-        create_date='2018-10-11T22:24:42Z',
-        generate_3d_models=generate_3d_models,
-    )
-    generate_pkg(
-        library='LibrePCB_Base.lplib',
-        pkg_type='R',
-        pkg_identifier='r0309',
-        name='R-THT-0309',
-        description='Standard through-hole resistor according DIN 0309.',
-        keywords='',
-        leg_diameter_nom=0.7,
-        body_diameter_nom=3.5,
-        body_length_nom=9,
-        polarized=False,
-        pad_names=('1', '2'),
-        pad_hole_diameter=calculate_pad_hole_diameter(0.75),  # max diameter
-        variants=[
-            FootprintVariant(vertical=False, pitch=12.7, compact=True),
-            FootprintVariant(vertical=False, pitch=15.24, compact=True),
-            FootprintVariant(vertical=False, pitch=17.78, compact=True),
-            FootprintVariant(vertical=False, pitch=20.32, compact=True),
-            FootprintVariant(vertical=False, pitch=10.16, compact=True),  # tight!
-            FootprintVariant(vertical=True, pitch=2.54, compact=True),
-            FootprintVariant(vertical=True, pitch=5.08, compact=True),
-            FootprintVariant(vertical=True, pitch=7.62, compact=True),
-        ],
-        author='U. Bruhin',
-        pkgcat='72ceb547-9e68-4d6b-8c96-283d325e1abf',
-        version='0.4',
-        create_date='2018-10-11T22:24:42Z',
-        generate_3d_models=generate_3d_models,
-    )
-
-    # DO-204 (only the variants which actually exist)
-    generate_pkg(
-        library='LibrePCB_Base.lplib',
-        pkg_type='DO',
-        pkg_identifier='do204aa',
-        name='DO-204AA',
-        description='Diode outline package as specified by JEDEC DO-204AA. ' +
-                    'Also known as DO-7.',
-        keywords='do204aa,do7,do-7',
-        leg_diameter_nom=(0.46 + 0.55) / 2,  # b
-        body_diameter_nom=(2.16 + 2.71) / 2,  # D
-        body_length_nom=(5.85 + 7.62) / 2,  # G
-        polarized=True,
-        pad_names=('1', '2'),
-        pad_hole_diameter=calculate_pad_hole_diameter(0.6),  # b max
-        variants=[
-            FootprintVariant(vertical=False, pitch=10.16, compact=False),
-            FootprintVariant(vertical=False, pitch=10.16, compact=True),
-            FootprintVariant(vertical=False, pitch=12.7, compact=True),
-            FootprintVariant(vertical=False, pitch=15.24, compact=True),
-            FootprintVariant(vertical=True, pitch=2.54, compact=True),
-            FootprintVariant(vertical=True, pitch=3.81, compact=True),
-            FootprintVariant(vertical=True, pitch=5.08, compact=True),
-            FootprintVariant(vertical=True, pitch=7.62, compact=True),
-        ],
-        author='U. Bruhin',
-        pkgcat='dcaa6b6c-0c55-43fd-a320-5dd74a2cdc85',
-        version='0.2',
-        create_date='2023-09-07T13:30:53Z',
-        generate_3d_models=generate_3d_models,
-    )
-    generate_pkg(
-        library='LibrePCB_Base.lplib',
-        pkg_type='DO',
-        pkg_identifier='do204ac',
-        name='DO-204AC',
-        description='Diode outline package as specified by JEDEC DO-204AC. ' +
-                    'Also known as DO-15.',
-        keywords='do204ac,do15,do-15',
-        leg_diameter_nom=(0.69 + 0.88) / 2,  # b
-        body_diameter_nom=(2.65 + 3.55) / 2,  # D
-        body_length_nom=(5.85 + 7.62) / 2,  # G
-        polarized=True,
-        pad_names=('1', '2'),
-        pad_hole_diameter=calculate_pad_hole_diameter(0.88),  # b max
-        variants=[
-            FootprintVariant(vertical=False, pitch=10.16, compact=False),
-            FootprintVariant(vertical=False, pitch=10.16, compact=True),
-            FootprintVariant(vertical=False, pitch=12.7, compact=True),
-            FootprintVariant(vertical=False, pitch=15.24, compact=True),
-            FootprintVariant(vertical=True, pitch=2.54, compact=True),
-            FootprintVariant(vertical=True, pitch=3.81, compact=True),
-            FootprintVariant(vertical=True, pitch=5.08, compact=True),
-            FootprintVariant(vertical=True, pitch=7.62, compact=True),
-        ],
-        author='U. Bruhin',
-        pkgcat='dcaa6b6c-0c55-43fd-a320-5dd74a2cdc85',
-        version='0.2',
-        create_date='2023-09-07T13:30:53Z',
-        generate_3d_models=generate_3d_models,
-    )
-    generate_pkg(
-        library='LibrePCB_Base.lplib',
-        pkg_type='DO',
-        pkg_identifier='do204ag',
-        name='DO-204AG',
-        description='Diode outline package as specified by JEDEC DO-204AG. ' +
-                    'Also known as DO-34.',
-        keywords='do204ag,do43,do-34',
-        leg_diameter_nom=(0.46 + 0.55) / 2,  # b
-        body_diameter_nom=(1.27 + 1.9) / 2,  # D
-        body_length_nom=(2.16 + 3.04) / 2,  # G
-        polarized=True,
-        pad_names=('1', '2'),
-        pad_hole_diameter=calculate_pad_hole_diameter(0.55),  # b max
-        variants=[
-            FootprintVariant(vertical=False, pitch=5.08, compact=False),
-            FootprintVariant(vertical=False, pitch=5.08, compact=True),
-            FootprintVariant(vertical=False, pitch=7.62, compact=True),
-            FootprintVariant(vertical=False, pitch=10.16, compact=True),
-            FootprintVariant(vertical=False, pitch=12.7, compact=True),
-            FootprintVariant(vertical=True, pitch=2.54, compact=True),
-            FootprintVariant(vertical=True, pitch=3.81, compact=True),
-        ],
-        author='U. Bruhin',
-        pkgcat='dcaa6b6c-0c55-43fd-a320-5dd74a2cdc85',
-        version='0.2',
-        create_date='2023-09-07T13:30:53Z',
-        generate_3d_models=generate_3d_models,
-    )
-    generate_pkg(
-        library='LibrePCB_Base.lplib',
-        pkg_type='DO',
-        pkg_identifier='do204ah',
-        name='DO-204AH',
-        description='Diode outline package as specified by JEDEC DO-204AH. ' +
-                    'Also known as DO-35.',
-        keywords='do204ah,do35,do-35',
-        leg_diameter_nom=(0.46 + 0.55) / 2,  # b
-        body_diameter_nom=(1.53 + 2.28) / 2,  # D
-        body_length_nom=(3.05 + 5.08) / 2,  # G
-        polarized=True,
-        pad_names=('1', '2'),
-        pad_hole_diameter=calculate_pad_hole_diameter(0.55),  # b max
-        variants=[
-            FootprintVariant(vertical=False, pitch=7.62, compact=False),
-            FootprintVariant(vertical=False, pitch=7.62, compact=True),
-            FootprintVariant(vertical=False, pitch=10.16, compact=True),
-            FootprintVariant(vertical=False, pitch=12.7, compact=True),
-            FootprintVariant(vertical=True, pitch=2.54, compact=True),
-            FootprintVariant(vertical=True, pitch=3.81, compact=True),
-            FootprintVariant(vertical=True, pitch=5.08, compact=True),
-        ],
-        author='U. Bruhin',
-        pkgcat='dcaa6b6c-0c55-43fd-a320-5dd74a2cdc85',
-        version='0.2',
-        create_date='2023-09-07T13:30:53Z',
-        generate_3d_models=generate_3d_models,
-    )
-    generate_pkg(
-        library='LibrePCB_Base.lplib',
-        pkg_type='DO',
-        pkg_identifier='do204al',
-        name='DO-204AL',
-        description='Diode outline package as specified by JEDEC DO-204AL. ' +
-                    'Also known as DO-41.',
-        keywords='do204al,do41,do-41',
-        leg_diameter_nom=(0.72 + 0.86) / 2,  # b
-        body_diameter_nom=(2.04 + 2.71) / 2,  # D
-        body_length_nom=(4.07 + 5.2) / 2,  # G
-        polarized=True,
-        pad_names=('1', '2'),
-        pad_hole_diameter=calculate_pad_hole_diameter(0.86),  # b max
-        variants=[
-            FootprintVariant(vertical=False, pitch=7.62, compact=False),
-            FootprintVariant(vertical=False, pitch=7.62, compact=True),
-            FootprintVariant(vertical=False, pitch=10.16, compact=True),
-            FootprintVariant(vertical=False, pitch=12.7, compact=True),
-            FootprintVariant(vertical=True, pitch=2.54, compact=True),
-            FootprintVariant(vertical=True, pitch=3.81, compact=True),
-            FootprintVariant(vertical=True, pitch=5.08, compact=True),
-        ],
-        author='U. Bruhin',
-        pkgcat='dcaa6b6c-0c55-43fd-a320-5dd74a2cdc85',
-        version='0.2',
-        create_date='2023-09-07T13:30:53Z',
-        generate_3d_models=generate_3d_models,
-    )
-    generate_pkg(
-        library='LibrePCB_Base.lplib',
-        pkg_type='DO',
-        pkg_identifier='do204ar',
-        name='DO-204AR',
-        description='Diode outline package as specified by JEDEC DO-204AR.',
-        keywords='do204ar',
-        leg_diameter_nom=(1.22 + 1.32) / 2,  # b
-        body_diameter_nom=(6.1 + 6.35) / 2,  # D
-        body_length_nom=(9.27 + 9.52) / 2,  # G
-        polarized=True,
-        pad_names=('1', '2'),
-        pad_hole_diameter=calculate_pad_hole_diameter(1.32),  # b max
-        variants=[
-            FootprintVariant(vertical=False, pitch=15.24, compact=False),
-            FootprintVariant(vertical=False, pitch=15.24, compact=True),
-            FootprintVariant(vertical=False, pitch=17.78, compact=True),
-            FootprintVariant(vertical=False, pitch=20.32, compact=True),
-            FootprintVariant(vertical=True, pitch=5.08, compact=True),
-            FootprintVariant(vertical=True, pitch=7.62, compact=True),
-            FootprintVariant(vertical=True, pitch=10.16, compact=True),
-            FootprintVariant(vertical=True, pitch=12.7, compact=True),
-        ],
-        author='U. Bruhin',
-        pkgcat='dcaa6b6c-0c55-43fd-a320-5dd74a2cdc85',
-        version='0.2',
-        create_date='2023-09-07T13:30:53Z',
-        generate_3d_models=generate_3d_models,
-    )
+    try:
+        # Resistors (R-THT)
+        generate_pkg(
+            library='LibrePCB_Base.lplib',
+            pkg_type='R',
+            pkg_identifier='r0204',
+            name='R-THT-0204',
+            description='Standard through-hole resistor according DIN 0204.',
+            keywords='',
+            leg_diameter_nom=0.45,
+            body_diameter_nom=1.9,
+            body_length_nom=3.7,
+            polarized=False,
+            pad_names=('1', '2'),
+            pad_hole_diameter=calculate_pad_hole_diameter(0.5),  # max diameter
+            variants=[
+                FootprintVariant(vertical=False, pitch=7.62, compact=True),
+                FootprintVariant(vertical=False, pitch=10.16, compact=True),
+                FootprintVariant(vertical=False, pitch=12.7, compact=True),
+                FootprintVariant(vertical=False, pitch=15.24, compact=True),
+                FootprintVariant(vertical=False, pitch=5.08, compact=True),  # tight!
+                FootprintVariant(vertical=True, pitch=2.54, compact=True),
+            ],
+            author='U. Bruhin',
+            pkgcat='72ceb547-9e68-4d6b-8c96-283d325e1abf',
+            version='0.4',
+            create_date='2018-10-11T22:24:42Z',
+            generate_3d_models=generate_3d_models,
+        )
+        generate_pkg(
+            library='LibrePCB_Base.lplib',
+            pkg_type='R',
+            pkg_identifier='r0207',
+            name='R-THT-0207',
+            description='Standard through-hole resistor according DIN 0207.',
+            keywords='',
+            leg_diameter_nom=0.6,
+            body_diameter_nom=2.5,
+            body_length_nom=6.5,
+            polarized=False,
+            pad_names=('1', '2'),
+            pad_hole_diameter=calculate_pad_hole_diameter(0.65),  # max diameter
+            variants=[
+                FootprintVariant(vertical=False, pitch=10.16, compact=True),
+                FootprintVariant(vertical=False, pitch=12.7, compact=True),
+                FootprintVariant(vertical=False, pitch=15.24, compact=True),
+                FootprintVariant(vertical=False, pitch=17.78, compact=True),
+                FootprintVariant(vertical=False, pitch=7.62, compact=True),  # tight!
+                FootprintVariant(vertical=True, pitch=2.54, compact=True),
+                FootprintVariant(vertical=True, pitch=5.08, compact=True),
+            ],
+            author='U. Bruhin',
+            pkgcat='72ceb547-9e68-4d6b-8c96-283d325e1abf',
+            version='0.4',
+            create_date='2018-10-11T22:24:42Z',
+            generate_3d_models=generate_3d_models,
+        )
+        generate_pkg(
+            library='LibrePCB_Base.lplib',
+            pkg_type='R',
+            pkg_identifier='r0309',
+            name='R-THT-0309',
+            description='Standard through-hole resistor according DIN 0309.',
+            keywords='',
+            leg_diameter_nom=0.7,
+            body_diameter_nom=3.5,
+            body_length_nom=9,
+            polarized=False,
+            pad_names=('1', '2'),
+            pad_hole_diameter=calculate_pad_hole_diameter(0.75),  # max diameter
+            variants=[
+                FootprintVariant(vertical=False, pitch=12.7, compact=True),
+                FootprintVariant(vertical=False, pitch=15.24, compact=True),
+                FootprintVariant(vertical=False, pitch=17.78, compact=True),
+                FootprintVariant(vertical=False, pitch=20.32, compact=True),
+                FootprintVariant(vertical=False, pitch=10.16, compact=True),  # tight!
+                FootprintVariant(vertical=True, pitch=2.54, compact=True),
+                FootprintVariant(vertical=True, pitch=5.08, compact=True),
+                FootprintVariant(vertical=True, pitch=7.62, compact=True),
+            ],
+            author='U. Bruhin',
+            pkgcat='72ceb547-9e68-4d6b-8c96-283d325e1abf',
+            version='0.4',
+            create_date='2018-10-11T22:24:42Z',
+            generate_3d_models=generate_3d_models,
+        )
 
-    save_cache(uuid_cache_file, uuid_cache)
+        # DO-204 (only the variants which actually exist)
+        generate_pkg(
+            library='LibrePCB_Base.lplib',
+            pkg_type='DO',
+            pkg_identifier='do204aa',
+            name='DO-204AA',
+            description='Diode outline package as specified by JEDEC DO-204AA. ' +
+                        'Also known as DO-7.',
+            keywords='do204aa,do7,do-7',
+            leg_diameter_nom=(0.46 + 0.55) / 2,  # b
+            body_diameter_nom=(2.16 + 2.71) / 2,  # D
+            body_length_nom=(5.85 + 7.62) / 2,  # G
+            polarized=True,
+            pad_names=('1', '2'),
+            pad_hole_diameter=calculate_pad_hole_diameter(0.6),  # b max
+            variants=[
+                FootprintVariant(vertical=False, pitch=10.16, compact=False),
+                FootprintVariant(vertical=False, pitch=10.16, compact=True),
+                FootprintVariant(vertical=False, pitch=12.7, compact=True),
+                FootprintVariant(vertical=False, pitch=15.24, compact=True),
+                FootprintVariant(vertical=True, pitch=2.54, compact=True),
+                FootprintVariant(vertical=True, pitch=3.81, compact=True),
+                FootprintVariant(vertical=True, pitch=5.08, compact=True),
+                FootprintVariant(vertical=True, pitch=7.62, compact=True),
+            ],
+            author='U. Bruhin',
+            pkgcat='dcaa6b6c-0c55-43fd-a320-5dd74a2cdc85',
+            version='0.2',
+            create_date='2023-09-07T13:30:53Z',
+            generate_3d_models=generate_3d_models,
+        )
+        generate_pkg(
+            library='LibrePCB_Base.lplib',
+            pkg_type='DO',
+            pkg_identifier='do204ac',
+            name='DO-204AC',
+            description='Diode outline package as specified by JEDEC DO-204AC. ' +
+                        'Also known as DO-15.',
+            keywords='do204ac,do15,do-15',
+            leg_diameter_nom=(0.69 + 0.88) / 2,  # b
+            body_diameter_nom=(2.65 + 3.55) / 2,  # D
+            body_length_nom=(5.85 + 7.62) / 2,  # G
+            polarized=True,
+            pad_names=('1', '2'),
+            pad_hole_diameter=calculate_pad_hole_diameter(0.88),  # b max
+            variants=[
+                FootprintVariant(vertical=False, pitch=10.16, compact=False),
+                FootprintVariant(vertical=False, pitch=10.16, compact=True),
+                FootprintVariant(vertical=False, pitch=12.7, compact=True),
+                FootprintVariant(vertical=False, pitch=15.24, compact=True),
+                FootprintVariant(vertical=True, pitch=2.54, compact=True),
+                FootprintVariant(vertical=True, pitch=3.81, compact=True),
+                FootprintVariant(vertical=True, pitch=5.08, compact=True),
+                FootprintVariant(vertical=True, pitch=7.62, compact=True),
+            ],
+            author='U. Bruhin',
+            pkgcat='dcaa6b6c-0c55-43fd-a320-5dd74a2cdc85',
+            version='0.2',
+            create_date='2023-09-07T13:30:53Z',
+            generate_3d_models=generate_3d_models,
+        )
+        generate_pkg(
+            library='LibrePCB_Base.lplib',
+            pkg_type='DO',
+            pkg_identifier='do204ag',
+            name='DO-204AG',
+            description='Diode outline package as specified by JEDEC DO-204AG. ' +
+                        'Also known as DO-34.',
+            keywords='do204ag,do43,do-34',
+            leg_diameter_nom=(0.46 + 0.55) / 2,  # b
+            body_diameter_nom=(1.27 + 1.9) / 2,  # D
+            body_length_nom=(2.16 + 3.04) / 2,  # G
+            polarized=True,
+            pad_names=('1', '2'),
+            pad_hole_diameter=calculate_pad_hole_diameter(0.55),  # b max
+            variants=[
+                FootprintVariant(vertical=False, pitch=5.08, compact=False),
+                FootprintVariant(vertical=False, pitch=5.08, compact=True),
+                FootprintVariant(vertical=False, pitch=7.62, compact=True),
+                FootprintVariant(vertical=False, pitch=10.16, compact=True),
+                FootprintVariant(vertical=False, pitch=12.7, compact=True),
+                FootprintVariant(vertical=True, pitch=2.54, compact=True),
+                FootprintVariant(vertical=True, pitch=3.81, compact=True),
+            ],
+            author='U. Bruhin',
+            pkgcat='dcaa6b6c-0c55-43fd-a320-5dd74a2cdc85',
+            version='0.2',
+            create_date='2023-09-07T13:30:53Z',
+            generate_3d_models=generate_3d_models,
+        )
+        generate_pkg(
+            library='LibrePCB_Base.lplib',
+            pkg_type='DO',
+            pkg_identifier='do204ah',
+            name='DO-204AH',
+            description='Diode outline package as specified by JEDEC DO-204AH. ' +
+                        'Also known as DO-35.',
+            keywords='do204ah,do35,do-35',
+            leg_diameter_nom=(0.46 + 0.55) / 2,  # b
+            body_diameter_nom=(1.53 + 2.28) / 2,  # D
+            body_length_nom=(3.05 + 5.08) / 2,  # G
+            polarized=True,
+            pad_names=('1', '2'),
+            pad_hole_diameter=calculate_pad_hole_diameter(0.55),  # b max
+            variants=[
+                FootprintVariant(vertical=False, pitch=7.62, compact=False),
+                FootprintVariant(vertical=False, pitch=7.62, compact=True),
+                FootprintVariant(vertical=False, pitch=10.16, compact=True),
+                FootprintVariant(vertical=False, pitch=12.7, compact=True),
+                FootprintVariant(vertical=True, pitch=2.54, compact=True),
+                FootprintVariant(vertical=True, pitch=3.81, compact=True),
+                FootprintVariant(vertical=True, pitch=5.08, compact=True),
+            ],
+            author='U. Bruhin',
+            pkgcat='dcaa6b6c-0c55-43fd-a320-5dd74a2cdc85',
+            version='0.2',
+            create_date='2023-09-07T13:30:53Z',
+            generate_3d_models=generate_3d_models,
+        )
+        generate_pkg(
+            library='LibrePCB_Base.lplib',
+            pkg_type='DO',
+            pkg_identifier='do204al',
+            name='DO-204AL',
+            description='Diode outline package as specified by JEDEC DO-204AL. ' +
+                        'Also known as DO-41.',
+            keywords='do204al,do41,do-41',
+            leg_diameter_nom=(0.72 + 0.86) / 2,  # b
+            body_diameter_nom=(2.04 + 2.71) / 2,  # D
+            body_length_nom=(4.07 + 5.2) / 2,  # G
+            polarized=True,
+            pad_names=('1', '2'),
+            pad_hole_diameter=calculate_pad_hole_diameter(0.86),  # b max
+            variants=[
+                FootprintVariant(vertical=False, pitch=7.62, compact=False),
+                FootprintVariant(vertical=False, pitch=7.62, compact=True),
+                FootprintVariant(vertical=False, pitch=10.16, compact=True),
+                FootprintVariant(vertical=False, pitch=12.7, compact=True),
+                FootprintVariant(vertical=True, pitch=2.54, compact=True),
+                FootprintVariant(vertical=True, pitch=3.81, compact=True),
+                FootprintVariant(vertical=True, pitch=5.08, compact=True),
+            ],
+            author='U. Bruhin',
+            pkgcat='dcaa6b6c-0c55-43fd-a320-5dd74a2cdc85',
+            version='0.2',
+            create_date='2023-09-07T13:30:53Z',
+            generate_3d_models=generate_3d_models,
+        )
+        generate_pkg(
+            library='LibrePCB_Base.lplib',
+            pkg_type='DO',
+            pkg_identifier='do204ar',
+            name='DO-204AR',
+            description='Diode outline package as specified by JEDEC DO-204AR.',
+            keywords='do204ar',
+            leg_diameter_nom=(1.22 + 1.32) / 2,  # b
+            body_diameter_nom=(6.1 + 6.35) / 2,  # D
+            body_length_nom=(9.27 + 9.52) / 2,  # G
+            polarized=True,
+            pad_names=('1', '2'),
+            pad_hole_diameter=calculate_pad_hole_diameter(1.32),  # b max
+            variants=[
+                FootprintVariant(vertical=False, pitch=15.24, compact=False),
+                FootprintVariant(vertical=False, pitch=15.24, compact=True),
+                FootprintVariant(vertical=False, pitch=17.78, compact=True),
+                FootprintVariant(vertical=False, pitch=20.32, compact=True),
+                FootprintVariant(vertical=True, pitch=5.08, compact=True),
+                FootprintVariant(vertical=True, pitch=7.62, compact=True),
+                FootprintVariant(vertical=True, pitch=10.16, compact=True),
+                FootprintVariant(vertical=True, pitch=12.7, compact=True),
+            ],
+            author='U. Bruhin',
+            pkgcat='dcaa6b6c-0c55-43fd-a320-5dd74a2cdc85',
+            version='0.2',
+            create_date='2023-09-07T13:30:53Z',
+            generate_3d_models=generate_3d_models,
+        )
+    finally:
+        save_cache(uuid_cache_file, uuid_cache)
@@ -49,9 +49,10 @@ def uuid(category: str, full_name: str, identifier: str) -> str:
             For example 'pad-1' or 'pin-13'.
     """
     key = '{}-{}-{}'.format(category, full_name, identifier).lower().replace(' ', '~')
-    if key not in uuid_cache:
-        uuid_cache[key] = str(uuid4())
-    return uuid_cache[key]
+    value = uuid_cache.get(key)
+    if value is None:
+        value = uuid_cache[key] = str(uuid4())
+    return value
 
 
 def get_variant(
@@ -423,55 +424,56 @@ if __name__ == '__main__':
         warning = 'Note: Not generating 3D models unless the "--3d" argument is passed in!'
         print(f'\033[1;33m{warning}\033[0m')
 
-    CONFIGS = [
-        # Some typical, frequently used configurations. The lead width depends
-        # from package to package, thus choosing the highest value to ensure
-        # compatibility with all variants (models with thinner leads can
-        # still be mount).
-        {'diameter':  3.0, 'height':  5.0, 'pitch': 1.0, 'lead_width': 0.4},
-        {'diameter':  4.0, 'height':  5.0, 'pitch': 1.5, 'lead_width': 0.45},
-        {'diameter':  4.0, 'height':  7.0, 'pitch': 1.5, 'lead_width': 0.45},
-        {'diameter':  4.0, 'height': 11.0, 'pitch': 1.5, 'lead_width': 0.45},
-        {'diameter':  5.0, 'height':  5.0, 'pitch': 2.0, 'lead_width': 0.5},
-        {'diameter':  5.0, 'height':  7.0, 'pitch': 2.0, 'lead_width': 0.5},
-        {'diameter':  5.0, 'height': 11.0, 'pitch': 2.0, 'lead_width': 0.5},
-        {'diameter':  6.3, 'height':  5.0, 'pitch': 2.5, 'lead_width': 0.5},
-        {'diameter':  6.3, 'height':  7.0, 'pitch': 2.5, 'lead_width': 0.5},
-        {'diameter':  6.3, 'height': 11.0, 'pitch': 2.5, 'lead_width': 0.5},
-        {'diameter':  8.0, 'height':  5.0, 'pitch': 2.5, 'lead_width': 0.6},
-        {'diameter':  8.0, 'height':  7.0, 'pitch': 3.5, 'lead_width': 0.6},
-        {'diameter':  8.0, 'height': 11.5, 'pitch': 3.5, 'lead_width': 0.6},
-        {'diameter': 10.0, 'height': 12.5, 'pitch': 5.0, 'lead_width': 0.6},
-        {'diameter': 10.0, 'height': 16.0, 'pitch': 5.0, 'lead_width': 0.6},
-        {'diameter': 10.0, 'height': 20.0, 'pitch': 5.0, 'lead_width': 0.6},
-        {'diameter': 12.5, 'height': 20.0, 'pitch': 5.0, 'lead_width': 0.8},
-        {'diameter': 12.5, 'height': 25.0, 'pitch': 5.0, 'lead_width': 0.8},
-        {'diameter': 16.0, 'height': 25.0, 'pitch': 7.5, 'lead_width': 0.8},
-        {'diameter': 16.0, 'height': 31.5, 'pitch': 7.5, 'lead_width': 0.8},
-        {'diameter': 18.0, 'height': 35.5, 'pitch': 7.5, 'lead_width': 0.8},
-    ]
-
-    for config in CONFIGS:
-        generate_pkg(
-            library='LibrePCB_Base.lplib',
-            diameter=config['diameter'],
-            height=config['height'],
-            pitch=config['pitch'],
-            lead_width=config['lead_width'],
-            generate_3d_models=generate_3d_models,
-            author='U. Bruhin',
-            version='0.2',
-            create_date='2019-12-29T14:14:11Z',
-        )
-        generate_dev(
-            library='LibrePCB_Base.lplib',
-            diameter=config['diameter'],
-            height=config['height'],
-            pitch=config['pitch'],
-            lead_width=config['lead_width'],
-            author='U. Bruhin',
-            version='0.1',
-            create_date='2019-12-29T14:14:11Z',
-        )
-
-    save_cache(uuid_cache_file, uuid_cache)
+    try:
+        CONFIGS = [
+            # Some typical, frequently used configurations. The lead width depends
+            # from package to package, thus choosing the highest value to ensure
+            # compatibility with all variants (models with thinner leads can
+            # still be mount).
+            {'diameter':  3.0, 'height':  5.0, 'pitch': 1.0, 'lead_width': 0.4},
+            {'diameter':  4.0, 'height':  5.0, 'pitch': 1.5, 'lead_width': 0.45},
+            {'diameter':  4.0, 'height':  7.0, 'pitch': 1.5, 'lead_width': 0.45},
+            {'diameter':  4.0, 'height': 11.0, 'pitch': 1.5, 'lead_width': 0.45},
+            {'diameter':  5.0, 'height':  5.0, 'pitch': 2.0, 'lead_width': 0.5},
+            {'diameter':  5.0, 'height':  7.0, 'pitch': 2.0, 'lead_width': 0.5},
+            {'diameter':  5.0, 'height': 11.0, 'pitch': 2.0, 'lead_width': 0.5},
+            {'diameter':  6.3, 'height':  5.0, 'pitch': 2.5, 'lead_width': 0.5},
+            {'diameter':  6.3, 'height':  7.0, 'pitch': 2.5, 'lead_width': 0.5},
+            {'diameter':  6.3, 'height': 11.0, 'pitch': 2.5, 'lead_width': 0.5},
+            {'diameter':  8.0, 'height':  5.0, 'pitch': 2.5, 'lead_width': 0.6},
+            {'diameter':  8.0, 'height':  7.0, 'pitch': 3.5, 'lead_width': 0.6},
+            {'diameter':  8.0, 'height': 11.5, 'pitch': 3.5, 'lead_width': 0.6},
+            {'diameter': 10.0, 'height': 12.5, 'pitch': 5.0, 'lead_width': 0.6},
+            {'diameter': 10.0, 'height': 16.0, 'pitch': 5.0, 'lead_width': 0.6},
+            {'diameter': 10.0, 'height': 20.0, 'pitch': 5.0, 'lead_width': 0.6},
+            {'diameter': 12.5, 'height': 20.0, 'pitch': 5.0, 'lead_width': 0.8},
+            {'diameter': 12.5, 'height': 25.0, 'pitch': 5.0, 'lead_width': 0.8},
+            {'diameter': 16.0, 'height': 25.0, 'pitch': 7.5, 'lead_width': 0.8},
+            {'diameter': 16.0, 'height': 31.5, 'pitch': 7.5, 'lead_width': 0.8},
+            {'diameter': 18.0, 'height': 35.5, 'pitch': 7.5, 'lead_width': 0.8},
+        ]
+
+        for config in CONFIGS:
+            generate_pkg(
+                library='LibrePCB_Base.lplib',
+                diameter=config['diameter'],
+                height=config['height'],
+                pitch=config['pitch'],
+                lead_width=config['lead_width'],
+                generate_3d_models=generate_3d_models,
+                author='U. Bruhin',
+                version='0.2',
+                create_date='2019-12-29T14:14:11Z',
+            )
+            generate_dev(
+                library='LibrePCB_Base.lplib',
+                diameter=config['diameter'],
+                height=config['height'],
+                pitch=config['pitch'],
+                lead_width=config['lead_width'],
+                author='U. Bruhin',
+                version='0.1',
+                create_date='2019-12-29T14:14:11Z',
+            )
+    finally:
+        save_cache(uuid_cache_file, uuid_cache)
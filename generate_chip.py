@@ -9,7 +9,7 @@ import sys
 from os import path
 from uuid import uuid4
 
-from typing import Dict, Iterable, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from common import format_ipc_dimension as fd
 from common import init_cache, now, save_cache
@@ -79,11 +79,12 @@ def uuid(category: str, full_name: str, identifier: str, create: bool = True) ->
             For example 'pad-1' or 'pin-13'.
     """
     key = '{}-{}-{}'.format(category, full_name, identifier).lower().replace(' ', '~')
-    if key not in uuid_cache:
+    value = uuid_cache.get(key)
+    if value is None:
         if not create:
             raise ValueError('Unknown UUID: {}'.format(key))
-        uuid_cache[key] = str(uuid4())
-    return uuid_cache[key]
+        value = uuid_cache[key] = str(uuid4())
+    return value
 
 
 class BodyDimensions:
@@ -197,6 +198,7 @@ def generate_pkg(
     create_date: Optional[str]
 ) -> None:
     category = 'pkg'
+    progress: List[str] = []  # Written to stdout in one go at the end
     for config in configs:
         fmt_params: Dict[str, str] = {
             'size_metric': config.size_metric(),
@@ -239,7 +241,7 @@ def generate_pkg(
         else:
             uuid_pads = [_uuid('pad-1'), _uuid('pad-2')]
 
-        print('Generating pkg "{}": {}'.format(full_name, uuid_pkg))
+        progress.append('Generating pkg "{}": {}\n'.format(full_name, uuid_pkg))
 
         package = Package(
             uuid=uuid_pkg,
@@ -621,6 +623,7 @@ def generate_pkg(
                 )
 
         package.serialize(path.join('out', library, category))
+    sys.stdout.write(''.join(progress))
 
 
 def generate_3d(
@@ -698,6 +701,7 @@ def generate_dev(
     create_date: Optional[str]
 ) -> None:
     category = 'dev'
+    progress: List[str] = []  # Written to stdout in one go at the end
     for (size_metric, size_imperial, pkg_name) in packages:
         fmt_params: Dict[str, str] = {
             'size_metric': size_metric,
@@ -705,8 +709,8 @@ def generate_dev(
         }
         full_name = name.format(**fmt_params)
         full_desc = description.format(**fmt_params) + \
-            "\n\nGenerated with {}".format(generator)
-        full_keywords = "{},{},{}".format(size_metric, size_imperial, keywords)
+            f"\n\nGenerated with {generator}"
+        full_keywords = f"{size_metric},{size_imperial},{keywords}"
 
         def _uuid(identifier: str) -> str:
             return uuid(category, full_name, identifier)
@@ -714,9 +718,9 @@ def generate_dev(
         # UUIDs
         uuid_dev = _uuid('dev')
         pkg = uuid('pkg', pkg_name, 'pkg', create=False)
-        pads = [uuid('pkg', pkg_name, 'pad-{}'.format(i), create=False) for i in range(1, 3)]
+        pads = [uuid('pkg', pkg_name, f'pad-{i}', create=False) for i in range(1, 3)]
 
-        print('Generating dev "{}": {}'.format(full_name, uuid_dev))
+        progress.append(f'Generating dev "{full_name}": {uuid_dev}\n')
 
         device = Device(
             uuid=uuid_dev,
@@ -740,6 +744,7 @@ def generate_dev(
         device.add_approval("(approved no_parts)")
 
         device.serialize(path.join('out', library, category))
+    sys.stdout.write(''.join(progress))
 
 
 if __name__ == '__main__':
@@ -755,285 +760,287 @@ if __name__ == '__main__':
         warning = 'Note: Not generating 3D models unless the "--3d" argument is passed in!'
         print(f'\033[1;33m{warning}\033[0m')
 
-    # Chip resistors (RESC)
-    generate_pkg(
-        library='LibrePCB_Base.lplib',
-        author='Danilo B.',
-        package_type='RESC',
-        name='{package_type}{size_metric} ({size_imperial})',
-        description='Generic chip resistor {size_metric} (imperial {size_imperial}).\n\n'
-                    'Length: {length}mm\nWidth: {width}mm',
-        polarization=None,
-        configs=[
-            # Configuration: Values taken from Samsung specs.
-            ChipConfig('01005', BodyDimensions(.4,   .2,  0.15), gap=0.2),   # noqa
-            ChipConfig('0201',  BodyDimensions(.6,   .3,  0.26), gap=0.28),  # noqa
-            ChipConfig('0402',  BodyDimensions(1.0,  .5,  0.35), gap=0.5),   # noqa
-            ChipConfig('0603',  BodyDimensions(1.6,  .8,  0.55), gap=0.8),   # noqa
-            ChipConfig('0805',  BodyDimensions(2.0, 1.25, 0.70), gap=1.2),   # noqa
-            ChipConfig('1206',  BodyDimensions(3.2, 1.6,  0.70), gap=1.8),   # noqa
-            ChipConfig('1210',  BodyDimensions(3.2, 2.55, 0.70), gap=1.8),   # noqa
-            ChipConfig('1218',  BodyDimensions(3.2, 4.6,  0.70), gap=1.8),   # noqa
-            ChipConfig('2010',  BodyDimensions(5.0, 2.5,  0.70), gap=3.3),   # noqa
-            ChipConfig('2512',  BodyDimensions(6.4, 3.2,  0.70), gap=4.6),   # noqa
-        ],
-        generate_3d_models=generate_3d_models,
-        pkgcat='a20f0330-06d3-4bc2-a1fa-f8577deb6770',
-        keywords='r,resistor,chip,generic',
-        version='0.4',
-        create_date='2018-12-19T00:08:03Z',
-    )
-    # J-Lead resistors (RESJ)
-    generate_pkg(
-        library='LibrePCB_Base.lplib',
-        author='Danilo B.',
-        package_type='RESJ',
-        name='{package_type}{size_metric} ({size_imperial})',
-        description='Generic J-lead resistor {size_metric} (imperial {size_imperial}).\n\n'
-                    'Length: {length}mm\nWidth: {width}mm',
-        polarization=None,
-        configs=[
-            ChipConfig('4527', BodyDimensions(11.56, 6.98, 5.84), gap=5.2),
-        ],
-        generate_3d_models=generate_3d_models,
-        pkgcat='a20f0330-06d3-4bc2-a1fa-f8577deb6770',
-        keywords='r,resistor,j-lead,generic',
-        version='0.4',
-        create_date='2019-01-04T23:06:17Z',
-    )
-    # Chip capacitors (CAPC)
-    generate_pkg(
-        library='LibrePCB_Base.lplib',
-        author='murray',
-        package_type='CAPC',
-        name='{package_type}{size_metric} ({size_imperial})',
-        description='Generic chip capacitor {size_metric} (imperial {size_imperial}).\n\n'
-                    'Length: {length}mm\nWidth: {width}mm',
-        polarization=None,
-        configs=[
-            # C0402
-            ChipConfig('01005', BodyDimensions(0.4, 0.2, 0.2), gap=0.15),
-            # C0603
-            ChipConfig('0201', BodyDimensions(0.6, 0.3, 0.3), gap=0.2),
-            # C1005
-            ChipConfig('0402', BodyDimensions(1.0, 0.5, 0.5), gap=0.4),
-            # C1608
-            ChipConfig('0603', BodyDimensions(1.6, 0.8, 0.8), gap=0.6),
-            # C2012
-            ChipConfig('0805', BodyDimensions(2.0, 1.25, 1.25), gap=0.8),
-            # C3216
-            ChipConfig('1206', BodyDimensions(3.2, 1.6, 1.6), gap=1.8),
-            # C3225
-            ChipConfig('1210', BodyDimensions(3.2, 2.5, 2.5), gap=1.8),
-            # C4520
-            ChipConfig('1808', BodyDimensions(4.5, 2.0, 2.0), gap=2.8),
-            # C4532
-            ChipConfig('1812', BodyDimensions(4.5, 3.2, 3.2), gap=2.8),
-            # C4564
-            ChipConfig('1825', BodyDimensions(4.5, 6.4, 3.2), gap=2.8),
-            # C5750
-            ChipConfig('2220', BodyDimensions(5.7, 5.0, 2.8), gap=4.3),
-            # C9210
-            ChipConfig('3640', BodyDimensions(9.2, 10.16, 2.8), gap=6.4),
-        ],
-        generate_3d_models=generate_3d_models,
-        pkgcat='414f873f-4099-47fd-8526-bdd8419de581',
-        keywords='c,capacitor,chip,generic',
-        version='0.4',
-        create_date='2015-06-21T12:37:34Z',
-    )
-    # Molded polarized capacitors (CAPPM)
-    # Based on the table "Common Molded Body Tantalum Capacitors" in the IPC7351C draft
-    # and KEMET documentation: https://content.kemet.com/datasheets/KEM_T2005_T491.pdf
-    # (see Table 2: Land Dimensions / Courtyard)
-    generate_pkg(
-        library='LibrePCB_Base.lplib',
-        author='Danilo B.',
-        package_type='CAPPM',
-        name='{package_type}{length}X{width}X{height}L{lead_length}X{lead_width}',
-        description='Generic polarized molded inward-L capacitor (EIA {meta[eia]}).\n\n'
-                    'Length: {length}mm\nWidth: {width}mm\nMax height: {height}mm\n\n'
-                    'EIA Size Code: {meta[eia]}\n'
-                    'KEMET Case Code: {meta[kemet]}\nAVX Case Code: {meta[avx]}',
-        polarization=PolarizationConfig(
-            name_marked='+',
-            id_marked='p',
-            name_unmarked='-',
-            id_unmarked='n',
-        ),
-        configs=[
-            ChipConfig('', BodyDimensions(3.2, 1.6, 1.0, 0.8, 1.2), footprints={
-                'A': FootprintDimensions(2.20, 1.35, 0.62),
-                'B': FootprintDimensions(1.80, 1.23, 0.82),
-                'C': FootprintDimensions(1.42, 1.13, 0.98),
-            }, meta={'eia': '3216-10', 'kemet': 'I', 'avx': 'K'}),
-            ChipConfig('', BodyDimensions(3.2, 1.6, 1.2, 0.8, 1.2), footprints={
-                'A': FootprintDimensions(2.20, 1.35, 0.62),
-                'B': FootprintDimensions(1.80, 1.23, 0.82),
-                'C': FootprintDimensions(1.42, 1.13, 0.98),
-            }, meta={'eia': '3216-12', 'kemet': 'S', 'avx': 'S'}),
-            ChipConfig('', BodyDimensions(3.2, 1.6, 1.8, 0.8, 1.2), footprints={
-                'A': FootprintDimensions(2.20, 1.35, 0.62),
-                'B': FootprintDimensions(1.80, 1.23, 0.82),
-                'C': FootprintDimensions(1.42, 1.13, 0.98),
-            }, meta={'eia': '3216-18', 'kemet': 'A', 'avx': 'A'}),
-            ChipConfig('', BodyDimensions(3.5, 2.8, 1.2, 0.8, 2.2), footprints={
-                'A': FootprintDimensions(2.20, 2.35, 0.92),
-                'B': FootprintDimensions(1.80, 2.23, 1.12),
-                'C': FootprintDimensions(1.42, 2.13, 1.28),
-            }, meta={'eia': '3528-12', 'kemet': 'T', 'avx': 'T'}),
-            ChipConfig('', BodyDimensions(3.5, 2.8, 2.1, 0.8, 2.2), footprints={
-                'A': FootprintDimensions(2.21, 2.35, 0.92),
-                'B': FootprintDimensions(1.80, 2.23, 1.12),
-                'C': FootprintDimensions(1.42, 2.13, 1.28),
-            }, meta={'eia': '3528-21', 'kemet': 'B', 'avx': 'B'}),
-            ChipConfig('', BodyDimensions(6.0, 3.2, 1.5, 1.3, 2.2), footprints={
-                'A': FootprintDimensions(2.77, 2.35, 2.37),
-                'B': FootprintDimensions(2.37, 2.23, 2.57),
-                'C': FootprintDimensions(1.99, 2.13, 2.73),
-            }, meta={'eia': '6032-15', 'kemet': 'U', 'avx': 'W'}),
-            ChipConfig('', BodyDimensions(6.0, 3.2, 2.8, 1.3, 2.2), footprints={
-                'A': FootprintDimensions(2.77, 2.35, 2.37),
-                'B': FootprintDimensions(2.37, 2.23, 2.57),
-                'C': FootprintDimensions(1.99, 2.13, 2.73),
-            }, meta={'eia': '6032-28', 'kemet': 'C', 'avx': 'C'}),
-            ChipConfig('', BodyDimensions(7.3, 6.0, 3.8, 1.3, 4.1), footprints={
-                'A': FootprintDimensions(2.77, 4.25, 3.68),
-                'B': FootprintDimensions(2.37, 4.13, 3.87),
-                'C': FootprintDimensions(1.99, 4.03, 4.03),
-            }, meta={'eia': '7360-38', 'kemet': 'E', 'avx': 'V'}),
-            ChipConfig('', BodyDimensions(7.3, 4.3, 2.0, 1.3, 2.4), footprints={
-                'A': FootprintDimensions(2.77, 2.55, 3.67),
-                'B': FootprintDimensions(2.37, 2.43, 3.87),
-                'C': FootprintDimensions(1.99, 2.33, 4.03),
-            }, meta={'eia': '7343-20', 'kemet': 'V', 'avx': 'Y'}),
-            ChipConfig('', BodyDimensions(7.3, 4.3, 3.1, 1.3, 2.4), footprints={
-                'A': FootprintDimensions(2.77, 2.55, 3.67),
-                'B': FootprintDimensions(2.37, 2.43, 3.87),
-                'C': FootprintDimensions(1.99, 2.33, 4.03),
-            }, meta={'eia': '7343-31', 'kemet': 'D', 'avx': 'D'}),
-            ChipConfig('', BodyDimensions(7.3, 4.3, 4.3, 1.3, 2.4), footprints={
-                'A': FootprintDimensions(2.77, 2.55, 3.67),
-                'B': FootprintDimensions(2.37, 2.43, 3.87),
-                'C': FootprintDimensions(1.99, 2.33, 4.03),
-            }, meta={'eia': '7343-43', 'kemet': 'X', 'avx': 'E'}),
-        ],
-        generate_3d_models=generate_3d_models,
-        pkgcat='414f873f-4099-47fd-8526-bdd8419de581',
-        keywords='c,capacitor,j-lead,inward-l,molded,generic,kemet {meta[kemet]},avx {meta[avx]}',
-        version='0.2',
-        create_date='2019-11-18T21:56:00Z',
-    )
-    # Chip inductors (INDC)
-    generate_pkg(
-        library='LibrePCB_Base.lplib',
-        author='U. Bruhin',
-        package_type='INDC',
-        name='{package_type}{size_metric} ({size_imperial})',
-        description='Generic chip inductor {size_metric} (imperial {size_imperial}).\n\n'
-                    'Length: {length}mm\nWidth: {width}mm',
-        polarization=None,
-        configs=[
-            # Configuration: Values taken from Taiyo Yuden, TDK and Murata specs.
-            ChipConfig('01005', BodyDimensions(0.4, 0.2, 0.2), gap=0.15),
-            ChipConfig('0201', BodyDimensions(0.6, 0.3, 0.3), gap=0.3),
-            ChipConfig('0402', BodyDimensions(1.0, 0.5, 0.5), gap=0.5),
-            ChipConfig('0603', BodyDimensions(1.6, 0.8, 0.8), gap=0.7),
-            ChipConfig('0805', BodyDimensions(2.0, 1.25, 1.25), gap=1.0),
-            ChipConfig('1008', BodyDimensions(2.5, 2.0, 2.0), gap=1.3),
-            ChipConfig('1206', BodyDimensions(3.2, 1.6, 1.6), gap=2.0),
-            ChipConfig('1210', BodyDimensions(3.2, 2.5, 2.5), gap=2.0),
-        ],
-        generate_3d_models=generate_3d_models,
-        pkgcat='812c8e64-3a47-49d8-987f-2cfba377c8ae',
-        keywords='l,inductor,ferrite,bead,chip,generic',
-        version='0.1',
-        create_date='2023-11-05T09:15:41Z',
-    )
-    # Generic devices
-    generate_dev(
-        library='LibrePCB_Base.lplib',
-        author='Danilo B.',
-        name='Resistor {size_metric} ({size_imperial})',
-        description='Generic SMD resistor {size_metric} (imperial {size_imperial}).',
-        packages=[
-            # Metric, Imperial, Name
-            ('0402', '01005', 'RESC0402 (01005)'),
-            ('0603', '0201', 'RESC0603 (0201)'),
-            ('1005', '0402', 'RESC1005 (0402)'),
-            ('1608', '0603', 'RESC1608 (0603)'),
-            ('2012', '0805', 'RESC2012 (0805)'),
-            ('3216', '1206', 'RESC3216 (1206)'),
-            ('3225', '1210', 'RESC3225 (1210)'),
-            ('3246', '1218', 'RESC3246 (1218)'),
-            ('5025', '2010', 'RESC5025 (2010)'),
-            ('6432', '2512', 'RESC6432 (2512)'),
-            ('11569', '4527', 'RESJ11569 (4527)'),
-        ],
-        cmp='ef80cd5e-2689-47ee-8888-31d04fc99174',
-        cat='1039f038-20a6-4bfe-89c1-99f34fbb45bd',
-        signals=[
-            '3452d36e-1ce8-4b7c-8e5b-90c2e4929ed8',
-            'ad623f98-9e73-49c3-9404-f7cfa99d17cd',
-        ],
-        keywords='r,resistor,resistance,smd,smt',
-        version='0.3.1',
-        create_date='2019-01-29T19:47:42Z',
-    )
-    generate_dev(
-        library='LibrePCB_Base.lplib',
-        author='murray',
-        name='Capacitor {size_metric} ({size_imperial})',
-        description='Generic SMD capacitor {size_metric} (imperial {size_imperial}).',
-        packages=[
-            # Metric, Imperial, Name
-            ('0402', '01005', 'CAPC0402 (01005)'),
-            ('0603', '0201', 'CAPC0603 (0201)'),
-            ('1005', '0402', 'CAPC1005 (0402)'),
-            ('1608', '0603', 'CAPC1608 (0603)'),
-            ('2012', '0805', 'CAPC2012 (0805)'),
-            ('3216', '1206', 'CAPC3216 (1206)'),
-            ('3225', '1210', 'CAPC3225 (1210)'),
-            ('4520', '1808', 'CAPC4520 (1808)'),
-            ('4532', '1812', 'CAPC4532 (1812)'),
-            ('4564', '1825', 'CAPC4564 (1825)'),
-            ('5750', '2220', 'CAPC5750 (2220)'),
-            ('9210', '3640', 'CAPC9210 (3640)'),
-        ],
-        cmp='d167e0e3-6a92-4b76-b013-77b9c230e5f1',
-        cat='c011cc6b-b762-498e-8494-d1994f3043cf',
-        signals=[
-            '1c1c7abc-7b40-4f92-b533-f65604644db7',
-            '6d776f4d-2a7c-4128-a98a-dbb1dd861411',
-        ],
-        keywords='c,capacitor,capacitance,smd,smt',
-        version='0.3.1',
-        create_date='2015-08-13T20:22:31Z',
-    )
-    generate_dev(
-        library='LibrePCB_Base.lplib',
-        author='U. Bruhin',
-        name='Inductor {size_metric} ({size_imperial})',
-        description='Generic SMD inductor {size_metric} (imperial {size_imperial}).',
-        packages=[
-            # Metric, Imperial, Name
-            ('0402', '01005', 'INDC0402 (01005)'),
-            ('0603', '0201', 'INDC0603 (0201)'),
-            ('1005', '0402', 'INDC1005 (0402)'),
-            ('1608', '0603', 'INDC1608 (0603)'),
-            ('2012', '0805', 'INDC2012 (0805)'),
-            ('2520', '1008', 'INDC2520 (1008)'),
-            ('3216', '1206', 'INDC3216 (1206)'),
-            ('3225', '1210', 'INDC3225 (1210)'),
-        ],
-        cmp='506bd124-6062-400e-9078-b38bd7e1aaee',
-        cat='b3adfa1e-b878-44f6-902a-14ef3dad7a14',
-        signals=[
-            '777f11cd-9d4e-4b2b-aafa-7e7a836ff56e',
-            '5b36d330-6f19-4391-8f95-1c2f6a658286',
-        ],
-        keywords='l,inductor,ferrite,bead,smd,smt',
-        version='0.1',
-        create_date='2023-11-05T09:15:41Z',
-    )
-    save_cache(uuid_cache_file, uuid_cache)
+    try:
+        # Chip resistors (RESC)
+        generate_pkg(
+            library='LibrePCB_Base.lplib',
+            author='Danilo B.',
+            package_type='RESC',
+            name='{package_type}{size_metric} ({size_imperial})',
+            description='Generic chip resistor {size_metric} (imperial {size_imperial}).\n\n'
+                        'Length: {length}mm\nWidth: {width}mm',
+            polarization=None,
+            configs=[
+                # Configuration: Values taken from Samsung specs.
+                ChipConfig('01005', BodyDimensions(.4,   .2,  0.15), gap=0.2),   # noqa
+                ChipConfig('0201',  BodyDimensions(.6,   .3,  0.26), gap=0.28),  # noqa
+                ChipConfig('0402',  BodyDimensions(1.0,  .5,  0.35), gap=0.5),   # noqa
+                ChipConfig('0603',  BodyDimensions(1.6,  .8,  0.55), gap=0.8),   # noqa
+                ChipConfig('0805',  BodyDimensions(2.0, 1.25, 0.70), gap=1.2),   # noqa
+                ChipConfig('1206',  BodyDimensions(3.2, 1.6,  0.70), gap=1.8),   # noqa
+                ChipConfig('1210',  BodyDimensions(3.2, 2.55, 0.70), gap=1.8),   # noqa
+                ChipConfig('1218',  BodyDimensions(3.2, 4.6,  0.70), gap=1.8),   # noqa
+                ChipConfig('2010',  BodyDimensions(5.0, 2.5,  0.70), gap=3.3),   # noqa
+                ChipConfig('2512',  BodyDimensions(6.4, 3.2,  0.70), gap=4.6),   # noqa
+            ],
+            generate_3d_models=generate_3d_models,
+            pkgcat='a20f0330-06d3-4bc2-a1fa-f8577deb6770',
+            keywords='r,resistor,chip,generic',
+            version='0.4',
+            create_date='2018-12-19T00:08:03Z',
+        )
+        # J-Lead resistors (RESJ)
+        generate_pkg(
+            library='LibrePCB_Base.lplib',
+            author='Danilo B.',
+            package_type='RESJ',
+            name='{package_type}{size_metric} ({size_imperial})',
+            description='Generic J-lead resistor {size_metric} (imperial {size_imperial}).\n\n'
+                        'Length: {length}mm\nWidth: {width}mm',
+            polarization=None,
+            configs=[
+                ChipConfig('4527', BodyDimensions(11.56, 6.98, 5.84), gap=5.2),
+            ],
+            generate_3d_models=generate_3d_models,
+            pkgcat='a20f0330-06d3-4bc2-a1fa-f8577deb6770',
+            keywords='r,resistor,j-lead,generic',
+            version='0.4',
+            create_date='2019-01-04T23:06:17Z',
+        )
+        # Chip capacitors (CAPC)
+        generate_pkg(
+            library='LibrePCB_Base.lplib',
+            author='murray',
+            package_type='CAPC',
+            name='{package_type}{size_metric} ({size_imperial})',
+            description='Generic chip capacitor {size_metric} (imperial {size_imperial}).\n\n'
+                        'Length: {length}mm\nWidth: {width}mm',
+            polarization=None,
+            configs=[
+                # C0402
+                ChipConfig('01005', BodyDimensions(0.4, 0.2, 0.2), gap=0.15),
+                # C0603
+                ChipConfig('0201', BodyDimensions(0.6, 0.3, 0.3), gap=0.2),
+                # C1005
+                ChipConfig('0402', BodyDimensions(1.0, 0.5, 0.5), gap=0.4),
+                # C1608
+                ChipConfig('0603', BodyDimensions(1.6, 0.8, 0.8), gap=0.6),
+                # C2012
+                ChipConfig('0805', BodyDimensions(2.0, 1.25, 1.25), gap=0.8),
+                # C3216
+                ChipConfig('1206', BodyDimensions(3.2, 1.6, 1.6), gap=1.8),
+                # C3225
+                ChipConfig('1210', BodyDimensions(3.2, 2.5, 2.5), gap=1.8),
+                # C4520
+                ChipConfig('1808', BodyDimensions(4.5, 2.0, 2.0), gap=2.8),
+                # C4532
+                ChipConfig('1812', BodyDimensions(4.5, 3.2, 3.2), gap=2.8),
+                # C4564
+                ChipConfig('1825', BodyDimensions(4.5, 6.4, 3.2), gap=2.8),
+                # C5750
+                ChipConfig('2220', BodyDimensions(5.7, 5.0, 2.8), gap=4.3),
+                # C9210
+                ChipConfig('3640', BodyDimensions(9.2, 10.16, 2.8), gap=6.4),
+            ],
+            generate_3d_models=generate_3d_models,
+            pkgcat='414f873f-4099-47fd-8526-bdd8419de581',
+            keywords='c,capacitor,chip,generic',
+            version='0.4',
+            create_date='2015-06-21T12:37:34Z',
+        )
+        # Molded polarized capacitors (CAPPM)
+        # Based on the table "Common Molded Body Tantalum Capacitors" in the IPC7351C draft
+        # and KEMET documentation: https://content.kemet.com/datasheets/KEM_T2005_T491.pdf
+        # (see Table 2: Land Dimensions / Courtyard)
+        generate_pkg(
+            library='LibrePCB_Base.lplib',
+            author='Danilo B.',
+            package_type='CAPPM',
+            name='{package_type}{length}X{width}X{height}L{lead_length}X{lead_width}',
+            description='Generic polarized molded inward-L capacitor (EIA {meta[eia]}).\n\n'
+                        'Length: {length}mm\nWidth: {width}mm\nMax height: {height}mm\n\n'
+                        'EIA Size Code: {meta[eia]}\n'
+                        'KEMET Case Code: {meta[kemet]}\nAVX Case Code: {meta[avx]}',
+            polarization=PolarizationConfig(
+                name_marked='+',
+                id_marked='p',
+                name_unmarked='-',
+                id_unmarked='n',
+            ),
+            configs=[
+                ChipConfig('', BodyDimensions(3.2, 1.6, 1.0, 0.8, 1.2), footprints={
+                    'A': FootprintDimensions(2.20, 1.35, 0.62),
+                    'B': FootprintDimensions(1.80, 1.23, 0.82),
+                    'C': FootprintDimensions(1.42, 1.13, 0.98),
+                }, meta={'eia': '3216-10', 'kemet': 'I', 'avx': 'K'}),
+                ChipConfig('', BodyDimensions(3.2, 1.6, 1.2, 0.8, 1.2), footprints={
+                    'A': FootprintDimensions(2.20, 1.35, 0.62),
+                    'B': FootprintDimensions(1.80, 1.23, 0.82),
+                    'C': FootprintDimensions(1.42, 1.13, 0.98),
+                }, meta={'eia': '3216-12', 'kemet': 'S', 'avx': 'S'}),
+                ChipConfig('', BodyDimensions(3.2, 1.6, 1.8, 0.8, 1.2), footprints={
+                    'A': FootprintDimensions(2.20, 1.35, 0.62),
+                    'B': FootprintDimensions(1.80, 1.23, 0.82),
+                    'C': FootprintDimensions(1.42, 1.13, 0.98),
+                }, meta={'eia': '3216-18', 'kemet': 'A', 'avx': 'A'}),
+                ChipConfig('', BodyDimensions(3.5, 2.8, 1.2, 0.8, 2.2), footprints={
+                    'A': FootprintDimensions(2.20, 2.35, 0.92),
+                    'B': FootprintDimensions(1.80, 2.23, 1.12),
+                    'C': FootprintDimensions(1.42, 2.13, 1.28),
+                }, meta={'eia': '3528-12', 'kemet': 'T', 'avx': 'T'}),
+                ChipConfig('', BodyDimensions(3.5, 2.8, 2.1, 0.8, 2.2), footprints={
+                    'A': FootprintDimensions(2.21, 2.35, 0.92),
+                    'B': FootprintDimensions(1.80, 2.23, 1.12),
+                    'C': FootprintDimensions(1.42, 2.13, 1.28),
+                }, meta={'eia': '3528-21', 'kemet': 'B', 'avx': 'B'}),
+                ChipConfig('', BodyDimensions(6.0, 3.2, 1.5, 1.3, 2.2), footprints={
+                    'A': FootprintDimensions(2.77, 2.35, 2.37),
+                    'B': FootprintDimensions(2.37, 2.23, 2.57),
+                    'C': FootprintDimensions(1.99, 2.13, 2.73),
+                }, meta={'eia': '6032-15', 'kemet': 'U', 'avx': 'W'}),
+                ChipConfig('', BodyDimensions(6.0, 3.2, 2.8, 1.3, 2.2), footprints={
+                    'A': FootprintDimensions(2.77, 2.35, 2.37),
+                    'B': FootprintDimensions(2.37, 2.23, 2.57),
+                    'C': FootprintDimensions(1.99, 2.13, 2.73),
+                }, meta={'eia': '6032-28', 'kemet': 'C', 'avx': 'C'}),
+                ChipConfig('', BodyDimensions(7.3, 6.0, 3.8, 1.3, 4.1), footprints={
+                    'A': FootprintDimensions(2.77, 4.25, 3.68),
+                    'B': FootprintDimensions(2.37, 4.13, 3.87),
+                    'C': FootprintDimensions(1.99, 4.03, 4.03),
+                }, meta={'eia': '7360-38', 'kemet': 'E', 'avx': 'V'}),
+                ChipConfig('', BodyDimensions(7.3, 4.3, 2.0, 1.3, 2.4), footprints={
+                    'A': FootprintDimensions(2.77, 2.55, 3.67),
+                    'B': FootprintDimensions(2.37, 2.43, 3.87),
+                    'C': FootprintDimensions(1.99, 2.33, 4.03),
+                }, meta={'eia': '7343-20', 'kemet': 'V', 'avx': 'Y'}),
+                ChipConfig('', BodyDimensions(7.3, 4.3, 3.1, 1.3, 2.4), footprints={
+                    'A': FootprintDimensions(2.77, 2.55, 3.67),
+                    'B': FootprintDimensions(2.37, 2.43, 3.87),
+                    'C': FootprintDimensions(1.99, 2.33, 4.03),
+                }, meta={'eia': '7343-31', 'kemet': 'D', 'avx': 'D'}),
+                ChipConfig('', BodyDimensions(7.3, 4.3, 4.3, 1.3, 2.4), footprints={
+                    'A': FootprintDimensions(2.77, 2.55, 3.67),
+                    'B': FootprintDimensions(2.37, 2.43, 3.87),
+                    'C': FootprintDimensions(1.99, 2.33, 4.03),
+                }, meta={'eia': '7343-43', 'kemet': 'X', 'avx': 'E'}),
+            ],
+            generate_3d_models=generate_3d_models,
+            pkgcat='414f873f-4099-47fd-8526-bdd8419de581',
+            keywords='c,capacitor,j-lead,inward-l,molded,generic,kemet {meta[kemet]},avx {meta[avx]}',
+            version='0.2',
+            create_date='2019-11-18T21:56:00Z',
+        )
+        # Chip inductors (INDC)
+        generate_pkg(
+            library='LibrePCB_Base.lplib',
+            author='U. Bruhin',
+            package_type='INDC',
+            name='{package_type}{size_metric} ({size_imperial})',
+            description='Generic chip inductor {size_metric} (imperial {size_imperial}).\n\n'
+                        'Length: {length}mm\nWidth: {width}mm',
+            polarization=None,
+            configs=[
+                # Configuration: Values taken from Taiyo Yuden, TDK and Murata specs.
+                ChipConfig('01005', BodyDimensions(0.4, 0.2, 0.2), gap=0.15),
+                ChipConfig('0201', BodyDimensions(0.6, 0.3, 0.3), gap=0.3),
+                ChipConfig('0402', BodyDimensions(1.0, 0.5, 0.5), gap=0.5),
+                ChipConfig('0603', BodyDimensions(1.6, 0.8, 0.8), gap=0.7),
+                ChipConfig('0805', BodyDimensions(2.0, 1.25, 1.25), gap=1.0),
+                ChipConfig('1008', BodyDimensions(2.5, 2.0, 2.0), gap=1.3),
+                ChipConfig('1206', BodyDimensions(3.2, 1.6, 1.6), gap=2.0),
+                ChipConfig('1210', BodyDimensions(3.2, 2.5, 2.5), gap=2.0),
+            ],
+            generate_3d_models=generate_3d_models,
+            pkgcat='812c8e64-3a47-49d8-987f-2cfba377c8ae',
+            keywords='l,inductor,ferrite,bead,chip,generic',
+            version='0.1',
+            create_date='2023-11-05T09:15:41Z',
+        )
+        # Generic devices
+        generate_dev(
+            library='LibrePCB_Base.lplib',
+            author='Danilo B.',
+            name='Resistor {size_metric} ({size_imperial})',
+            description='Generic SMD resistor {size_metric} (imperial {size_imperial}).',
+            packages=[
+                # Metric, Imperial, Name
+                ('0402', '01005', 'RESC0402 (01005)'),
+                ('0603', '0201', 'RESC0603 (0201)'),
+                ('1005', '0402', 'RESC1005 (0402)'),
+                ('1608', '0603', 'RESC1608 (0603)'),
+                ('2012', '0805', 'RESC2012 (0805)'),
+                ('3216', '1206', 'RESC3216 (1206)'),
+                ('3225', '1210', 'RESC3225 (1210)'),
+                ('3246', '1218', 'RESC3246 (1218)'),
+                ('5025', '2010', 'RESC5025 (2010)'),
+                ('6432', '2512', 'RESC6432 (2512)'),
+                ('11569', '4527', 'RESJ11569 (4527)'),
+            ],
+            cmp='ef80cd5e-2689-47ee-8888-31d04fc99174',
+            cat='1039f038-20a6-4bfe-89c1-99f34fbb45bd',
+            signals=[
+                '3452d36e-1ce8-4b7c-8e5b-90c2e4929ed8',
+                'ad623f98-9e73-49c3-9404-f7cfa99d17cd',
+            ],
+            keywords='r,resistor,resistance,smd,smt',
+            version='0.3.1',
+            create_date='2019-01-29T19:47:42Z',
+        )
+        generate_dev(
+            library='LibrePCB_Base.lplib',
+            author='murray',
+            name='Capacitor {size_metric} ({size_imperial})',
+            description='Generic SMD capacitor {size_metric} (imperial {size_imperial}).',
+            packages=[
+                # Metric, Imperial, Name
+                ('0402', '01005', 'CAPC0402 (01005)'),
+                ('0603', '0201', 'CAPC0603 (0201)'),
+                ('1005', '0402', 'CAPC1005 (0402)'),
+                ('1608', '0603', 'CAPC1608 (0603)'),
+                ('2012', '0805', 'CAPC2012 (0805)'),
+                ('3216', '1206', 'CAPC3216 (1206)'),
+                ('3225', '1210', 'CAPC3225 (1210)'),
+                ('4520', '1808', 'CAPC4520 (1808)'),
+                ('4532', '1812', 'CAPC4532 (1812)'),
+                ('4564', '1825', 'CAPC4564 (1825)'),
+                ('5750', '2220', 'CAPC5750 (2220)'),
+                ('9210', '3640', 'CAPC9210 (3640)'),
+            ],
+            cmp='d167e0e3-6a92-4b76-b013-77b9c230e5f1',
+            cat='c011cc6b-b762-498e-8494-d1994f3043cf',
+            signals=[
+                '1c1c7abc-7b40-4f92-b533-f65604644db7',
+                '6d776f4d-2a7c-4128-a98a-dbb1dd861411',
+            ],
+            keywords='c,capacitor,capacitance,smd,smt',
+            version='0.3.1',
+            create_date='2015-08-13T20:22:31Z',
+        )
+        generate_dev(
+            library='LibrePCB_Base.lplib',
+            author='U. Bruhin',
+            name='Inductor {size_metric} ({size_imperial})',
+            description='Generic SMD inductor {size_metric} (imperial {size_imperial}).',
+            packages=[
+                # Metric, Imperial, Name
+                ('0402', '01005', 'INDC0402 (01005)'),
+                ('0603', '0201', 'INDC0603 (0201)'),
+                ('1005', '0402', 'INDC1005 (0402)'),
+                ('1608', '0603', 'INDC1608 (0603)'),
+                ('2012', '0805', 'INDC2012 (0805)'),
+                ('2520', '1008', 'INDC2520 (1008)'),
+                ('3216', '1206', 'INDC3216 (1206)'),
+                ('3225', '1210', 'INDC3225 (1210)'),
+            ],
+            cmp='506bd124-6062-400e-9078-b38bd7e1aaee',
+            cat='b3adfa1e-b878-44f6-902a-14ef3dad7a14',
+            signals=[
+                '777f11cd-9d4e-4b2b-aafa-7e7a836ff56e',
+                '5b36d330-6f19-4391-8f95-1c2f6a658286',
+            ],
+            keywords='l,inductor,ferrite,bead,smd,smt',
+            version='0.1',
+            create_date='2023-11-05T09:15:41Z',
+        )
+    finally:
+        save_cache(uuid_cache_file, uuid_cache)
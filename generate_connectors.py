@@ -14,13 +14,16 @@ Generate pin header and socket packages.
 """
 import math
 import sys
-from functools import partial
-from os import makedirs, path
+from functools import lru_cache, partial
+from os import path
 from uuid import uuid4
 
-from typing import Callable, Iterable, Optional, Tuple
+from typing import Any, Callable, Iterable, List, Optional, Tuple
 
-from common import init_cache, now, save_cache
+from common import (
+    get_sources_mtime, init_cache, is_up_to_date, now, save_cache, serialize_parallel, shared_process_pool,
+    write_element_files
+)
 from entities.common import (
     Align, Angle, Author, Category, Circle, Created, Deprecated, Description, Diameter, Fill, GeneratedBy, GrabArea,
     Height, Keywords, Layer, Length, Name, Polygon, Position, Position3D, Rotation, Rotation3D, Text, Value, Version,
@@ -49,6 +52,37 @@ pkg_text_height = 1.0
 sym_text_height = 2.54
 courtyard_offset = 0.5  # Rather large because packages are generic (i.e. not exact)
 
+# Frequently used entity values. They are never modified, thus a single
+# instance of each is shared by all elements.
+zero_angle = Angle(0.0)
+zero_rotation = Rotation(0.0)
+zero_width = Width(0.0)
+fill_false = Fill(False)
+grab_area_false = GrabArea(False)
+grab_area_true = GrabArea(True)
+mirror_false = Mirror(False)
+auto_rotate_true = AutoRotate(True)
+
+
+# Device file template for str.format(), the sorted pad-signal mappings are
+# inserted as a whole. The module constants are already filled in here, so
+# only the per-device fields are left as placeholders.
+device_template = f"""(librepcb_device {{uuid}}
+ (name "{{name}} {{rows}}x{{per_row:02d}} ⌀{{drill}}mm")
+ (description "A {{rows}}x{{per_row}} {{name_lower}} with {spacing}mm pin spacing and {{drill}}mm drill holes.\\n\\nGenerated with {generator}")
+ (keywords "connector, {{rows}}x{{per_row}}, d{{drill}}, {{keywords}}")
+ (author "{{author}}")
+ (version "0.1.1")
+ (created {{created}})
+ (deprecated false)
+ (generated_by "")
+ (category {{category}})
+ (component {{component}})
+ (package {{package}})
+{{signalmappings}} (approved no_parts)
+)
+"""
+
 
 KIND_HEADER = 'pinheader'
 KIND_SOCKET = 'pinsocket'
@@ -56,6 +90,13 @@ KIND_WIRE_CONNECTOR = 'wireconnector'
 KIND_SCREW_TERMINAL = 'screwterminal'
 
 
+# If enabled (with "--incremental"), library elements whose files are newer
+# than all sources of this generator are not generated again. The UUID cache
+# is not a source since existing UUIDs never change.
+incremental = False
+sources_mtime = 0.0  # Only determined if enabled
+
+
 # Initialize UUID cache
 uuid_cache_file = 'uuid_cache_connectors.csv'
 uuid_cache = init_cache(uuid_cache_file)
@@ -75,12 +116,35 @@ def uuid(category: str, kind: str, variant: str, identifier: str) -> str:
         identifier:
             For example 'pad-1' or 'pin-13'.
     """
-    key = '{}-{}-{}-{}'.format(category, kind, variant, identifier).lower().replace(' ', '~')
-    if key not in uuid_cache:
-        uuid_cache[key] = str(uuid4())
-    return uuid_cache[key]
+    key = f'{category}-{kind}-{variant}-{identifier}'.lower().replace(' ', '~')
+    value = uuid_cache.get(key)
+    if value is None:
+        value = uuid_cache[key] = str(uuid4())
+    return value
+
+
+def uuid_factory(category: str, kind: str, variant: str) -> Callable[[str], str]:
+    """
+    Return a function which returns the uuid for an identifier of the
+    specified library element, like `uuid`.
+
+    The cache key prefix is built only once, thus this is preferred over
+    `uuid` when many uuids of the same element are needed.
+    """
+    prefix = f'{category}-{kind}-{variant}-'.lower().replace(' ', '~')
+    cache = uuid_cache  # Local reference avoids global lookups in the closure
 
+    def _uuid(identifier: str) -> str:
+        key = prefix + identifier.lower().replace(' ', '~')
+        value = cache.get(key)
+        if value is None:
+            value = cache[key] = str(uuid4())
+        return value
 
+    return _uuid
+
+
+@lru_cache(maxsize=None)
 def get_y(pin_number: int, pin_count: int, rows: int, spacing: float, grid_align: bool) -> float:
     """
     Return the y coordinate of the specified pin. Keep the pins grid aligned, if desired.
@@ -93,17 +157,51 @@ def get_y(pin_number: int, pin_count: int, rows: int, spacing: float, grid_align
     pn = (pin_number + (rows - 1)) // rows
     pc = pin_count // rows
 
-    # Calculate y
+    # Distance to the middle pin, in units of half the spacing
     if grid_align:
         mid = float((pc + 1) // 2)
+        half_steps = (pc + 1) // 2 * 2 - 2 * pn
     else:
         mid = (pc + 1) / 2
+        half_steps = pc + 1 - 2 * pn
+
+    # If the spacing is a multiple of 0.01 and so is the result, calculate it
+    # with integer arithmetic, which is exact and doesn't need to be rounded
+    spacing_cent = int(spacing * 100)
+    if spacing_cent == spacing * 100 and half_steps * spacing_cent % 2 == 0:
+        return half_steps * spacing_cent // 2 / 100
+
+    # Calculate y
     y = -round(pn * spacing - mid * spacing, 2)
     if y == -0.0:  # Returns true for 0.0 too, but that doesn't matter
         return 0.0
     return y
 
 
+@lru_cache(maxsize=None)
+def get_ys(pin_count: int, rows: int, spacing: float, grid_align: bool) -> Tuple[float, ...]:
+    """
+    Return the y coordinates of all pins, see `get_y`. Index 0 is pin 1.
+    """
+    return tuple(get_y(p, pin_count, rows, spacing, grid_align) for p in range(1, pin_count + 1))
+
+
+@lru_cache(maxsize=None)
+def get_xs(pin_count: int, rows: int, spacing: float) -> Tuple[float, ...]:
+    """
+    Return the x coordinates of all pins. Index 0 is pin 1.
+
+    With two rows, odd pins are on the left and even pins on the right.
+    """
+    if rows == 1:
+        return (0.0,) * pin_count
+    elif rows == 2:
+        return tuple(spacing / 2 if (p % rows == 0) else -spacing / 2 for p in range(1, pin_count + 1))
+    else:
+        raise RuntimeError(f'Invalid row count: {rows}')
+
+
+@lru_cache(maxsize=1024)
 def get_rectangle_bounds(
     pin_count: int,
     rows: int,
@@ -145,27 +243,72 @@ def generate_pkg(
 ) -> None:
     category = 'pkg'
     assert rows in [1, 2]
+    progress: List[str] = []  # Written to stdout in one go at the end
+    packages: List[Package] = []
+    # Metadata which is the same for all elements (shared, never modified)
+    created = Created(create_date or now())
+    author_value = Author(author)
+    version_value = Version(version)
+    deprecated = Deprecated(False)
+    generated_by = GeneratedBy('')
+    categories = (Category(pkgcat),)
+    models_3d: List[Tuple[str, str, str, str, int, int, float]] = []  # Arguments for generate_3d_model
     for i in range(min_pads, max_pads + 1, rows):
-        for drill in pad_drills:
-            per_row = i // rows
-            top_offset = spacing / 2
+        per_row = i // rows
 
-            variant = f'{rows}x{per_row}-D{drill:.1f}'
+        # Pad coordinates and label bounds only depend on the pin count, not
+        # on the drill
+        xs = get_xs(i, rows, spacing)
+        ys = get_ys(i, rows, spacing, False)
+        # Per-pad attributes for the pad loop below (pin 1 has square corners)
+        pad_positions = [Position(x, y) for (x, y) in zip(xs, ys)]
+        pad_radii = [ShapeRadius(0.0)] + [ShapeRadius(1.0)] * (i - 1)
+        pad_names = [Name(str(p)) for p in range(1, i + 1)]
+        label_y_max, label_y_min = get_rectangle_bounds(i, rows, spacing, spacing / 2 + 1.27, False)
+
+        # Package outline and courtyard vertices (shared by all drills, the
+        # vertices are never modified)
+        dx = (width + (rows - 1) * spacing) / 2
+        dy = (width + (per_row - 1) * spacing) / 2
+        outline_vertices = [
+            Vertex(Position(-dx, dy), zero_angle),
+            Vertex(Position(dx, dy), zero_angle),
+            Vertex(Position(dx, -dy), zero_angle),
+            Vertex(Position(-dx, -dy), zero_angle),
+        ]
+        dx += courtyard_offset
+        dy += courtyard_offset
+        courtyard_vertices = [
+            Vertex(Position(-dx, dy), zero_angle),
+            Vertex(Position(dx, dy), zero_angle),
+            Vertex(Position(dx, -dy), zero_angle),
+            Vertex(Position(-dx, -dy), zero_angle),
+        ]
 
-            def _uuid(identifier: str) -> str:
-                return uuid(category, kind, variant, identifier)
+        for drill in pad_drills:
+            drill_str = f'{drill:.1f}'  # Formatted once, used in several strings
+            variant = f'{rows}x{per_row}-D{drill_str}'
 
+            _uuid = uuid_factory(category, kind, variant)
             uuid_pkg = _uuid('pkg')
-            uuid_pads = [_uuid('pad-{}'.format(p)) for p in range(i)]
+            if incremental:
+                pkg_dir_path = path.join('out', library, category, uuid_pkg)
+                output_files = [path.join(pkg_dir_path, 'package.lp')]
+                if generate_3d_model is not None and generate_3d_models:
+                    output_files.append(path.join(pkg_dir_path, f"{_uuid('3d')}.step"))
+                if all(is_up_to_date(f, sources_mtime) for f in output_files):
+                    progress.append(f'{rows}x{per_row:02d} {kind} ⌀{drill_str}mm: Package {uuid_pkg} is up to date\n')
+                    continue
+            uuid_pads = [_uuid(f'pad-{p}') for p in range(i)]
             uuid_footprint = _uuid('footprint-default')
             uuid_outline = _uuid('polygon-outline')
             uuid_courtyard = _uuid('polygon-courtyard')
             uuid_text_name = _uuid('text-name')
             uuid_text_value = _uuid('text-value')
 
-            full_name = f'{name} {rows}x{per_row:02d} ⌀{drill:.1f}mm'
+            full_name = f'{name} {rows}x{per_row:02d} ⌀{drill_str}mm'
             full_description = f'A generic {rows}x{per_row} {name_lower} ' + \
-                               f'with {spacing}mm pin spacing and {drill:.1f}mm drill holes.' \
+                               f'with {spacing}mm pin spacing and {drill_str}mm drill holes.' \
                                f'\n\nGenerated with {generator}'
 
             # Define package
@@ -173,20 +316,16 @@ def generate_pkg(
                 uuid=uuid_pkg,
                 name=Name(full_name),
                 description=Description(full_description),
-                keywords=Keywords(f'connector, {rows}x{per_row}, d{drill:.1f}, {keywords}'),
-                author=Author(author),
-                version=Version(version),
-                created=Created(create_date or now()),
-                deprecated=Deprecated(False),
-                generated_by=GeneratedBy(''),
-                categories=[Category(pkgcat)],
+                keywords=Keywords(f'connector, {rows}x{per_row}, d{drill_str}, {keywords}'),
+                author=author_value,
+                version=version_value,
+                created=created,
+                deprecated=deprecated,
+                generated_by=generated_by,
+                categories=categories,
                 assembly_type=assembly_type,
             )
 
-            # Add pads to package
-            for j in range(1, i + 1):
-                package.add_pad(PackagePad(uuid_pads[j - 1], Name(str(j))))
-
             # Add footprint
             footprint = Footprint(
                 uuid=uuid_footprint,
@@ -197,33 +336,35 @@ def generate_pkg(
             )
             package.add_footprint(footprint)
 
-            # Add pads to footprint
-            for p in range(1, i + 1):
-                pad_uuid = uuid_pads[p - 1]
-                if rows == 1:
-                    x = 0.0
-                elif rows == 2:
-                    x = spacing / 2 if (p % rows == 0) else -spacing / 2
-                y = get_y(p, i, rows, spacing, False)
-                corner_radius = 0.0 if p == 1 else 1.0
-                footprint.add_pad(FootprintPad(
+            # Add pads to package and footprint. The attributes which are the
+            # same for all pads are only created once and shared, they are
+            # never modified.
+            pad_size_ = Size(pad_size[0], pad_size[1])
+            pad_clearance = CopperClearance(0.0)
+            pad_drill = DrillDiameter(drill)
+            pad_hole_vertices = [Vertex(Position(0.0, 0.0), zero_angle)]
+            add_package_pad = package.add_pad
+            add_pad = footprint.add_pad
+            for (pad_uuid, pad_name, position, radius) in zip(uuid_pads, pad_names, pad_positions, pad_radii):
+                add_package_pad(PackagePad(pad_uuid, pad_name))
+                add_pad(FootprintPad(
                     uuid=pad_uuid,
                     side=ComponentSide.TOP,
                     shape=Shape.ROUNDED_RECT,
-                    position=Position(x, y),
-                    rotation=Rotation(0),
-                    size=Size(pad_size[0], pad_size[1]),
-                    radius=ShapeRadius(corner_radius),
+                    position=position,
+                    rotation=zero_rotation,
+                    size=pad_size_,
+                    radius=radius,
                     stop_mask=StopMaskConfig.AUTO,
                     solder_paste=SolderPasteConfig.OFF,
-                    copper_clearance=CopperClearance(0.0),
+                    copper_clearance=pad_clearance,
                     function=PadFunction.STANDARD_PAD,
                     package_pad=PackagePadUuid(pad_uuid),
                     holes=[
                         PadHole(
                             pad_uuid,
-                            DrillDiameter(drill),
-                            [Vertex(Position(0.0, 0.0), Angle(0.0))],
+                            pad_drill,
+                            pad_hole_vertices,
                         )
                     ],
                 ))
@@ -233,41 +374,26 @@ def generate_pkg(
             footprint.add_polygon(silkscreen)
 
             # Package outline
-            dx = (width + (rows - 1) * spacing) / 2
-            dy = (width + (per_row - 1) * spacing) / 2
             footprint.add_polygon(Polygon(
                 uuid=uuid_outline,
                 layer=Layer('top_package_outlines'),
-                width=Width(0),
-                fill=Fill(False),
-                grab_area=GrabArea(False),
-                vertices=[
-                    Vertex(Position(-dx, dy), Angle(0)),
-                    Vertex(Position(dx, dy), Angle(0)),
-                    Vertex(Position(dx, -dy), Angle(0)),
-                    Vertex(Position(-dx, -dy), Angle(0)),
-                ],
+                width=zero_width,
+                fill=fill_false,
+                grab_area=grab_area_false,
+                vertices=outline_vertices,
             ))
 
             # Courtyard
-            dx += courtyard_offset
-            dy += courtyard_offset
             footprint.add_polygon(Polygon(
                 uuid=uuid_courtyard,
                 layer=Layer('top_courtyard'),
-                width=Width(0),
-                fill=Fill(False),
-                grab_area=GrabArea(False),
-                vertices=[
-                    Vertex(Position(-dx, dy), Angle(0)),
-                    Vertex(Position(dx, dy), Angle(0)),
-                    Vertex(Position(dx, -dy), Angle(0)),
-                    Vertex(Position(-dx, -dy), Angle(0)),
-                ],
+                width=zero_width,
+                fill=fill_false,
+                grab_area=grab_area_false,
+                vertices=courtyard_vertices,
             ))
 
             # Labels
-            y_max, y_min = get_rectangle_bounds(i, rows, spacing, top_offset + 1.27, False)
             footprint.add_text(StrokeText(
                 uuid=uuid_text_name,
                 layer=Layer('top_names'),
@@ -276,10 +402,10 @@ def generate_pkg(
                 letter_spacing=LetterSpacing.AUTO,
                 line_spacing=LineSpacing.AUTO,
                 align=Align('center bottom'),
-                position=Position(0.0, y_max),
-                rotation=Rotation(0.0),
-                auto_rotate=AutoRotate(True),
-                mirror=Mirror(False),
+                position=Position(0.0, label_y_max),
+                rotation=zero_rotation,
+                auto_rotate=auto_rotate_true,
+                mirror=mirror_false,
                 value=Value('{{NAME}}'),
             ))
             footprint.add_text(StrokeText(
@@ -290,10 +416,10 @@ def generate_pkg(
                 letter_spacing=LetterSpacing.AUTO,
                 line_spacing=LineSpacing.AUTO,
                 align=Align('center top'),
-                position=Position(0.0, y_min),
-                rotation=Rotation(0.0),
-                auto_rotate=AutoRotate(True),
-                mirror=Mirror(False),
+                position=Position(0.0, label_y_min),
+                rotation=zero_rotation,
+                auto_rotate=auto_rotate_true,
+                mirror=mirror_false,
                 value=Value('{{VALUE}}'),
             ))
 
@@ -301,7 +427,7 @@ def generate_pkg(
             if generate_3d_model is not None:
                 uuid_3d = _uuid('3d')
                 if generate_3d_models:
-                    generate_3d_model(library, full_name, uuid_pkg, uuid_3d, rows, i, drill)
+                    models_3d.append((library, full_name, uuid_pkg, uuid_3d, rows, i, drill))
                 package.add_3d_model(Package3DModel(uuid_3d, Name(full_name)))
                 for footprint in package.footprints:
                     footprint.add_3d_model(Footprint3DModel(uuid_3d))
@@ -312,9 +438,34 @@ def generate_pkg(
                 # some pads, but this is intended for soldered wire connectors.
                 package.add_approval("(approved suspicious_assembly_type)")
 
-            package.serialize(path.join('out', library, category))
+            packages.append(package)
+
+            progress.append(f'{rows}x{per_row:02d} {kind} ⌀{drill_str}mm: Wrote package {uuid_pkg}\n')
 
-            print('{}x{:02d} {} ⌀{:.1f}mm: Wrote package {}'.format(rows, per_row, kind, drill, uuid_pkg))
+    serialize_parallel(packages, path.join('out', library, category))
+
+    # The STEP export of cadquery is single threaded and by far the slowest
+    # part, thus generate the 3D models in parallel
+    if generate_3d_model is not None and len(models_3d) > 0:
+        executor = shared_process_pool()
+        futures = [executor.submit(generate_3d_model, *args) for args in models_3d]
+        for future in futures:
+            future.result()  # Re-raise exceptions of the workers
+    sys.stdout.write(''.join(progress))
+
+
+@lru_cache(maxsize=None)
+def get_silkscreen_female_bounds(pin_count: int, rows: int) -> Tuple[float, float, float]:
+    """
+    Return (x, y_max, y_min) of the female pin socket silkscreen rectangle.
+
+    Like `get_silkscreen_male_coords`, this only depends on the shape and is
+    shared between all drill variants.
+    """
+    x = 1.27 * rows + line_width / 2
+    top_offset = spacing / 2 + line_width / 2
+    y_max, y_min = get_rectangle_bounds(pin_count, rows, spacing, top_offset, False)
+    return (x, y_max, y_min)
 
 
 def generate_silkscreen_female(
@@ -326,27 +477,80 @@ def generate_silkscreen_female(
 ) -> Polygon:
     uuid_polygon = uuid(category, kind, variant, 'polygon-contour')
 
-    x = 1.27 * rows + line_width / 2
-    top_offset = spacing / 2 + line_width / 2
-
-    y_max, y_min = get_rectangle_bounds(pin_count, rows, spacing, top_offset, False)
+    x, y_max, y_min = get_silkscreen_female_bounds(pin_count, rows)
 
+    # The polygon is closed, i.e. starts and ends at the same vertex
+    start = Vertex(Position(-x, y_max), zero_angle)
     return Polygon(
         uuid=uuid_polygon,
         layer=Layer('top_legend'),
         width=Width(line_width),
-        fill=Fill(False),
-        grab_area=GrabArea(True),
+        fill=fill_false,
+        grab_area=grab_area_true,
         vertices=[
-            Vertex(Position(-x, y_max), Angle(0)),
-            Vertex(Position(x, y_max), Angle(0)),
-            Vertex(Position(x, y_min), Angle(0)),
-            Vertex(Position(-x, y_min), Angle(0)),
-            Vertex(Position(-x, y_max), Angle(0)),
+            start,
+            Vertex(Position(x, y_max), zero_angle),
+            Vertex(Position(x, y_min), zero_angle),
+            Vertex(Position(-x, y_min), zero_angle),
+            start,
         ],
     )
 
 
+@lru_cache(maxsize=None)
+def get_silkscreen_male_coords(per_row: int, rows: int) -> Tuple[Tuple[float, float], ...]:
+    """
+    Return the (x, y) vertex coordinates of the male pin header silkscreen.
+
+    The coordinates only depend on the shape, not on the pad drill, so they
+    are calculated once and shared between all drill variants.
+    """
+    x_outer = 1.27 * rows + line_width / 2
+    x_inner = x_outer - 0.27
+    offset = line_width / 2
+
+    # Y coordinate as well as top/bottom offset of every pin, needed on both sweeps
+    pins = [
+        (
+            y,
+            offset if pin == 1 else 0,
+            offset if pin == per_row else 0,
+        )
+        for pin, y in enumerate(get_ys(per_row, 1, spacing, False), start=1)
+    ]
+    top_y = pins[0][0] + spacing / 2 + offset
+
+    # Start in top right corner, go around the pads clockwise
+    return (
+        # Down on the right
+        *(coord for (y, top_offset, bot_offset) in pins for coord in (
+            (x_outer, y + 1 + top_offset),
+            (x_outer, y - 1 - bot_offset),
+            (x_inner, y - 1.27 - bot_offset),
+        )),
+        # Up on the left
+        *(coord for (y, top_offset, bot_offset) in reversed(pins) for coord in (
+            (-x_inner, y - 1.27 - bot_offset),
+            (-x_outer, y - 1 - bot_offset),
+            (-x_outer, y + 1 + top_offset),
+        )),
+        # Back to start
+        (-x_inner, top_y),
+        (x_inner, top_y),
+        (x_outer, top_y - 0.27),
+    )
+
+
+@lru_cache(maxsize=None)
+def get_silkscreen_male_vertices(per_row: int, rows: int) -> List[Vertex]:
+    """
+    Return the vertices of the male pin header silkscreen.
+
+    The list is shared between all drill variants and must not be modified.
+    """
+    return [Vertex(Position(x, y), zero_angle) for (x, y) in get_silkscreen_male_coords(per_row, rows)]
+
+
 def generate_silkscreen_male(
     category: str,
     kind: str,
@@ -356,61 +560,27 @@ def generate_silkscreen_male(
 ) -> Polygon:
     uuid_polygon = uuid(category, kind, variant, 'polygon-contour')
 
-    per_row = pin_count // rows
-    x_outer = 1.27 * rows + line_width / 2
-    x_inner = x_outer - 0.27
-    offset = line_width / 2
-
-    polygon = Polygon(
+    return Polygon(
         uuid=uuid_polygon,
         layer=Layer('top_legend'),
         width=Width(line_width),
-        fill=Fill(False),
-        grab_area=GrabArea(True),
+        fill=fill_false,
+        grab_area=grab_area_true,
+        vertices=get_silkscreen_male_vertices(pin_count // rows, rows),
     )
 
-    # Start in top right corner, go around the pads clockwise
-    # Down on the right
-    for pin in range(1, per_row + 1):
-        y = get_y(pin, per_row, 1, spacing, False)
-        top_offset = offset if pin == 1 else 0
-        bot_offset = offset if pin == per_row else 0
-        polygon.add_vertex(Vertex(Position(x_outer, y + 1 + top_offset), Angle(0)))
-        polygon.add_vertex(Vertex(Position(x_outer, y - 1 - bot_offset), Angle(0)))
-        polygon.add_vertex(Vertex(Position(x_inner, y - 1.27 - bot_offset), Angle(0)))
-    # Up on the left
-    for pin in range(per_row, 0, -1):
-        y = get_y(pin, per_row, 1, spacing, False)
-        top_offset = offset if pin == 1 else 0
-        bot_offset = offset if pin == per_row else 0
-        polygon.add_vertex(Vertex(Position(-x_inner, y - 1.27 - bot_offset), Angle(0)))
-        polygon.add_vertex(Vertex(Position(-x_outer, y - 1 - bot_offset), Angle(0)))
-        polygon.add_vertex(Vertex(Position(-x_outer, y + 1 + top_offset), Angle(0)))
-    # Back to start
-    top_y = get_y(1, per_row, 1, spacing, False) + spacing / 2 + offset
-    polygon.add_vertex(Vertex(Position(-x_inner, top_y), Angle(0)))
-    polygon.add_vertex(Vertex(Position(x_inner, top_y), Angle(0)))
-    polygon.add_vertex(Vertex(Position(x_outer, top_y - 0.27), Angle(0)))
-
-    return polygon
 
+@lru_cache(maxsize=None)
+def get_3d_model_bodies(model_type: str, drill: float) -> Tuple[Any, Any]:
+    """
+    Return the (insulator, lead) bodies of a single pin for the 3D models.
 
-def generate_3d_model_generic(
-    model_type: str,  # male or female
-    library: str,
-    full_name: str,
-    uuid_pkg: str,
-    uuid_3d: str,
-    rows: int,
-    pin_count: int,
-    drill: float,
-) -> None:
+    The bodies only depend on the model type and the drill, so they are
+    built once and shared between all pin counts. Every pin references the
+    same body with a different location, which keeps the STEP files small.
+    """
     import cadquery as cq
 
-    from cadquery_helpers import StepAssembly, StepColor
-
-    print(f'Generating pkg 3D model "{full_name}": {uuid_3d}')
-
     insulator_height = 7.0  # Full height of female header
     standoff_height = 2.5  # Plastic part of male header
     lead_length_bottom = 3.0  # Towards bottom side
@@ -449,17 +619,33 @@ def generate_3d_model_generic(
         .transformed(offset=(0, 0, -lead_length_bottom)) \
         .box(lead_dimensions[0], lead_dimensions[1], total_lead_length, centered=(True, True, False))
 
+    return (insulator, lead)
+
+
+def generate_3d_model_generic(
+    model_type: str,  # male or female
+    library: str,
+    full_name: str,
+    uuid_pkg: str,
+    uuid_3d: str,
+    rows: int,
+    pin_count: int,
+    drill: float,
+) -> None:
+    import cadquery as cq
+
+    from cadquery_helpers import StepAssembly, StepColor
+
+    print(f'Generating pkg 3D model "{full_name}": {uuid_3d}')
+
+    insulator, lead = get_3d_model_bodies(model_type, drill)
+
     # Combine into assembly
     assembly = StepAssembly(full_name)
+    xs = get_xs(pin_count, rows, spacing)
+    ys = get_ys(pin_count, rows, spacing, False)
     for pin in range(1, pin_count + 1):
-        if rows == 1:
-            x = 0.0
-        elif rows == 2:
-            x = spacing / 2 if (pin % rows == 0) else -spacing / 2
-        else:
-            raise RuntimeError(f'Invalid row count: {rows}')
-        y = get_y(pin, pin_count, rows, spacing, False)
-        location = cq.Location((x, y, 0))
+        location = cq.Location((xs[pin - 1], ys[pin - 1], 0))
         assembly.add_body(insulator, f'insulator-{pin}', StepColor.IC_BODY, location=location)
         assembly.add_body(lead, f'lead-{pin}', StepColor.LEAD_THT, location=location)
 
@@ -484,19 +670,35 @@ def generate_sym(
 ) -> None:
     category = 'sym'
     assert rows in [1, 2]
+    progress: List[str] = []  # Written to stdout in one go at the end
+    symbols: List[Symbol] = []
+    # Metadata which is the same for all elements (shared, never modified)
+    created = Created(create_date or now())
+    author_value = Author(author)
+    version_value = Version(version)
+    deprecated = Deprecated(False)
+    generated_by = GeneratedBy('')
+    categories = (Category(cmpcat),)
+    w = width * rows  # Make double-row symbols wider!
+    pin_length_inside = 0.6 if kind == KIND_SCREW_TERMINAL else 1.27
+    pin_name_offset = 5.2 if kind == KIND_SCREW_TERMINAL else 5.08
+    # Pin attributes which are the same for all pins (shared, never modified)
+    pin_length = Length(2.54 + pin_length_inside)
+    pin_name_position = NamePosition(pin_name_offset, 0.0)
+    pin_name_rotation = NameRotation(0.0)
+    pin_name_height = NameHeight(2.5)
+    pin_name_align = NameAlign('left center')
     for i in range(min_pads, max_pads + 1, rows):
         per_row = i // rows
-        w = width * rows  # Make double-row symbols wider!
-        pin_length_inside = 0.6 if kind == KIND_SCREW_TERMINAL else 1.27
-        pin_name_offset = 5.2 if kind == KIND_SCREW_TERMINAL else 5.08
-
-        variant = '{}x{}'.format(rows, per_row)
 
-        def _uuid(identifier: str) -> str:
-            return uuid(category, kind, variant, identifier)
+        variant = f'{rows}x{per_row}'
 
+        _uuid = uuid_factory(category, kind, variant)
         uuid_sym = _uuid('sym')
-        uuid_pins = [_uuid('pin-{}'.format(p)) for p in range(i)]
+        if incremental and is_up_to_date(path.join('out', library, category, uuid_sym, 'symbol.lp'), sources_mtime):
+            progress.append(f'{rows}x{per_row} {kind}: Symbol {uuid_sym} is up to date\n')
+            continue
+        uuid_pins = [_uuid(f'pin-{p}') for p in range(i)]
         uuid_polygon = _uuid('polygon-contour')
         uuid_decoration = _uuid('polygon-decoration')
         uuid_decoration_2 = _uuid('polygon-decoration-2')
@@ -504,19 +706,22 @@ def generate_sym(
         uuid_text_name = _uuid('text-name')
         uuid_text_value = _uuid('text-value')
 
+        # Pin coordinates are used for both the pins and the decorations
+        ys = get_ys(i, rows, spacing, True)
+
         # General info
         symbol = Symbol(
             uuid_sym,
-            Name('{} {}x{:02d}'.format(name, rows, per_row)),
-            Description('A {}x{} {}.\n\n'
-                        'Generated with {}'.format(rows, per_row, name_lower, generator)),
-            Keywords('connector, {}x{}, {}'.format(rows, per_row, keywords)),
-            Author(author),
-            Version(version),
-            Created(create_date or now()),
-            Deprecated(False),
-            GeneratedBy(''),
-            [Category(cmpcat)],
+            Name(f'{name} {rows}x{per_row:02d}'),
+            Description(f'A {rows}x{per_row} {name_lower}.\n\n'
+                        f'Generated with {generator}'),
+            Keywords(f'connector, {rows}x{per_row}, {keywords}'),
+            author_value,
+            version_value,
+            created,
+            deprecated,
+            generated_by,
+            categories,
         )
 
         for p in range(1, i + 1):
@@ -524,121 +729,130 @@ def generate_sym(
             pin = SymbolPin(
                 uuid_pins[p - 1],
                 Name(str(p)),
-                Position((w + 2.54) * x_sign, get_y(p, i, rows, spacing, True)),
+                Position((w + 2.54) * x_sign, ys[p - 1]),
                 Rotation(180.0 if p % rows == 0 else 0),
-                Length(2.54 + pin_length_inside),
-                NamePosition(pin_name_offset, 0.0),
-                NameRotation(0.0),
-                NameHeight(2.5),
-                NameAlign('left center'),
+                pin_length,
+                pin_name_position,
+                pin_name_rotation,
+                pin_name_height,
+                pin_name_align,
             )
             symbol.add_pin(pin)
 
         # Polygons
         y_max, y_min = get_rectangle_bounds(i, rows, spacing, spacing, True)
-        polygon = Polygon(
+        start = Vertex(Position(-w, y_max), zero_angle)
+        symbol.add_polygon(Polygon(
             uuid_polygon,
             Layer('sym_outlines'),
             Width(line_width),
-            Fill(False),
-            GrabArea(True)
-        )
-        polygon.add_vertex(Vertex(Position(-w, y_max), Angle(0.0)))
-        polygon.add_vertex(Vertex(Position(w, y_max), Angle(0.0)))
-        polygon.add_vertex(Vertex(Position(w, y_min), Angle(0.0)))
-        polygon.add_vertex(Vertex(Position(-w, y_min), Angle(0.0)))
-        polygon.add_vertex(Vertex(Position(-w, y_max), Angle(0.0)))
-        symbol.add_polygon(polygon)
+            fill_false,
+            grab_area_true,
+            vertices=[
+                start,
+                Vertex(Position(w, y_max), zero_angle),
+                Vertex(Position(w, y_min), zero_angle),
+                Vertex(Position(-w, y_min), zero_angle),
+                start,
+            ],
+        ))
 
         # Decorations
         if kind == KIND_HEADER:
             # Headers: Small rectangle
             for p in range(1, i + 1):
                 x_sign = 1 if (p % rows == 0) else -1
-                y = get_y(p, i, rows, spacing, True)
+                y = ys[p - 1]
                 dx = spacing / 8 * 1.5 * x_sign
                 dy = spacing / 8 / 1.5
                 x_offset = x_sign * (w - 1.27)
-                polygon = Polygon(
+                start = Vertex(Position(x_offset - dx, y + dy), zero_angle)
+                symbol.add_polygon(Polygon(
                     uuid_decoration,
                     Layer('sym_outlines'),
                     Width(line_width),
                     Fill(True),
-                    GrabArea(True)
-                )
-                polygon.add_vertex(Vertex(Position(x_offset - dx, y + dy), Angle(0.0)))
-                polygon.add_vertex(Vertex(Position(x_offset + dx, y + dy), Angle(0.0)))
-                polygon.add_vertex(Vertex(Position(x_offset + dx, y - dy), Angle(0.0)))
-                polygon.add_vertex(Vertex(Position(x_offset - dx, y - dy), Angle(0.0)))
-                polygon.add_vertex(Vertex(Position(x_offset - dx, y + dy), Angle(0.0)))
-                symbol.add_polygon(polygon)
+                    grab_area_true,
+                    vertices=[
+                        start,
+                        Vertex(Position(x_offset + dx, y + dy), zero_angle),
+                        Vertex(Position(x_offset + dx, y - dy), zero_angle),
+                        Vertex(Position(x_offset - dx, y - dy), zero_angle),
+                        start,
+                    ],
+                ))
         elif kind == KIND_SOCKET:
             # Sockets: Small semicircle
             for p in range(1, i + 1):
                 x_sign = 1 if (p % rows == 0) else -1
-                y = get_y(p, i, rows, spacing, True)
+                y = ys[p - 1]
                 dy = spacing / 4 * 0.75
                 x_offset = x_sign * (w - 1.27 - dy * 0.75)
-                polygon = Polygon(
+                symbol.add_polygon(Polygon(
                     uuid_decoration,
                     Layer('sym_outlines'),
                     Width(line_width * 0.75),
-                    Fill(False),
-                    GrabArea(False)
-                )
-                polygon.add_vertex(Vertex(Position(x_offset, y - dy), Angle(x_sign * 135.0)))
-                polygon.add_vertex(Vertex(Position(x_offset, y + dy), Angle(0.0)))
-                symbol.add_polygon(polygon)
+                    fill_false,
+                    grab_area_false,
+                    vertices=[
+                        Vertex(Position(x_offset, y - dy), Angle(x_sign * 135.0)),
+                        Vertex(Position(x_offset, y + dy), zero_angle),
+                    ],
+                ))
         elif kind == KIND_SCREW_TERMINAL:
-            # Screw terminals: Screw circle
+            # Screw terminals: Screw circle (the slot lines are rotated by
+            # 45° - 11.25°, their offsets are the same for all pins)
+            diam = 1.6
+            x_offset = w - (diam / 2) - pin_length_inside
+            line_dx = (diam / 2) * math.cos(math.pi / 4 - math.pi / 16)
+            line_dy = (diam / 2) * math.sin(math.pi / 4 - math.pi / 16)
             for p in range(1, i + 1):
-                y = get_y(p, i, rows, spacing, True)
-                dy = spacing / 4 * 0.75
-                diam = 1.6
-                x_offset = w - (diam / 2) - pin_length_inside
+                y = ys[p - 1]
                 pos = Position(x_offset, y)
                 symbol.add_circle(Circle(
                     uuid_decoration,
                     Layer('sym_outlines'),
                     Width(line_width * 0.75),
-                    Fill(False),
-                    GrabArea(False),
+                    fill_false,
+                    grab_area_false,
                     Diameter(diam),
                     pos,
                 ))
-                line_dx = (diam / 2) * math.cos(math.pi / 4 - math.pi / 16)
-                line_dy = (diam / 2) * math.sin(math.pi / 4 - math.pi / 16)
-                line1 = Polygon(
+                symbol.add_polygon(Polygon(
                     uuid_decoration_2,
                     Layer('sym_outlines'),
                     Width(line_width * .5),
-                    Fill(False),
-                    GrabArea(False),
-                )
-                line1.add_vertex(Vertex(Position(pos.x + line_dx, pos.y + line_dy), Angle(0.0)))
-                line1.add_vertex(Vertex(Position(pos.x - line_dy, pos.y - line_dx), Angle(0.0)))
-                symbol.add_polygon(line1)
-                line2 = Polygon(
+                    fill_false,
+                    grab_area_false,
+                    vertices=[
+                        Vertex(Position(pos.x + line_dx, pos.y + line_dy), zero_angle),
+                        Vertex(Position(pos.x - line_dy, pos.y - line_dx), zero_angle),
+                    ],
+                ))
+                symbol.add_polygon(Polygon(
                     uuid_decoration_3,
                     Layer('sym_outlines'),
                     Width(line_width * .5),
-                    Fill(False),
-                    GrabArea(False),
-                )
-                line2.add_vertex(Vertex(Position(pos.x + line_dy, pos.y + line_dx), Angle(0.0)))
-                line2.add_vertex(Vertex(Position(pos.x - line_dx, pos.y - line_dy), Angle(0.0)))
-                symbol.add_polygon(line2)
-
-        # Text
-        y_max, y_min = get_rectangle_bounds(i, rows, spacing, spacing, True)
-        text = Text(uuid_text_name, Layer('sym_names'), Value('{{NAME}}'), Align('center bottom'), Height(sym_text_height), Position(0.0, y_max), Rotation(0.0))
+                    fill_false,
+                    grab_area_false,
+                    vertices=[
+                        Vertex(Position(pos.x + line_dy, pos.y + line_dx), zero_angle),
+                        Vertex(Position(pos.x - line_dx, pos.y - line_dy), zero_angle),
+                    ],
+                ))
+
+        # Text (same bounds as the outline polygon)
+        text = Text(uuid_text_name, Layer('sym_names'), Value('{{NAME}}'), Align('center bottom'), Height(sym_text_height), Position(0.0, y_max), zero_rotation)
         symbol.add_text(text)
 
-        text = Text(uuid_text_value, Layer('sym_values'), Value('{{VALUE}}'), Align('center top'), Height(sym_text_height), Position(0.0, y_min), Rotation(0.0))
+        text = Text(uuid_text_value, Layer('sym_values'), Value('{{VALUE}}'), Align('center top'), Height(sym_text_height), Position(0.0, y_min), zero_rotation)
         symbol.add_text(text)
 
-        symbol.serialize(path.join('out', library, category))
-        print('{}x{} {}: Wrote symbol {}'.format(rows, per_row, kind, uuid_sym))
+        symbols.append(symbol)
+        progress.append(f'{rows}x{per_row} {kind}: Wrote symbol {uuid_sym}\n')
+
+    serialize_parallel(symbols, path.join('out', library, category))
+    sys.stdout.write(''.join(progress))
 
 
 def generate_cmp(
@@ -658,33 +872,44 @@ def generate_cmp(
 ) -> None:
     category = 'cmp'
     assert rows in [1, 2]
+    progress: List[str] = []  # Written to stdout in one go at the end
+    components: List[Component] = []
+    # Metadata which is the same for all elements (shared, never modified)
+    created = Created(create_date or now())
+    author_value = Author(author)
+    version_value = Version(version)
+    deprecated = Deprecated(False)
+    generated_by = GeneratedBy('')
+    categories = (Category(cmpcat),)
     for i in range(min_pads, max_pads + 1, rows):
         per_row = i // rows
-        variant = '{}x{}'.format(rows, per_row)
-
-        def _uuid(identifier: str) -> str:
-            return uuid(category, kind, variant, identifier)
+        variant = f'{rows}x{per_row}'
 
+        _uuid = uuid_factory(category, kind, variant)
         uuid_cmp = _uuid('cmp')
-        uuid_pins = [uuid('sym', kind, variant, 'pin-{}'.format(p)) for p in range(i)]
-        uuid_signals = [_uuid('signal-{}'.format(p)) for p in range(i)]
+        if incremental and is_up_to_date(path.join('out', library, category, uuid_cmp, 'component.lp'), sources_mtime):
+            progress.append(f'{rows}x{per_row} {kind}: Component {uuid_cmp} is up to date\n')
+            continue
+        _uuid_sym = uuid_factory('sym', kind, variant)
+        uuid_pins = [_uuid_sym(f'pin-{p}') for p in range(i)]
+        uuid_signals = [_uuid(f'signal-{p}') for p in range(i)]
         uuid_variant = _uuid('variant-default')
         uuid_gate = _uuid('gate-default')
-        uuid_symbol = uuid('sym', kind, variant, 'sym')
+        uuid_symbol = _uuid_sym('sym')
 
         # General info
         component = Component(
             uuid_cmp,
-            Name('{} {}x{:02d}'.format(name, rows, per_row)),
-            Description('A {}x{} {}.\n\n'
-                        'Generated with {}'.format(rows, per_row, name_lower, generator)),
-            Keywords('connector, {}x{}, {}'.format(rows, per_row, keywords)),
-            Author(author),
-            Version(version),
-            Created(create_date or now()),
-            Deprecated(False),
-            GeneratedBy(''),
-            [Category(cmpcat)],
+            Name(f'{name} {rows}x{per_row:02d}'),
+            Description(f'A {rows}x{per_row} {name_lower}.\n\n'
+                        f'Generated with {generator}'),
+            Keywords(f'connector, {rows}x{per_row}, {keywords}'),
+            author_value,
+            version_value,
+            created,
+            deprecated,
+            generated_by,
+            categories,
             SchematicOnly(False),
             DefaultValue(default_value),
             Prefix('J'),
@@ -705,7 +930,7 @@ def generate_cmp(
             uuid_gate,
             SymbolUUID(uuid_symbol),
             Position(0.0, 0.0),
-            Rotation(0.0),
+            zero_rotation,
             Required(True),
             Suffix(''),
         )
@@ -723,8 +948,11 @@ def generate_cmp(
             # Approve the "no default value set" message.
             component.add_approval("(approved empty_default_value)")
 
-        component.serialize(path.join('out', library, category))
-        print('{}x{} {}: Wrote component {}'.format(rows, per_row, kind, uuid_cmp))
+        components.append(component)
+        progress.append(f'{rows}x{per_row} {kind}: Wrote component {uuid_cmp}\n')
+
+    serialize_parallel(components, path.join('out', library, category))
+    sys.stdout.write(''.join(progress))
 
 
 def generate_dev(
@@ -743,417 +971,429 @@ def generate_dev(
 ) -> None:
     category = 'dev'
     assert rows in [1, 2]
+    progress: List[str] = []  # Written to stdout in one go at the end
+    created = create_date or now()  # Same timestamp for all devices
     for i in range(min_pads, max_pads + 1, rows):
         per_row = i // rows
-        for drill in pad_drills:
-            lines = []
 
-            variant = '{}x{}-D{:.1f}'.format(rows, per_row, drill)
-            broad_variant = '{}x{}'.format(rows, per_row)
+        # The component is the same for all drills
+        broad_variant = f'{rows}x{per_row}'
+        _uuid_cmp = uuid_factory('cmp', kind, broad_variant)
+        uuid_cmp = _uuid_cmp('cmp')
+        uuid_signals = [_uuid_cmp(f'signal-{p}') for p in range(i)]
 
-            def _uuid(identifier: str) -> str:
-                return uuid(category, kind, variant, identifier)
+        for drill in pad_drills:
+            drill_str = f'{drill:.1f}'  # Formatted once, used in several strings
+            variant = f'{rows}x{per_row}-D{drill_str}'
 
+            _uuid = uuid_factory(category, kind, variant)
             uuid_dev = _uuid('dev')
-            uuid_cmp = uuid('cmp', kind, broad_variant, 'cmp')
-            uuid_signals = [uuid('cmp', kind, broad_variant, 'signal-{}'.format(p)) for p in range(i)]
-            uuid_pkg = uuid('pkg', kind, variant, 'pkg')
-            uuid_pads = [uuid('pkg', kind, variant, 'pad-{}'.format(p)) for p in range(i)]
-
-            # General info
-            lines.append('(librepcb_device {}'.format(uuid_dev))
-            lines.append(' (name "{} {}x{:02d} ⌀{:.1f}mm")'.format(name, rows, per_row, drill))
-            lines.append(' (description "A {}x{} {} with {}mm pin spacing '
-                         'and {:.1f}mm drill holes.\\n\\n'
-                         'Generated with {}")'.format(rows, per_row, name_lower, spacing, drill, generator))
-            lines.append(' (keywords "connector, {}x{}, d{:.1f}, {}")'.format(rows, per_row, drill, keywords))
-            lines.append(' (author "{}")'.format(author))
-            lines.append(' (version "0.1.1")')
-            lines.append(' (created {})'.format(create_date or now()))
-            lines.append(' (deprecated false)')
-            lines.append(' (generated_by "")')
-            lines.append(' (category {})'.format(cmpcat))
-            lines.append(' (component {})'.format(uuid_cmp))
-            lines.append(' (package {})'.format(uuid_pkg))
-            signalmappings = []
-            for p in range(1, i + 1):
-                signalmappings.append(' (pad {} (signal {}))'.format(uuid_pads[p - 1], uuid_signals[p - 1]))
-            lines.extend(sorted(signalmappings))
-            lines.append(" (approved no_parts)")
-            lines.append(')')
+            if incremental and is_up_to_date(path.join('out', library, category, uuid_dev, 'device.lp'), sources_mtime):
+                progress.append(f'{rows}x{per_row} {kind} ⌀{drill_str}mm: Device {uuid_dev} is up to date\n')
+                continue
+            _uuid_pkg = uuid_factory('pkg', kind, variant)
+            uuid_pkg = _uuid_pkg('pkg')
+            uuid_pads = [_uuid_pkg(f'pad-{p}') for p in range(i)]
+
+            signalmappings = [f' (pad {pad} (signal {signal}))\n' for (pad, signal) in zip(uuid_pads, uuid_signals)]
+            signalmappings.sort()
+            content = device_template.format(
+                uuid=uuid_dev,
+                name=name,
+                name_lower=name_lower,
+                rows=rows,
+                per_row=per_row,
+                drill=drill_str,
+                keywords=keywords,
+                author=author,
+                created=created,
+                category=cmpcat,
+                component=uuid_cmp,
+                package=uuid_pkg,
+                signalmappings=''.join(signalmappings),
+            )
 
-            dev_dir_path = path.join('out', library, category, uuid_dev)
-            if not (path.exists(dev_dir_path) and path.isdir(dev_dir_path)):
-                makedirs(dev_dir_path)
-            with open(path.join(dev_dir_path, '.librepcb-dev'), 'w') as f:
-                f.write('1\n')
-            with open(path.join(dev_dir_path, 'device.lp'), 'w') as f:
-                f.write('\n'.join(lines))
-                f.write('\n')
+            write_element_files(
+                path.join('out', library, category, uuid_dev),
+                '.librepcb-dev',
+                b'1\n',
+                'device.lp',
+                content.encode('utf-8'),
+            )
 
-            print('{}x{} {} ⌀{:.1f}mm: Wrote device {}'.format(rows, per_row, kind, drill, uuid_dev))
+            progress.append(f'{rows}x{per_row} {kind} ⌀{drill_str}mm: Wrote device {uuid_dev}\n')
+    sys.stdout.write(''.join(progress))
 
 
 if __name__ == '__main__':
     if '--help' in sys.argv or '-h' in sys.argv:
-        print(f'Usage: {sys.argv[0]} [--3d]')
+        print(f'Usage: {sys.argv[0]} [--3d] [--incremental]')
         print()
         print('Options:')
-        print('  --3d    Generate 3D models using cadquery')
+        print('  --3d           Generate 3D models using cadquery')
+        print('  --incremental  Skip elements which are newer than the generator sources')
         sys.exit(1)
 
     generate_3d_models = '--3d' in sys.argv
+    incremental = '--incremental' in sys.argv
+    if incremental:
+        sources_mtime = get_sources_mtime(__file__, 'cadquery_helpers.py')
     if not generate_3d_models:
         warning = 'Note: Not generating 3D models unless the "--3d" argument is passed in!'
         print(f'\033[1;33m{warning}\033[0m')
 
-    # Male pin headers
-    generate_sym(
-        library='LibrePCB_Connectors.lplib',
-        author='Danilo B.',
-        name='Pin Header',
-        name_lower='male pin header',
-        kind=KIND_HEADER,
-        cmpcat='4a4e3c72-94fb-45f9-a6d8-122d2af16fb1',
-        keywords='pin header, male header',
-        rows=1,
-        min_pads=1,
-        max_pads=40,
-        version='0.2',
-        create_date='2018-10-17T19:13:41Z',
-    )
-    generate_sym(
-        library='LibrePCB_Connectors.lplib',
-        author='Danilo B.',
-        name='Pin Header',
-        name_lower='male pin header',
-        kind=KIND_HEADER,
-        cmpcat='4a4e3c72-94fb-45f9-a6d8-122d2af16fb1',
-        keywords='pin header, male header',
-        rows=2,
-        min_pads=4,
-        max_pads=80,
-        version='0.2',
-        create_date='2019-09-10T21:02:02Z',
-    )
-    generate_cmp(
-        library='LibrePCB_Connectors.lplib',
-        author='Danilo B.',
-        name='Pin Header',
-        name_lower='male pin header',
-        kind=KIND_HEADER,
-        cmpcat='4a4e3c72-94fb-45f9-a6d8-122d2af16fb1',
-        keywords='pin header, male header',
-        default_value='{{MPN}}',
-        rows=1,
-        min_pads=1,
-        max_pads=40,
-        version='0.1',
-        create_date='2018-10-17T19:13:41Z',
-    )
-    generate_cmp(
-        library='LibrePCB_Connectors.lplib',
-        author='Danilo B.',
-        name='Pin Header',
-        name_lower='male pin header',
-        kind=KIND_HEADER,
-        cmpcat='4a4e3c72-94fb-45f9-a6d8-122d2af16fb1',
-        keywords='pin header, male header',
-        default_value='{{MPN}}',
-        rows=2,
-        min_pads=4,
-        max_pads=80,
-        version='0.1',
-        create_date='2019-09-11T19:13:41Z',
-    )
-    generate_pkg(
-        library='LibrePCB_Connectors.lplib',
-        author='Danilo B.',
-        name='Pin Header 2.54mm',
-        name_lower='male pin header',
-        kind=KIND_HEADER,
-        assembly_type=AssemblyType.THT,
-        pkgcat='e4d3a6bf-af32-48a2-b427-5e794bed949a',
-        keywords='pin header, male header, tht',
-        rows=1,
-        min_pads=1,
-        max_pads=40,
-        pad_drills=[0.9, 1.0, 1.1],
-        generate_silkscreen=generate_silkscreen_male,
-        generate_3d_model=partial(generate_3d_model_generic, 'male'),
-        generate_3d_models=generate_3d_models,
-        version='0.3',
-        create_date='2018-10-17T19:13:41Z',
-    )
-    generate_pkg(
-        library='LibrePCB_Connectors.lplib',
-        author='Danilo B.',
-        name='Pin Header 2.54mm',
-        name_lower='male pin header',
-        kind=KIND_HEADER,
-        assembly_type=AssemblyType.THT,
-        pkgcat='e4d3a6bf-af32-48a2-b427-5e794bed949a',
-        keywords='pin header, male header, tht',
-        rows=2,
-        min_pads=4,
-        max_pads=80,
-        pad_drills=[0.9, 1.0, 1.1],
-        generate_silkscreen=generate_silkscreen_male,
-        generate_3d_model=partial(generate_3d_model_generic, 'male'),
-        generate_3d_models=generate_3d_models,
-        version='0.3',
-        create_date='2019-09-17T20:00:41Z',
-    )
-    generate_dev(
-        library='LibrePCB_Connectors.lplib',
-        author='Danilo B.',
-        name='Generic Pin Header 2.54mm',
-        name_lower='generic male pin header',
-        kind=KIND_HEADER,
-        cmpcat='4a4e3c72-94fb-45f9-a6d8-122d2af16fb1',
-        keywords='pin header, male header, tht, generic',
-        rows=1,
-        min_pads=1,
-        max_pads=40,
-        pad_drills=[0.9, 1.0, 1.1],
-        create_date='2018-10-17T19:13:41Z',
-    )
-    generate_dev(
-        library='LibrePCB_Connectors.lplib',
-        author='Danilo B.',
-        name='Generic Pin Header 2.54mm',
-        name_lower='generic male pin header',
-        kind=KIND_HEADER,
-        cmpcat='4a4e3c72-94fb-45f9-a6d8-122d2af16fb1',
-        keywords='pin header, male header, tht, generic',
-        rows=2,
-        min_pads=4,
-        max_pads=80,
-        pad_drills=[0.9, 1.0, 1.1],
-        create_date='2019-10-12T23:40:41Z',
-    )
-
-    # Female pin sockets
-    generate_sym(
-        library='LibrePCB_Connectors.lplib',
-        author='Danilo B.',
-        name='Pin Socket',
-        name_lower='female pin socket',
-        kind=KIND_SOCKET,
-        cmpcat='ade6d8ff-3c4f-4dac-a939-cc540c87c280',
-        keywords='pin socket, female header',
-        rows=1,
-        min_pads=1,
-        max_pads=40,
-        version='0.3',
-        create_date='2018-10-17T19:13:41Z',
-    )
-    generate_sym(
-        library='LibrePCB_Connectors.lplib',
-        author='Danilo B.',
-        name='Pin Socket',
-        name_lower='female pin socket',
-        kind=KIND_SOCKET,
-        cmpcat='ade6d8ff-3c4f-4dac-a939-cc540c87c280',
-        keywords='pin socket, female header',
-        rows=2,
-        min_pads=4,
-        max_pads=80,
-        version='0.3',
-        create_date='2019-09-10T21:02:02Z',
-    )
-    generate_cmp(
-        library='LibrePCB_Connectors.lplib',
-        author='Danilo B.',
-        name='Pin Socket',
-        name_lower='female pin socket',
-        kind=KIND_SOCKET,
-        cmpcat='ade6d8ff-3c4f-4dac-a939-cc540c87c280',
-        keywords='pin socket, female header',
-        default_value='{{MPN}}',
-        rows=1,
-        min_pads=1,
-        max_pads=40,
-        version='0.1',
-        create_date='2018-10-17T19:13:41Z',
-    )
-    generate_cmp(
-        library='LibrePCB_Connectors.lplib',
-        author='Danilo B.',
-        name='Pin Socket',
-        name_lower='female pin socket',
-        kind=KIND_SOCKET,
-        cmpcat='ade6d8ff-3c4f-4dac-a939-cc540c87c280',
-        keywords='pin socket, female header',
-        default_value='{{MPN}}',
-        rows=2,
-        min_pads=4,
-        max_pads=80,
-        version='0.1',
-        create_date='2019-09-11T19:13:41Z',
-    )
-    generate_pkg(
-        library='LibrePCB_Connectors.lplib',
-        author='Danilo B.',
-        name='Pin Socket 2.54mm',
-        name_lower='female pin socket',
-        kind=KIND_SOCKET,
-        assembly_type=AssemblyType.THT,
-        pkgcat='6183d171-e810-475a-a568-2a270aff8f5e',
-        keywords='pin socket, female header, tht',
-        rows=1,
-        min_pads=1,
-        max_pads=40,
-        pad_drills=[0.9, 1.0, 1.1],
-        generate_silkscreen=generate_silkscreen_female,
-        generate_3d_model=partial(generate_3d_model_generic, 'female'),
-        generate_3d_models=generate_3d_models,
-        version='0.3',
-        create_date='2018-10-17T19:13:41Z',
-    )
-    generate_pkg(
-        library='LibrePCB_Connectors.lplib',
-        author='Danilo B.',
-        name='Pin Socket 2.54mm',
-        name_lower='female pin socket',
-        kind=KIND_SOCKET,
-        assembly_type=AssemblyType.THT,
-        pkgcat='6183d171-e810-475a-a568-2a270aff8f5e',
-        keywords='pin socket, female header, tht',
-        rows=2,
-        min_pads=4,
-        max_pads=80,
-        pad_drills=[0.9, 1.0, 1.1],
-        generate_silkscreen=generate_silkscreen_female,
-        generate_3d_model=partial(generate_3d_model_generic, 'female'),
-        generate_3d_models=generate_3d_models,
-        version='0.3',
-        create_date='2019-09-17T20:00:41Z',
-    )
-    generate_dev(
-        library='LibrePCB_Connectors.lplib',
-        author='Danilo B.',
-        name='Generic Pin Socket 2.54mm',
-        name_lower='generic female pin socket',
-        kind=KIND_SOCKET,
-        cmpcat='ade6d8ff-3c4f-4dac-a939-cc540c87c280',
-        keywords='pin socket, female header, tht, generic',
-        rows=1,
-        min_pads=1,
-        max_pads=40,
-        pad_drills=[0.9, 1.0, 1.1],
-        create_date='2018-10-17T19:13:41Z',
-    )
-    generate_dev(
-        library='LibrePCB_Connectors.lplib',
-        author='Danilo B.',
-        name='Generic Pin Socket 2.54mm',
-        name_lower='generic female pin socket',
-        kind=KIND_SOCKET,
-        cmpcat='ade6d8ff-3c4f-4dac-a939-cc540c87c280',
-        keywords='pin socket, female header, tht, generic',
-        rows=2,
-        min_pads=4,
-        max_pads=80,
-        pad_drills=[0.9, 1.0, 1.1],
-        create_date='2019-10-12T23:40:41Z',
-    )
+    try:
+        # 3D model generators, shared by the single and double row packages
+        generate_3d_model_male = partial(generate_3d_model_generic, 'male')
+        generate_3d_model_female = partial(generate_3d_model_generic, 'female')
+
+        # Male pin headers
+        generate_sym(
+            library='LibrePCB_Connectors.lplib',
+            author='Danilo B.',
+            name='Pin Header',
+            name_lower='male pin header',
+            kind=KIND_HEADER,
+            cmpcat='4a4e3c72-94fb-45f9-a6d8-122d2af16fb1',
+            keywords='pin header, male header',
+            rows=1,
+            min_pads=1,
+            max_pads=40,
+            version='0.2',
+            create_date='2018-10-17T19:13:41Z',
+        )
+        generate_sym(
+            library='LibrePCB_Connectors.lplib',
+            author='Danilo B.',
+            name='Pin Header',
+            name_lower='male pin header',
+            kind=KIND_HEADER,
+            cmpcat='4a4e3c72-94fb-45f9-a6d8-122d2af16fb1',
+            keywords='pin header, male header',
+            rows=2,
+            min_pads=4,
+            max_pads=80,
+            version='0.2',
+            create_date='2019-09-10T21:02:02Z',
+        )
+        generate_cmp(
+            library='LibrePCB_Connectors.lplib',
+            author='Danilo B.',
+            name='Pin Header',
+            name_lower='male pin header',
+            kind=KIND_HEADER,
+            cmpcat='4a4e3c72-94fb-45f9-a6d8-122d2af16fb1',
+            keywords='pin header, male header',
+            default_value='{{MPN}}',
+            rows=1,
+            min_pads=1,
+            max_pads=40,
+            version='0.1',
+            create_date='2018-10-17T19:13:41Z',
+        )
+        generate_cmp(
+            library='LibrePCB_Connectors.lplib',
+            author='Danilo B.',
+            name='Pin Header',
+            name_lower='male pin header',
+            kind=KIND_HEADER,
+            cmpcat='4a4e3c72-94fb-45f9-a6d8-122d2af16fb1',
+            keywords='pin header, male header',
+            default_value='{{MPN}}',
+            rows=2,
+            min_pads=4,
+            max_pads=80,
+            version='0.1',
+            create_date='2019-09-11T19:13:41Z',
+        )
+        generate_pkg(
+            library='LibrePCB_Connectors.lplib',
+            author='Danilo B.',
+            name='Pin Header 2.54mm',
+            name_lower='male pin header',
+            kind=KIND_HEADER,
+            assembly_type=AssemblyType.THT,
+            pkgcat='e4d3a6bf-af32-48a2-b427-5e794bed949a',
+            keywords='pin header, male header, tht',
+            rows=1,
+            min_pads=1,
+            max_pads=40,
+            pad_drills=[0.9, 1.0, 1.1],
+            generate_silkscreen=generate_silkscreen_male,
+            generate_3d_model=generate_3d_model_male,
+            generate_3d_models=generate_3d_models,
+            version='0.3',
+            create_date='2018-10-17T19:13:41Z',
+        )
+        generate_pkg(
+            library='LibrePCB_Connectors.lplib',
+            author='Danilo B.',
+            name='Pin Header 2.54mm',
+            name_lower='male pin header',
+            kind=KIND_HEADER,
+            assembly_type=AssemblyType.THT,
+            pkgcat='e4d3a6bf-af32-48a2-b427-5e794bed949a',
+            keywords='pin header, male header, tht',
+            rows=2,
+            min_pads=4,
+            max_pads=80,
+            pad_drills=[0.9, 1.0, 1.1],
+            generate_silkscreen=generate_silkscreen_male,
+            generate_3d_model=generate_3d_model_male,
+            generate_3d_models=generate_3d_models,
+            version='0.3',
+            create_date='2019-09-17T20:00:41Z',
+        )
+        generate_dev(
+            library='LibrePCB_Connectors.lplib',
+            author='Danilo B.',
+            name='Generic Pin Header 2.54mm',
+            name_lower='generic male pin header',
+            kind=KIND_HEADER,
+            cmpcat='4a4e3c72-94fb-45f9-a6d8-122d2af16fb1',
+            keywords='pin header, male header, tht, generic',
+            rows=1,
+            min_pads=1,
+            max_pads=40,
+            pad_drills=[0.9, 1.0, 1.1],
+            create_date='2018-10-17T19:13:41Z',
+        )
+        generate_dev(
+            library='LibrePCB_Connectors.lplib',
+            author='Danilo B.',
+            name='Generic Pin Header 2.54mm',
+            name_lower='generic male pin header',
+            kind=KIND_HEADER,
+            cmpcat='4a4e3c72-94fb-45f9-a6d8-122d2af16fb1',
+            keywords='pin header, male header, tht, generic',
+            rows=2,
+            min_pads=4,
+            max_pads=80,
+            pad_drills=[0.9, 1.0, 1.1],
+            create_date='2019-10-12T23:40:41Z',
+        )
 
-    # Screw terminal
-    generate_sym(
-        library='LibrePCB_Connectors.lplib',
-        author='Danilo B.',
-        name='Screw Terminal',
-        name_lower='screw terminal',
-        kind=KIND_SCREW_TERMINAL,
-        cmpcat='f9db4ef5-2220-462a-adff-deac8402ecf0',  # Terminal Blocks
-        keywords='screw terminal, terminal block',
-        rows=1,
-        min_pads=1,
-        max_pads=40,
-        version='0.2',
-        create_date='2022-07-16T21:23:20Z',
-    )
-    generate_cmp(
-        library='LibrePCB_Connectors.lplib',
-        author='Danilo B.',
-        name='Screw Terminal',
-        name_lower='screw terminal',
-        kind=KIND_SCREW_TERMINAL,
-        cmpcat='f9db4ef5-2220-462a-adff-deac8402ecf0',  # Terminal Blocks
-        keywords='screw terminal, terminal block',
-        default_value='{{MPN}}',
-        rows=1,
-        min_pads=1,
-        max_pads=40,
-        version='0.2',
-        create_date='2022-07-16T21:23:20Z',
-    )
+        # Female pin sockets
+        generate_sym(
+            library='LibrePCB_Connectors.lplib',
+            author='Danilo B.',
+            name='Pin Socket',
+            name_lower='female pin socket',
+            kind=KIND_SOCKET,
+            cmpcat='ade6d8ff-3c4f-4dac-a939-cc540c87c280',
+            keywords='pin socket, female header',
+            rows=1,
+            min_pads=1,
+            max_pads=40,
+            version='0.3',
+            create_date='2018-10-17T19:13:41Z',
+        )
+        generate_sym(
+            library='LibrePCB_Connectors.lplib',
+            author='Danilo B.',
+            name='Pin Socket',
+            name_lower='female pin socket',
+            kind=KIND_SOCKET,
+            cmpcat='ade6d8ff-3c4f-4dac-a939-cc540c87c280',
+            keywords='pin socket, female header',
+            rows=2,
+            min_pads=4,
+            max_pads=80,
+            version='0.3',
+            create_date='2019-09-10T21:02:02Z',
+        )
+        generate_cmp(
+            library='LibrePCB_Connectors.lplib',
+            author='Danilo B.',
+            name='Pin Socket',
+            name_lower='female pin socket',
+            kind=KIND_SOCKET,
+            cmpcat='ade6d8ff-3c4f-4dac-a939-cc540c87c280',
+            keywords='pin socket, female header',
+            default_value='{{MPN}}',
+            rows=1,
+            min_pads=1,
+            max_pads=40,
+            version='0.1',
+            create_date='2018-10-17T19:13:41Z',
+        )
+        generate_cmp(
+            library='LibrePCB_Connectors.lplib',
+            author='Danilo B.',
+            name='Pin Socket',
+            name_lower='female pin socket',
+            kind=KIND_SOCKET,
+            cmpcat='ade6d8ff-3c4f-4dac-a939-cc540c87c280',
+            keywords='pin socket, female header',
+            default_value='{{MPN}}',
+            rows=2,
+            min_pads=4,
+            max_pads=80,
+            version='0.1',
+            create_date='2019-09-11T19:13:41Z',
+        )
+        generate_pkg(
+            library='LibrePCB_Connectors.lplib',
+            author='Danilo B.',
+            name='Pin Socket 2.54mm',
+            name_lower='female pin socket',
+            kind=KIND_SOCKET,
+            assembly_type=AssemblyType.THT,
+            pkgcat='6183d171-e810-475a-a568-2a270aff8f5e',
+            keywords='pin socket, female header, tht',
+            rows=1,
+            min_pads=1,
+            max_pads=40,
+            pad_drills=[0.9, 1.0, 1.1],
+            generate_silkscreen=generate_silkscreen_female,
+            generate_3d_model=generate_3d_model_female,
+            generate_3d_models=generate_3d_models,
+            version='0.3',
+            create_date='2018-10-17T19:13:41Z',
+        )
+        generate_pkg(
+            library='LibrePCB_Connectors.lplib',
+            author='Danilo B.',
+            name='Pin Socket 2.54mm',
+            name_lower='female pin socket',
+            kind=KIND_SOCKET,
+            assembly_type=AssemblyType.THT,
+            pkgcat='6183d171-e810-475a-a568-2a270aff8f5e',
+            keywords='pin socket, female header, tht',
+            rows=2,
+            min_pads=4,
+            max_pads=80,
+            pad_drills=[0.9, 1.0, 1.1],
+            generate_silkscreen=generate_silkscreen_female,
+            generate_3d_model=generate_3d_model_female,
+            generate_3d_models=generate_3d_models,
+            version='0.3',
+            create_date='2019-09-17T20:00:41Z',
+        )
+        generate_dev(
+            library='LibrePCB_Connectors.lplib',
+            author='Danilo B.',
+            name='Generic Pin Socket 2.54mm',
+            name_lower='generic female pin socket',
+            kind=KIND_SOCKET,
+            cmpcat='ade6d8ff-3c4f-4dac-a939-cc540c87c280',
+            keywords='pin socket, female header, tht, generic',
+            rows=1,
+            min_pads=1,
+            max_pads=40,
+            pad_drills=[0.9, 1.0, 1.1],
+            create_date='2018-10-17T19:13:41Z',
+        )
+        generate_dev(
+            library='LibrePCB_Connectors.lplib',
+            author='Danilo B.',
+            name='Generic Pin Socket 2.54mm',
+            name_lower='generic female pin socket',
+            kind=KIND_SOCKET,
+            cmpcat='ade6d8ff-3c4f-4dac-a939-cc540c87c280',
+            keywords='pin socket, female header, tht, generic',
+            rows=2,
+            min_pads=4,
+            max_pads=80,
+            pad_drills=[0.9, 1.0, 1.1],
+            create_date='2019-10-12T23:40:41Z',
+        )
 
-    # Generic connector
-    generate_sym(
-        library='LibrePCB_Connectors.lplib',
-        author='Danilo B.',
-        name='Connector',
-        name_lower='connector',
-        kind=KIND_WIRE_CONNECTOR,
-        cmpcat='d0618c29-0436-42da-a388-fdadf7b23892',
-        keywords='connector, generic',
-        rows=1,
-        min_pads=1,
-        max_pads=40,
-        version='0.2',
-        create_date='2018-10-17T19:13:41Z',
-    )
+        # Screw terminal
+        generate_sym(
+            library='LibrePCB_Connectors.lplib',
+            author='Danilo B.',
+            name='Screw Terminal',
+            name_lower='screw terminal',
+            kind=KIND_SCREW_TERMINAL,
+            cmpcat='f9db4ef5-2220-462a-adff-deac8402ecf0',  # Terminal Blocks
+            keywords='screw terminal, terminal block',
+            rows=1,
+            min_pads=1,
+            max_pads=40,
+            version='0.2',
+            create_date='2022-07-16T21:23:20Z',
+        )
+        generate_cmp(
+            library='LibrePCB_Connectors.lplib',
+            author='Danilo B.',
+            name='Screw Terminal',
+            name_lower='screw terminal',
+            kind=KIND_SCREW_TERMINAL,
+            cmpcat='f9db4ef5-2220-462a-adff-deac8402ecf0',  # Terminal Blocks
+            keywords='screw terminal, terminal block',
+            default_value='{{MPN}}',
+            rows=1,
+            min_pads=1,
+            max_pads=40,
+            version='0.2',
+            create_date='2022-07-16T21:23:20Z',
+        )
 
-    # Soldered wire connector
-    generate_cmp(
-        library='LibrePCB_Connectors.lplib',
-        author='Danilo B.',
-        name='Soldered Wire Connector',
-        name_lower='soldered wire connector',
-        kind=KIND_WIRE_CONNECTOR,
-        cmpcat='d0618c29-0436-42da-a388-fdadf7b23892',
-        keywords='connector, soldering, generic',
-        default_value='',
-        rows=1,
-        min_pads=1,
-        max_pads=40,
-        version='0.1.1',
-        create_date='2018-10-17T19:13:41Z',
-    )
-    generate_pkg(
-        library='LibrePCB_Connectors.lplib',
-        author='Danilo B.',
-        name='Soldered Wire Connector',
-        name_lower='soldered wire connector',
-        kind=KIND_WIRE_CONNECTOR,
-        assembly_type=AssemblyType.NONE,
-        pkgcat='56a5773f-eeb4-4b39-8cb9-274f3da26f4f',
-        keywords='connector, soldering, generic',
-        rows=1,
-        min_pads=1,
-        max_pads=40,
-        pad_drills=[1.0],
-        generate_silkscreen=generate_silkscreen_female,
-        generate_3d_model=None,
-        generate_3d_models=False,
-        version='0.3',
-        create_date='2018-10-17T19:13:41Z',
-    )
-    generate_dev(
-        library='LibrePCB_Connectors.lplib',
-        author='Danilo B.',
-        name='Soldered Wire Connector 2.54mm',
-        name_lower='generic soldered wire connector',
-        kind=KIND_WIRE_CONNECTOR,
-        cmpcat='d0618c29-0436-42da-a388-fdadf7b23892',
-        keywords='connector, soldering, generic',
-        rows=1,
-        min_pads=1,
-        max_pads=40,
-        pad_drills=[1.0],
-        create_date='2018-10-17T19:13:41Z',
-    )
+        # Generic connector
+        generate_sym(
+            library='LibrePCB_Connectors.lplib',
+            author='Danilo B.',
+            name='Connector',
+            name_lower='connector',
+            kind=KIND_WIRE_CONNECTOR,
+            cmpcat='d0618c29-0436-42da-a388-fdadf7b23892',
+            keywords='connector, generic',
+            rows=1,
+            min_pads=1,
+            max_pads=40,
+            version='0.2',
+            create_date='2018-10-17T19:13:41Z',
+        )
 
-    save_cache(uuid_cache_file, uuid_cache)
+        # Soldered wire connector
+        generate_cmp(
+            library='LibrePCB_Connectors.lplib',
+            author='Danilo B.',
+            name='Soldered Wire Connector',
+            name_lower='soldered wire connector',
+            kind=KIND_WIRE_CONNECTOR,
+            cmpcat='d0618c29-0436-42da-a388-fdadf7b23892',
+            keywords='connector, soldering, generic',
+            default_value='',
+            rows=1,
+            min_pads=1,
+            max_pads=40,
+            version='0.1.1',
+            create_date='2018-10-17T19:13:41Z',
+        )
+        generate_pkg(
+            library='LibrePCB_Connectors.lplib',
+            author='Danilo B.',
+            name='Soldered Wire Connector',
+            name_lower='soldered wire connector',
+            kind=KIND_WIRE_CONNECTOR,
+            assembly_type=AssemblyType.NONE,
+            pkgcat='56a5773f-eeb4-4b39-8cb9-274f3da26f4f',
+            keywords='connector, soldering, generic',
+            rows=1,
+            min_pads=1,
+            max_pads=40,
+            pad_drills=[1.0],
+            generate_silkscreen=generate_silkscreen_female,
+            generate_3d_model=None,
+            generate_3d_models=False,
+            version='0.3',
+            create_date='2018-10-17T19:13:41Z',
+        )
+        generate_dev(
+            library='LibrePCB_Connectors.lplib',
+            author='Danilo B.',
+            name='Soldered Wire Connector 2.54mm',
+            name_lower='generic soldered wire connector',
+            kind=KIND_WIRE_CONNECTOR,
+            cmpcat='d0618c29-0436-42da-a388-fdadf7b23892',
+            keywords='connector, soldering, generic',
+            rows=1,
+            min_pads=1,
+            max_pads=40,
+            pad_drills=[1.0],
+            create_date='2018-10-17T19:13:41Z',
+        )
+    finally:
+        save_cache(uuid_cache_file, uuid_cache)
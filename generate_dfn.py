@@ -9,7 +9,7 @@ from uuid import uuid4
 from typing import List, Optional
 
 from common import format_ipc_dimension as fd
-from common import init_cache, now, save_cache
+from common import get_y, init_cache, now, save_cache
 from dfn_configs import JEDEC_CONFIGS, THIRD_CONFIGS, DfnConfig
 from entities.common import (
     Align, Angle, Author, Category, Circle, Created, Deprecated, Description, Diameter, Fill, GeneratedBy, GrabArea,
@@ -51,27 +51,10 @@ def uuid(category: str, full_name: str, identifier: str) -> str:
             For example 'pad-1' or 'pin-13'.
     """
     key = '{}-{}-{}'.format(category, full_name, identifier).lower().replace(' ', '~')
-    if key not in uuid_cache:
-        uuid_cache[key] = str(uuid4())
-    return uuid_cache[key]
-
-
-def get_y(pin_number: int, pin_count: int, spacing: float, grid_align: bool) -> float:
-    """
-    Return the y coordinate of the specified pin. Keep the pins grid aligned, if desired.
-
-    The pin number is 1 index based. Pin 1 is at the top. The middle pin will
-    be at or near 0.
-
-    """
-    if grid_align:
-        mid = float((pin_count + 1) // 2)
-    else:
-        mid = (pin_count + 1) / 2
-    y = -round(pin_number * spacing - mid * spacing, 2)
-    if y == -0.0:  # Returns true for 0.0 too, but that doesn't matter
-        return 0.0
-    return y
+    value = uuid_cache.get(key)
+    if value is None:
+        value = uuid_cache[key] = str(uuid4())
+    return value
 
 
 def generate_pkg(
@@ -542,69 +525,70 @@ if __name__ == '__main__':
         warning = 'Note: Not generating 3D models unless the "--3d" argument is passed in!'
         print(f'\033[1;33m{warning}\033[0m')
 
-    generated_packages: List[str] = []
+    try:
+        generated_packages: List[str] = []
 
-    for config in JEDEC_CONFIGS:
-        # Find out which configs to create
-        if config.exposed_width > 0 and config.exposed_length > 0:
-            if config.no_exp:
-                exposed_settings = [True, False]
+        for config in JEDEC_CONFIGS:
+            # Find out which configs to create
+            if config.exposed_width > 0 and config.exposed_length > 0:
+                if config.no_exp:
+                    exposed_settings = [True, False]
+                else:
+                    exposed_settings = [True]
             else:
-                exposed_settings = [True]
-        else:
-            exposed_settings = [False]
-
-        for make_exposed in exposed_settings:
-            name = generate_pkg(
-                author='Hannes Badertscher',
-                name='DFN{pitch}P{length}X{width}X{height}-{pin_count}',
-                description='{pin_count}-pin Dual Flat No-Lead package (DFN), '
-                            'standardized by JEDEC MO-229F.\n\n'
-                            'Pitch: {pitch:.2f} mm\n'
-                            'Nominal width: {width:.2f} mm\n'
-                            'Nominal length: {length:.2f} mm\n'
-                            'Height: {height:.2f}mm',
-                pkgcat='88cbb15c-2b69-4612-8764-c5d323f88f13',
-                keywords='dfn,dual flat no-leads,mo-229f',
-                config=config,
-                make_exposed=make_exposed,
-                generate_3d_models=generate_3d_models,
-                create_date='2019-01-17T06:11:43Z',
-            )
-            if name not in generated_packages:
-                generated_packages.append(name)
-            else:
-                print("Duplicate name found: {}".format(name))
-
-    for config in THIRD_CONFIGS:
-        # Find out which configs to create
-        if config.exposed_width > 0.0 and config.exposed_length > 0.0:
-            if config.no_exp:
-                exposed_settings = [True, False]
+                exposed_settings = [False]
+
+            for make_exposed in exposed_settings:
+                name = generate_pkg(
+                    author='Hannes Badertscher',
+                    name='DFN{pitch}P{length}X{width}X{height}-{pin_count}',
+                    description='{pin_count}-pin Dual Flat No-Lead package (DFN), '
+                                'standardized by JEDEC MO-229F.\n\n'
+                                'Pitch: {pitch:.2f} mm\n'
+                                'Nominal width: {width:.2f} mm\n'
+                                'Nominal length: {length:.2f} mm\n'
+                                'Height: {height:.2f}mm',
+                    pkgcat='88cbb15c-2b69-4612-8764-c5d323f88f13',
+                    keywords='dfn,dual flat no-leads,mo-229f',
+                    config=config,
+                    make_exposed=make_exposed,
+                    generate_3d_models=generate_3d_models,
+                    create_date='2019-01-17T06:11:43Z',
+                )
+                if name not in generated_packages:
+                    generated_packages.append(name)
+                else:
+                    print("Duplicate name found: {}".format(name))
+
+        for config in THIRD_CONFIGS:
+            # Find out which configs to create
+            if config.exposed_width > 0.0 and config.exposed_length > 0.0:
+                if config.no_exp:
+                    exposed_settings = [True, False]
+                else:
+                    exposed_settings = [True]
             else:
-                exposed_settings = [True]
-        else:
-            exposed_settings = [False]
-
-        for make_exposed in exposed_settings:
-            name = generate_pkg(
-                author='Hannes Badertscher',
-                name='DFN{pitch}P{length}X{width}X{height}-{pin_count}',
-                description='{pin_count}-pin Dual Flat No-Lead package (DFN), '
-                            'Pitch: {pitch:.2f} mm\n'
-                            'Nominal width: {width:.2f} mm\n'
-                            'Nominal length: {length:.2f} mm\n'
-                            'Height: {height:.2f}mm',
-                pkgcat='88cbb15c-2b69-4612-8764-c5d323f88f13',
-                keywords='dfn,dual flat no-leads',
-                config=config,
-                make_exposed=make_exposed,
-                generate_3d_models=generate_3d_models,
-                create_date=config.create_date,
-            )
-            if name not in generated_packages:
-                generated_packages.append(name)
-            else:
-                print("Duplicate name found: {}".format(name))
-
-    save_cache(uuid_cache_file, uuid_cache)
+                exposed_settings = [False]
+
+            for make_exposed in exposed_settings:
+                name = generate_pkg(
+                    author='Hannes Badertscher',
+                    name='DFN{pitch}P{length}X{width}X{height}-{pin_count}',
+                    description='{pin_count}-pin Dual Flat No-Lead package (DFN), '
+                                'Pitch: {pitch:.2f} mm\n'
+                                'Nominal width: {width:.2f} mm\n'
+                                'Nominal length: {length:.2f} mm\n'
+                                'Height: {height:.2f}mm',
+                    pkgcat='88cbb15c-2b69-4612-8764-c5d323f88f13',
+                    keywords='dfn,dual flat no-leads',
+                    config=config,
+                    make_exposed=make_exposed,
+                    generate_3d_models=generate_3d_models,
+                    create_date=config.create_date,
+                )
+                if name not in generated_packages:
+                    generated_packages.append(name)
+                else:
+                    print("Duplicate name found: {}".format(name))
+    finally:
+        save_cache(uuid_cache_file, uuid_cache)
@@ -157,13 +157,14 @@ Only some variants are listed.
 +----+-------------+-----------+------------+------------------+
 
 """
+import sys
 from os import path
 from uuid import uuid4
 
-from typing import Iterable, Optional, Tuple
+from typing import Iterable, List, Optional, Tuple
 
 from common import format_ipc_dimension as ipc
-from common import init_cache, now, save_cache
+from common import get_sources_mtime, get_y, init_cache, is_up_to_date, now, save_cache, serialize_parallel
 from entities.common import (
     Align, Angle, Author, Category, Circle, Created, Deprecated, Description, Diameter, Fill, GeneratedBy, GrabArea,
     Height, Keywords, Layer, Name, Polygon, Position, Position3D, Rotation, Rotation3D, Value, Version, Vertex, Width
@@ -187,6 +188,24 @@ body_hole_offset = 0.4  # Distance between outer body edge and pads hole center
 outline_hole_offset = 0.4  # Distance between package outline and pads hole center
 courtyard_excess = 0.4
 
+# Attributes shared by all package texts
+pkg_text_attrs = {
+    'height': Height(pkg_text_height),
+    'stroke_width': StrokeWidth(0.2),
+    'letter_spacing': LetterSpacing.AUTO,
+    'line_spacing': LineSpacing.AUTO,
+    'rotation': Rotation(0.0),
+    'auto_rotate': AutoRotate(True),
+    'mirror': Mirror(False),
+}
+
+
+# If enabled (with "--incremental"), packages whose files are newer than all
+# sources of this generator are not generated again. The UUID cache is not a
+# source since existing UUIDs never change.
+incremental = False
+sources_mtime = 0.0  # Only determined if enabled
+
 
 # Initialize UUID cache
 uuid_cache_file = 'uuid_cache_dip.csv'
@@ -208,27 +227,10 @@ def uuid(category: str, width: str, variant: str, identifier: str) -> str:
             For example 'pad-1' or 'pin-13'.
     """
     key = '{}-{}-{}-{}'.format(category, width, variant, identifier).lower().replace(' ', '~')
-    if key not in uuid_cache:
-        uuid_cache[key] = str(uuid4())
-    return uuid_cache[key]
-
-
-def get_y(pin_number: int, pin_count: int, spacing: float, grid_align: bool) -> float:
-    """
-    Return the y coordinate of the specified pin. Keep the pins grid aligned, if desired.
-
-    The pin number is 1 index based. Pin 1 is at the top. The middle pin will
-    be at or near 0.
-
-    """
-    if grid_align:
-        mid = float((pin_count + 1) // 2)
-    else:
-        mid = (pin_count + 1) / 2
-    y = -round(pin_number * spacing - mid * spacing, 2)
-    if y == -0.0:  # Returns true for 0.0 too, but that doesn't matter
-        return 0.0
-    return y
+    value = uuid_cache.get(key)
+    if value is None:
+        value = uuid_cache[key] = str(uuid4())
+    return value
 
 
 class DipConfig:
@@ -257,6 +259,8 @@ def generate_pkg(
     version: str,
 ) -> None:
     category = 'pkg'
+    progress: List[str] = []  # Written to stdout in one go at the end
+    packages: List[Package] = []
     for config in configs:
         pin_count = config.pin_count
         variant = '{}pin-D{:.1f}'.format(pin_count, drill_diameter)
@@ -278,6 +282,9 @@ def generate_pkg(
         H = ipc(config.height)
         Q = pin_count
         ipc_name = "DIP{}W{}P{:.0f}L{}H{}Q{}".format(DIP, W, P, L, H, Q)
+        if incremental and is_up_to_date(path.join('out', library, category, uuid_pkg, 'package.lp'), sources_mtime):
+            progress.append('{}: Package {} is up to date\n'.format(ipc_name, uuid_pkg))
+            continue
 
         # Description
         description = "{}-lead DIP (Dual In-Line) package".format(pin_count)
@@ -308,6 +315,10 @@ def generate_pkg(
         for p in range(1, pin_count + 1):
             package.add_pad(PackagePad(uuid_pads[p - 1], Name(str(p))))
 
+        # Pad y coordinates of the left row (the right row is mirrored), the
+        # same for all footprint variants
+        ys = [get_y(p, pin_count // 2, pitch, False) for p in range(1, pin_count // 2 + 1)]
+
         def add_footprint_variant(key: str, name: str, pad_size: Tuple[float, float]) -> None:
             uuid_footprint = _uuid('footprint-{}'.format(key))
             uuid_silkscreen_top = _uuid('polygon-silkscreen-{}'.format(key))
@@ -332,7 +343,7 @@ def generate_pkg(
             pad_x_offset = float(config.lead_span) / 2
             for p in range(1, pin_count // 2 + 1):
                 # Down on the left
-                y = get_y(p, pin_count // 2, pitch, False)
+                y = ys[p - 1]
                 footprint.add_pad(FootprintPad(
                     uuid_pads[p - 1],
                     ComponentSide.TOP,
@@ -351,7 +362,7 @@ def generate_pkg(
                 ))
             for p in range(1, pin_count // 2 + 1):
                 # Up on the right
-                y = -get_y(p, pin_count // 2, pitch, False)
+                y = -ys[p - 1]
                 footprint.add_pad(FootprintPad(
                     uuid_pads[p + pin_count // 2 - 1],
                     ComponentSide.TOP,
@@ -495,22 +506,13 @@ def generate_pkg(
 
             # Labels
             dy = config.body_length / 2 + line_width + pkg_text_offset
-            text_attrs = {
-                'height': Height(pkg_text_height),
-                'stroke_width': StrokeWidth(0.2),
-                'letter_spacing': LetterSpacing.AUTO,
-                'line_spacing': LineSpacing.AUTO,
-                'rotation': Rotation(0.0),
-                'auto_rotate': AutoRotate(True),
-                'mirror': Mirror(False),
-            }
             footprint.add_text(StrokeText(
                 uuid_text_name,
                 Layer('top_names'),
                 align=Align('center bottom'),
                 position=Position(0.0, dy),
                 value=Value('{{NAME}}'),
-                **text_attrs,  # type: ignore # (mypy cannot deal with kwargs)
+                **pkg_text_attrs,  # type: ignore # (mypy cannot deal with kwargs)
             ))
             footprint.add_text(StrokeText(
                 uuid_text_value,
@@ -518,7 +520,7 @@ def generate_pkg(
                 align=Align('center top'),
                 position=Position(0.0, -dy),
                 value=Value('{{VALUE}}'),
-                **text_attrs,  # type: ignore # (mypy cannot deal with kwargs)
+                **pkg_text_attrs,  # type: ignore # (mypy cannot deal with kwargs)
             ))
 
             # Approvals
@@ -531,43 +533,58 @@ def generate_pkg(
         add_footprint_variant('handsoldering', 'hand soldering', (2.54, 1.27))
         add_footprint_variant('compact', 'compact', (1.6, 1.6))
 
-        package.serialize(path.join('out', library, category))
-        print('{}: Wrote package {}'.format(ipc_name, uuid_pkg))
+        packages.append(package)
+        progress.append('{}: Wrote package {}\n'.format(ipc_name, uuid_pkg))
+
+    serialize_parallel(packages, path.join('out', library, category))
+    sys.stdout.write(''.join(progress))
 
 
 if __name__ == '__main__':
-    generate_pkg(
-        library='LibrePCB_Base.lplib',
-        author='Danilo B.',
-        configs=[
-            DipConfig(4, 4.58, 7.62, 5.33, None),
-            DipConfig(6, 7.12, 7.62, 5.33, None),
-            DipConfig(8, 9.65, 7.62, 5.33, None),
-            DipConfig(14, 19.05, 7.62, 5.33, 'JEDEC MS001 AA'),
-            DipConfig(16, 20.07, 7.62, 5.33, 'JEDEC MS001 AB'),
-            DipConfig(18, 22.86, 7.62, 5.33, 'JEDEC MS001 AC'),
-            DipConfig(20, 26.16, 7.62, 5.33, 'JEDEC MS001 AD'),
-            DipConfig(22, 29.34, 7.62, 5.33, 'JEDEC MS001 AE'),
-            DipConfig(24, 31.75, 7.62, 5.33, 'JEDEC MS001 AF'),
-            DipConfig(28, 35.69, 7.62, 5.33, 'JEDEC MS001 AG'),
-        ],
-        pkgcat='edc63ee6-ea87-495d-a6b9-54536fe8b1f9',
-        keywords='dip,pdip,cdip,cerdip,dual inline package',
-        create_date='2018-11-04T23:13:00Z',
-        version='0.2',
-    )
-    generate_pkg(
-        library='LibrePCB_Base.lplib',
-        author='Danilo B.',
-        configs=[
-            DipConfig(24, 31.75, 15.24, 5.33, None),
-            DipConfig(28, 37.40, 15.24, 5.33, None),
-            DipConfig(32, 42.04, 15.24, 5.33, None),
-            DipConfig(40, 52.32, 15.24, 5.33, None),
-        ],
-        pkgcat='edc63ee6-ea87-495d-a6b9-54536fe8b1f9',
-        keywords='dip,pdip,cdip,cerdip,dual inline package,wide',
-        create_date='2018-11-04T23:13:00Z',
-        version='0.2',
-    )
-    save_cache(uuid_cache_file, uuid_cache)
+    if '--help' in sys.argv or '-h' in sys.argv:
+        print(f'Usage: {sys.argv[0]} [--incremental]')
+        print()
+        print('Options:')
+        print('  --incremental  Skip packages which are newer than the generator sources')
+        sys.exit(1)
+
+    incremental = '--incremental' in sys.argv
+    if incremental:
+        sources_mtime = get_sources_mtime(__file__)
+    try:
+        generate_pkg(
+            library='LibrePCB_Base.lplib',
+            author='Danilo B.',
+            configs=[
+                DipConfig(4, 4.58, 7.62, 5.33, None),
+                DipConfig(6, 7.12, 7.62, 5.33, None),
+                DipConfig(8, 9.65, 7.62, 5.33, None),
+                DipConfig(14, 19.05, 7.62, 5.33, 'JEDEC MS001 AA'),
+                DipConfig(16, 20.07, 7.62, 5.33, 'JEDEC MS001 AB'),
+                DipConfig(18, 22.86, 7.62, 5.33, 'JEDEC MS001 AC'),
+                DipConfig(20, 26.16, 7.62, 5.33, 'JEDEC MS001 AD'),
+                DipConfig(22, 29.34, 7.62, 5.33, 'JEDEC MS001 AE'),
+                DipConfig(24, 31.75, 7.62, 5.33, 'JEDEC MS001 AF'),
+                DipConfig(28, 35.69, 7.62, 5.33, 'JEDEC MS001 AG'),
+            ],
+            pkgcat='edc63ee6-ea87-495d-a6b9-54536fe8b1f9',
+            keywords='dip,pdip,cdip,cerdip,dual inline package',
+            create_date='2018-11-04T23:13:00Z',
+            version='0.2',
+        )
+        generate_pkg(
+            library='LibrePCB_Base.lplib',
+            author='Danilo B.',
+            configs=[
+                DipConfig(24, 31.75, 15.24, 5.33, None),
+                DipConfig(28, 37.40, 15.24, 5.33, None),
+                DipConfig(32, 42.04, 15.24, 5.33, None),
+                DipConfig(40, 52.32, 15.24, 5.33, None),
+            ],
+            pkgcat='edc63ee6-ea87-495d-a6b9-54536fe8b1f9',
+            keywords='dip,pdip,cdip,cerdip,dual inline package,wide',
+            create_date='2018-11-04T23:13:00Z',
+            version='0.2',
+        )
+    finally:
+        save_cache(uuid_cache_file, uuid_cache)
@@ -34,9 +34,10 @@ uuid_cache = init_cache(uuid_cache_file)
 
 def uuid(category: str, full_name: str, identifier: str) -> str:
     key = '{}-{}-{}'.format(category, full_name, identifier).lower().replace(' ', '~')
-    if key not in uuid_cache:
-        uuid_cache[key] = str(uuid4())
-    return uuid_cache[key]
+    value = uuid_cache.get(key)
+    if value is None:
+        value = uuid_cache[key] = str(uuid4())
+    return value
 
 
 class DoConfig:
@@ -434,52 +435,53 @@ if __name__ == '__main__':
         warning = 'Note: Not generating 3D models unless the "--3d" argument is passed in!'
         print(f'\033[1;33m{warning}\033[0m')
 
-    configs = []
-
-    # body_length_nom (E1); body_width_nom (D); body_height_nom (A1)
-    # total_length_nom (E); total_height_nom (A)
-    # contact_length_min, contact_length_nom, contact_length_max (L); contact_width_min, contact_width_max (b)
-    # variant; common_name
-    configs.append(DoConfig(4.30, 3.60, 2.15,
-                            5.40, 2.30,
-                            0.75, 1.15, 1.60, 1.95, 2.20,
-                            'AA', 'SMB'))
-
-    configs.append(DoConfig(6.85, 5.90, 2.15,
-                            7.95, 2.30,
-                            0.75, 1.15, 1.60, 2.90, 3.20,
-                            'AB', 'SMC'))
-
-    configs.append(DoConfig(4.30, 2.60, 2.30,
-                            5.20, 2.40,
-                            0.75, 1.15, 1.60, 1.25, 1.65,
-                            'AC', 'SMA'))
-
-    configs.append(DoConfig(4.45, 2.60, 2.80,
-                            5.25, 2.95,
-                            0.75, 1.15, 1.60, 1.00, 1.70,
-                            'BA', 'GF1'))
-
-    for config in configs:
-        generate_pkg(
-            library='LibrePCB_Base.lplib',
-            author='murray',
-            config=config,
-            polarity=True,
-            generate_3d_models=generate_3d_models,
-            pkgcat='dcaa6b6c-0c55-43fd-a320-5dd74a2cdc85',
-            version='0.2',
-            create_date='2023-08-15T22:33:08Z',
-        )
-        generate_pkg(
-            library='LibrePCB_Base.lplib',
-            author='murray',
-            config=config,
-            polarity=False,
-            generate_3d_models=generate_3d_models,
-            pkgcat='dcaa6b6c-0c55-43fd-a320-5dd74a2cdc85',
-            version='0.2',
-            create_date='2023-08-15T22:33:08Z',
-        )
-
-    save_cache(uuid_cache_file, uuid_cache)
+    try:
+        configs = []
+
+        # body_length_nom (E1); body_width_nom (D); body_height_nom (A1)
+        # total_length_nom (E); total_height_nom (A)
+        # contact_length_min, contact_length_nom, contact_length_max (L); contact_width_min, contact_width_max (b)
+        # variant; common_name
+        configs.append(DoConfig(4.30, 3.60, 2.15,
+                                5.40, 2.30,
+                                0.75, 1.15, 1.60, 1.95, 2.20,
+                                'AA', 'SMB'))
+
+        configs.append(DoConfig(6.85, 5.90, 2.15,
+                                7.95, 2.30,
+                                0.75, 1.15, 1.60, 2.90, 3.20,
+                                'AB', 'SMC'))
+
+        configs.append(DoConfig(4.30, 2.60, 2.30,
+                                5.20, 2.40,
+                                0.75, 1.15, 1.60, 1.25, 1.65,
+                                'AC', 'SMA'))
+
+        configs.append(DoConfig(4.45, 2.60, 2.80,
+                                5.25, 2.95,
+                                0.75, 1.15, 1.60, 1.00, 1.70,
+                                'BA', 'GF1'))
+
+        for config in configs:
+            generate_pkg(
+                library='LibrePCB_Base.lplib',
+                author='murray',
+                config=config,
+                polarity=True,
+                generate_3d_models=generate_3d_models,
+                pkgcat='dcaa6b6c-0c55-43fd-a320-5dd74a2cdc85',
+                version='0.2',
+                create_date='2023-08-15T22:33:08Z',
+            )
+            generate_pkg(
+                library='LibrePCB_Base.lplib',
+                author='murray',
+                config=config,
+                polarity=False,
+                generate_3d_models=generate_3d_models,
+                pkgcat='dcaa6b6c-0c55-43fd-a320-5dd74a2cdc85',
+                version='0.2',
+                create_date='2023-08-15T22:33:08Z',
+            )
+    finally:
+        save_cache(uuid_cache_file, uuid_cache)
@@ -8,6 +8,7 @@ Implemented so far:
 - CNC Tech 3220-xx-0300-00 (1.27 mm pitch)
 
 """
+from functools import lru_cache
 from math import sqrt
 from os import path
 from uuid import uuid4
@@ -57,9 +58,10 @@ def uuid(category: str, variant: str, identifier: str) -> str:
             For example 'pad-1' or 'pin-13'.
     """
     key = '{}-{}-{}'.format(category, variant, identifier).lower().replace(' ', '~')
-    if key not in uuid_cache:
-        uuid_cache[key] = str(uuid4())
-    return uuid_cache[key]
+    value = uuid_cache.get(key)
+    if value is None:
+        value = uuid_cache[key] = str(uuid4())
+    return value
 
 
 class Coord:
@@ -76,6 +78,7 @@ class Coord:
             self.y = y
 
 
+@lru_cache(maxsize=None)  # The returned object is shared and must not be modified
 def get_coords(pin_number: int, pin_count: int, row_count: int, pitch: float, row_spacing: float) -> Coord:
     """
     Return the x/y coordinates of the specified pin.
@@ -213,10 +216,10 @@ def generate_pkg(config: Config) -> None:
     )
     package.add_footprint(footprint)
 
-    # Pads
+    # Pads and legs
+    x_offset_abs = config.pad_size[0] / 2 + config.pad_x_offset
     for i in range(1, config.pin_count + 1):
         coords = get_coords(i, config.pin_count, 2, config.pitch, config.row_spacing)
-        x_offset_abs = config.pad_size[0] / 2 + config.pad_x_offset
         x_offset = -x_offset_abs if i % 2 == 1 else x_offset_abs
         uuid_pad = uuid_pads[i - 1]
         footprint.add_pad(FootprintPad(
@@ -235,11 +238,7 @@ def generate_pkg(config: Config) -> None:
             holes=[],
         ))
 
-    # Legs on documentation layer
-    for i in range(1, config.pin_count + 1):
-        coords = get_coords(i, config.pin_count, 2, config.pitch, config.row_spacing)
-        x_offset_abs = config.pad_size[0] / 2 + config.pad_x_offset
-        x_offset = -x_offset_abs if i % 2 == 1 else x_offset_abs
+        # Leg on documentation layer
         sign = 1 if coords.x > 0 else -1
         footprint.add_polygon(Polygon(
             uuid=uuid_leads[i - 1],
@@ -474,91 +473,92 @@ def generate_dev(config: Config) -> None:
 
 
 if __name__ == '__main__':
-    # CNC Tech
-    configs = \
-        [Config(
-            library='CNC_Tech.lplib',
-            identifier='cnctech-3220-{pin_count}-0300',
-            pkg_name='CNCTECH_3220-{pin_count:02}-0300-XX',
-            pkg_author='Danilo Bargen',
-            pkg_version='0.2',
-            pkg_create_date='2019-07-09T21:31:21Z',
-            pkg_categories=['92186130-e1a4-4a82-8ce9-88f4aa854195', 'e4d3a6bf-af32-48a2-b427-5e794bed949a'],
-            dev_name='CNC Tech 3220-{pin_count:02}-0300',
-            dev_author='U. Bruhin',
-            dev_version='0.2',
-            dev_create_date='2019-10-19T10:11:49Z',
-            description='{pin_count}-pin 1.27mm pitch SMD IDC box header by CNC Tech.',
-            keywords='cnc tech,idc,header,male,box header,smd,3220,1.27mm',
-            pitch=1.27,
-            row_spacing=1.27,
-            pad_size=(2.4, 0.76),
-            pad_x_offset=0.115,
-            body_offset_x=1.915,
-            body_offset_y=3.785,
-            body_gap=2.35,
-            lead_width=0.4,
-            lead_span=5.5,
-            pin_count=pc,
-            parts_manufacturer='CNC Tech',
-            parts_mpn=['3220-{pin_count:02}-0300-00', '3220-{pin_count:02}-0300-00-TR'],
-        ) for pc in [10, 14, 16, 20, 26, 30, 34, 40, 50, 60]] + \
-        [Config(
-            library='CNC_Tech.lplib',
-            identifier='cnctech-3120-{pin_count}-0300',
-            pkg_name='CNCTECH_3120-{pin_count:02}-0300-XX',
-            pkg_author='Danilo Bargen',
-            pkg_version='0.2',
-            pkg_create_date='2019-07-09T21:31:21Z',
-            pkg_categories=['92186130-e1a4-4a82-8ce9-88f4aa854195', 'e4d3a6bf-af32-48a2-b427-5e794bed949a'],
-            dev_name='CNC Tech 3120-{pin_count:02}-0300',
-            dev_author='U. Bruhin',
-            dev_version='0.2',
-            dev_create_date='2023-08-29T17:06:05Z',
-            description='{pin_count}-pin 2.00mm pitch SMD IDC box header by CNC Tech.',
-            keywords='cnc tech,idc,header,male,box header,smd,3120,2.00mm',
-            pitch=2.0,
-            row_spacing=2.0,
-            pad_size=(3.45, 0.9),
-            pad_x_offset=-0.2,
-            body_offset_x=1.75,
-            body_offset_y=4.65,
-            body_gap=3.7,
-            lead_width=0.5,
-            lead_span=7.5,
-            pin_count=pc,
-            parts_manufacturer='CNC Tech',
-            parts_mpn=['3120-{pin_count:02}-0300-00'],  # No '-TR' variant(?)
-        ) for pc in [6, 8, 10, 12, 14, 16, 18, 20, 24, 26, 30, 34, 40, 44, 50, 60, 64]] + \
-        [Config(
-            library='CNC_Tech.lplib',
-            identifier='cnctech-3020-{pin_count}-0300',
-            pkg_name='CNCTECH_3020-{pin_count:02}-0300-XX',
-            pkg_author='Danilo Bargen',
-            pkg_version='0.2',
-            pkg_create_date='2019-07-09T21:31:21Z',
-            pkg_categories=['92186130-e1a4-4a82-8ce9-88f4aa854195', 'e4d3a6bf-af32-48a2-b427-5e794bed949a'],
-            dev_name='CNC Tech 3020-{pin_count:02}-0300',
-            dev_author='U. Bruhin',
-            dev_version='0.2',
-            dev_create_date='2023-08-29T17:06:05Z',
-            description='{pin_count}-pin 2.54mm pitch SMD IDC box header by CNC Tech.',
-            keywords='cnc tech,idc,header,male,box header,smd,3020,2.54mm',
-            pitch=2.54,
-            row_spacing=2.54,
-            pad_size=(4.8, 0.9),
-            pad_x_offset=-0.42,
-            body_offset_x=3.13,
-            body_offset_y=5.08,
-            body_gap=5.08,
-            lead_width=0.64,
-            lead_span=10.2,
-            pin_count=pc,
-            parts_manufacturer='CNC Tech',
-            parts_mpn=['3020-{pin_count:02}-0300-00', '3020-{pin_count:02}-0300-00-TR'],
-        ) for pc in [6, 8, 10, 12, 14, 16, 18, 20, 22, 24, 26, 28, 30, 32, 34, 36, 40, 44, 50, 60, 64]]
-    for config in configs:
-        generate_pkg(config=config)
-        generate_dev(config=config)
-
-    save_cache(uuid_cache_file, uuid_cache)
+    try:
+        # CNC Tech
+        configs = \
+            [Config(
+                library='CNC_Tech.lplib',
+                identifier='cnctech-3220-{pin_count}-0300',
+                pkg_name='CNCTECH_3220-{pin_count:02}-0300-XX',
+                pkg_author='Danilo Bargen',
+                pkg_version='0.2',
+                pkg_create_date='2019-07-09T21:31:21Z',
+                pkg_categories=['92186130-e1a4-4a82-8ce9-88f4aa854195', 'e4d3a6bf-af32-48a2-b427-5e794bed949a'],
+                dev_name='CNC Tech 3220-{pin_count:02}-0300',
+                dev_author='U. Bruhin',
+                dev_version='0.2',
+                dev_create_date='2019-10-19T10:11:49Z',
+                description='{pin_count}-pin 1.27mm pitch SMD IDC box header by CNC Tech.',
+                keywords='cnc tech,idc,header,male,box header,smd,3220,1.27mm',
+                pitch=1.27,
+                row_spacing=1.27,
+                pad_size=(2.4, 0.76),
+                pad_x_offset=0.115,
+                body_offset_x=1.915,
+                body_offset_y=3.785,
+                body_gap=2.35,
+                lead_width=0.4,
+                lead_span=5.5,
+                pin_count=pc,
+                parts_manufacturer='CNC Tech',
+                parts_mpn=['3220-{pin_count:02}-0300-00', '3220-{pin_count:02}-0300-00-TR'],
+            ) for pc in [10, 14, 16, 20, 26, 30, 34, 40, 50, 60]] + \
+            [Config(
+                library='CNC_Tech.lplib',
+                identifier='cnctech-3120-{pin_count}-0300',
+                pkg_name='CNCTECH_3120-{pin_count:02}-0300-XX',
+                pkg_author='Danilo Bargen',
+                pkg_version='0.2',
+                pkg_create_date='2019-07-09T21:31:21Z',
+                pkg_categories=['92186130-e1a4-4a82-8ce9-88f4aa854195', 'e4d3a6bf-af32-48a2-b427-5e794bed949a'],
+                dev_name='CNC Tech 3120-{pin_count:02}-0300',
+                dev_author='U. Bruhin',
+                dev_version='0.2',
+                dev_create_date='2023-08-29T17:06:05Z',
+                description='{pin_count}-pin 2.00mm pitch SMD IDC box header by CNC Tech.',
+                keywords='cnc tech,idc,header,male,box header,smd,3120,2.00mm',
+                pitch=2.0,
+                row_spacing=2.0,
+                pad_size=(3.45, 0.9),
+                pad_x_offset=-0.2,
+                body_offset_x=1.75,
+                body_offset_y=4.65,
+                body_gap=3.7,
+                lead_width=0.5,
+                lead_span=7.5,
+                pin_count=pc,
+                parts_manufacturer='CNC Tech',
+                parts_mpn=['3120-{pin_count:02}-0300-00'],  # No '-TR' variant(?)
+            ) for pc in [6, 8, 10, 12, 14, 16, 18, 20, 24, 26, 30, 34, 40, 44, 50, 60, 64]] + \
+            [Config(
+                library='CNC_Tech.lplib',
+                identifier='cnctech-3020-{pin_count}-0300',
+                pkg_name='CNCTECH_3020-{pin_count:02}-0300-XX',
+                pkg_author='Danilo Bargen',
+                pkg_version='0.2',
+                pkg_create_date='2019-07-09T21:31:21Z',
+                pkg_categories=['92186130-e1a4-4a82-8ce9-88f4aa854195', 'e4d3a6bf-af32-48a2-b427-5e794bed949a'],
+                dev_name='CNC Tech 3020-{pin_count:02}-0300',
+                dev_author='U. Bruhin',
+                dev_version='0.2',
+                dev_create_date='2023-08-29T17:06:05Z',
+                description='{pin_count}-pin 2.54mm pitch SMD IDC box header by CNC Tech.',
+                keywords='cnc tech,idc,header,male,box header,smd,3020,2.54mm',
+                pitch=2.54,
+                row_spacing=2.54,
+                pad_size=(4.8, 0.9),
+                pad_x_offset=-0.42,
+                body_offset_x=3.13,
+                body_offset_y=5.08,
+                body_gap=5.08,
+                lead_width=0.64,
+                lead_span=10.2,
+                pin_count=pc,
+                parts_manufacturer='CNC Tech',
+                parts_mpn=['3020-{pin_count:02}-0300-00', '3020-{pin_count:02}-0300-00-TR'],
+            ) for pc in [6, 8, 10, 12, 14, 16, 18, 20, 22, 24, 26, 28, 30, 32, 34, 36, 40, 44, 50, 60, 64]]
+        for config in configs:
+            generate_pkg(config=config)
+            generate_dev(config=config)
+    finally:
+        save_cache(uuid_cache_file, uuid_cache)
@@ -6,6 +6,7 @@
 
 """
 import math
+from functools import lru_cache
 from os import path
 from uuid import uuid4
 
@@ -109,11 +110,13 @@ def variant(mounting_variant: str, circuits: int) -> str:
     return f"{mounting_variant}{circuits}"
 
 
+@lru_cache(maxsize=None)  # Package pad uuids are looked up again for footprint and device
 def uuid(category: str, kind: str, variant: str, identifier: str) -> str:
     key = '{}-{}-{}-{}'.format(category, kind, variant, identifier).lower().replace(' ', '~')
-    if key not in uuid_cache_jst:
-        uuid_cache_jst[key] = str(uuid4())
-    return uuid_cache_jst[key]
+    value = uuid_cache_jst.get(key)
+    if value is None:
+        value = uuid_cache_jst[key] = str(uuid4())
+    return value
 
 
 def connector_uuid(category: str, connector: Connector, identifier: str) -> str:
@@ -706,79 +709,80 @@ def generate_jst(
 
 if __name__ == "__main__":
 
-    create_date = '2024-05-03T17:19:09Z'
-
-    # units in mm
-    generate_jst(
-        library="JST.lplib",
-        pkg_type="SH",
-        pkg_subtype="SM",
-        description="Header SR 1.0 SMT side entry, 1mm pitch",
-        keywords="connector,jst",  # taken from https://jst.de/product-family/show/65/sh
-        author="nbes4",
-        generated_by="",  # leave empty, not used yet
-        pkgcats=["e4d3a6bf-af32-48a2-b427-5e794bed949a", "3f0f5992-67fd-4ce9-a510-7679870d6271"],  # Pin Headers (male), JST
-        devcat="4a4e3c72-94fb-45f9-a6d8-122d2af16fb1",  # Pin Headers (male)
-        version="0.2",
-        footprint_spec=FootprintSpecification(
-            pad_width=0.6,
-            pad_height=1.55,
-            lead_width=0.6,
-            lead_height=0.7,
-            support_pad_width=1.2,
-            support_pad_height=1.8,
-            # the smallest SH SM connector is 4 mm and has 2 pins,
-            # for every additional pin the width increases by 1 mm
-            smallest_header_width=4,
-            header_width_increase_per_pin=1,
-            header_height=4.25,
-            header_y=0.2,
-            pad_distance_mid_to_mid_x=1,
-            pad_first_x_center=1.2 + 0.4 + (0.6 / 2),
-            pad_first_y_center=4 + (1.55 / 2),
-        ),
-        available_circuits=[2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 20],
-        suction_cap_variant_available=False,
-        device_naming_pattern="SM{}B-SRSS-TB",
-        create_date=create_date,
-        reverse_pad_order=True,
-        rotation=270
-    )
-
-    generate_jst(
-        library="JST.lplib",
-        pkg_type="SH",
-        pkg_subtype="BM",
-        description="Header SR 1.0 SMT top entry, 1mm pitch",
-        keywords="connector,jst",
-        author="nbes4",
-        generated_by="",  # leave empty, not used yet
-        pkgcats=["e4d3a6bf-af32-48a2-b427-5e794bed949a", "3f0f5992-67fd-4ce9-a510-7679870d6271"],  # Pin Headers (male), JST
-        devcat="4a4e3c72-94fb-45f9-a6d8-122d2af16fb1",  # Pin Headers (male)
-        version="0.2",
-        footprint_spec=FootprintSpecification(
-            pad_width=0.6,
-            pad_height=1.55,
-            lead_width=0.6,
-            lead_height=0.7,
-            support_pad_width=1.2,
-            support_pad_height=1.8,
-            # the smallest SH BM connector is 4 mm and has 2 pins,
-            # for every additional pin the width increases by 1 mm
-            smallest_header_width=4,
-            header_width_increase_per_pin=1,
-            header_height=2.9,
-            header_y=0.2,
-            pad_distance_mid_to_mid_x=1,
-            pad_first_x_center=1.2 + 0.4 + (0.6 / 2),
-            pad_first_y_center=2.65 + (1.55 / 2),
-        ),
-        available_circuits=[2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15],
-        suction_cap_variant_available=True,  # see https://github.com/LibrePCB/librepcb-parts-generator/pull/127#issuecomment-2079003507
-        device_naming_pattern="BM{}B-SRSS-TB",
-        create_date=create_date,
-        reverse_pad_order=False,
-        rotation=90
-    )
+    try:
+        create_date = '2024-05-03T17:19:09Z'
+
+        # units in mm
+        generate_jst(
+            library="JST.lplib",
+            pkg_type="SH",
+            pkg_subtype="SM",
+            description="Header SR 1.0 SMT side entry, 1mm pitch",
+            keywords="connector,jst",  # taken from https://jst.de/product-family/show/65/sh
+            author="nbes4",
+            generated_by="",  # leave empty, not used yet
+            pkgcats=["e4d3a6bf-af32-48a2-b427-5e794bed949a", "3f0f5992-67fd-4ce9-a510-7679870d6271"],  # Pin Headers (male), JST
+            devcat="4a4e3c72-94fb-45f9-a6d8-122d2af16fb1",  # Pin Headers (male)
+            version="0.2",
+            footprint_spec=FootprintSpecification(
+                pad_width=0.6,
+                pad_height=1.55,
+                lead_width=0.6,
+                lead_height=0.7,
+                support_pad_width=1.2,
+                support_pad_height=1.8,
+                # the smallest SH SM connector is 4 mm and has 2 pins,
+                # for every additional pin the width increases by 1 mm
+                smallest_header_width=4,
+                header_width_increase_per_pin=1,
+                header_height=4.25,
+                header_y=0.2,
+                pad_distance_mid_to_mid_x=1,
+                pad_first_x_center=1.2 + 0.4 + (0.6 / 2),
+                pad_first_y_center=4 + (1.55 / 2),
+            ),
+            available_circuits=[2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 20],
+            suction_cap_variant_available=False,
+            device_naming_pattern="SM{}B-SRSS-TB",
+            create_date=create_date,
+            reverse_pad_order=True,
+            rotation=270
+        )
 
-    save_cache(uuid_cache_jst_file, uuid_cache_jst)
+        generate_jst(
+            library="JST.lplib",
+            pkg_type="SH",
+            pkg_subtype="BM",
+            description="Header SR 1.0 SMT top entry, 1mm pitch",
+            keywords="connector,jst",
+            author="nbes4",
+            generated_by="",  # leave empty, not used yet
+            pkgcats=["e4d3a6bf-af32-48a2-b427-5e794bed949a", "3f0f5992-67fd-4ce9-a510-7679870d6271"],  # Pin Headers (male), JST
+            devcat="4a4e3c72-94fb-45f9-a6d8-122d2af16fb1",  # Pin Headers (male)
+            version="0.2",
+            footprint_spec=FootprintSpecification(
+                pad_width=0.6,
+                pad_height=1.55,
+                lead_width=0.6,
+                lead_height=0.7,
+                support_pad_width=1.2,
+                support_pad_height=1.8,
+                # the smallest SH BM connector is 4 mm and has 2 pins,
+                # for every additional pin the width increases by 1 mm
+                smallest_header_width=4,
+                header_width_increase_per_pin=1,
+                header_height=2.9,
+                header_y=0.2,
+                pad_distance_mid_to_mid_x=1,
+                pad_first_x_center=1.2 + 0.4 + (0.6 / 2),
+                pad_first_y_center=2.65 + (1.55 / 2),
+            ),
+            available_circuits=[2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15],
+            suction_cap_variant_available=True,  # see https://github.com/LibrePCB/librepcb-parts-generator/pull/127#issuecomment-2079003507
+            device_naming_pattern="BM{}B-SRSS-TB",
+            create_date=create_date,
+            reverse_pad_order=False,
+            rotation=90
+        )
+    finally:
+        save_cache(uuid_cache_jst_file, uuid_cache_jst)
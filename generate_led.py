@@ -48,9 +48,10 @@ def uuid(category: str, full_name: str, identifier: str) -> str:
             For example 'pad-1' or 'pin-13'.
     """
     key = '{}-{}-{}'.format(category, full_name, identifier).lower().replace(' ', '~')
-    if key not in uuid_cache:
-        uuid_cache[key] = str(uuid4())
-    return uuid_cache[key]
+    value = uuid_cache.get(key)
+    if value is None:
+        value = uuid_cache[key] = str(uuid4())
+    return value
 
 
 class LedConfig:
@@ -684,7 +685,7 @@ def generate_dev(
 
         uuid_dev = _uuid('dev')
 
-        print('Generating {}: {}'.format(config.dev_name, uuid_dev))
+        print(f'Generating {config.dev_name}: {uuid_dev}')
 
         device = Device(
             uuid=uuid_dev,
@@ -725,48 +726,49 @@ if __name__ == '__main__':
         warning = 'Note: Not generating 3D models unless the "--3d" argument is passed in!'
         print(f'\033[1;33m{warning}\033[0m')
 
-    configs: List[LedConfig] = []
-
-    # Generic LEDs
-    #
-    # Commonly used LED dimensions were determined by looking at various LED
-    # datasheets. The bottom diameter, body height and standoff height vary
-    # between the many different LEDs since there's no standard and because
-    # the specified tolerances are huge (>1mm). However, for these generic
-    # packages we just use some average dimensions for simplicity. For exact
-    # dimensions, a separate package needs to be created for each LED model.
-    #
-    # Note: The standoff specifies the distance between the bottom of the
-    #       LED body and the surface of the PCB.
-    configs.append(LedConfig(3.00, 3.80, 2.54, 4.5, 1.0, False, 'Clear', (0.7, 0.7, 0.7, 0.5)))
-    configs.append(LedConfig(3.00, 3.80, 2.54, 4.5, 1.0, False, 'Green', (0, 0.8, 0, 0.5)))
-    configs.append(LedConfig(3.00, 3.80, 2.54, 4.5, 1.0, False, 'Red', (0.8, 0, 0, 0.5)))
-    configs.append(LedConfig(3.00, 3.80, 2.54, 4.5, 1.0, False, 'Yellow', (0.8, 0.8, 0, 0.5)))
-    configs.append(LedConfig(3.00, 3.80, 2.54, 4.5, 5.0, True, 'Clear', (0.7, 0.7, 0.7, 0.5)))
-    configs.append(LedConfig(5.00, 5.80, 2.54, 8.7, 1.0, False, 'Clear', (0.7, 0.7, 0.7, 0.5)))
-    configs.append(LedConfig(5.00, 5.80, 2.54, 8.7, 1.0, False, 'Green', (0, 0.8, 0, 0.5)))
-    configs.append(LedConfig(5.00, 5.80, 2.54, 8.7, 1.0, False, 'Red', (0.8, 0, 0, 0.5)))
-    configs.append(LedConfig(5.00, 5.80, 2.54, 8.7, 1.0, False, 'Yellow', (0.8, 0.8, 0, 0.5)))
-    configs.append(LedConfig(5.00, 5.80, 2.54, 8.7, 5.0, True, 'Clear', (0.7, 0.7, 0.7, 0.5)))
-
-    generate_pkg(
-        library='LibrePCB_Base.lplib',
-        author='Danilo B., U. Bruhin',
-        configs=configs,
-        pkgcat='9c36c4be-3582-4f27-ae00-4c1229f1e870',
-        keywords='led,tht',
-        version='0.2',
-        create_date='2022-02-26T00:06:03Z',
-        generate_3d_models=generate_3d_models,
-    )
-    generate_dev(
-        library='LibrePCB_Base.lplib',
-        author='U. Bruhin',
-        configs=configs,
-        cmpcat='70421345-ae1d-4fed-aa60-e7619524b97f',
-        keywords='led,tht',
-        version='0.1.1',
-        create_date='2022-08-31T11:18:33Z',
-    )
-
-    save_cache(uuid_cache_file, uuid_cache)
+    try:
+        configs: List[LedConfig] = []
+
+        # Generic LEDs
+        #
+        # Commonly used LED dimensions were determined by looking at various LED
+        # datasheets. The bottom diameter, body height and standoff height vary
+        # between the many different LEDs since there's no standard and because
+        # the specified tolerances are huge (>1mm). However, for these generic
+        # packages we just use some average dimensions for simplicity. For exact
+        # dimensions, a separate package needs to be created for each LED model.
+        #
+        # Note: The standoff specifies the distance between the bottom of the
+        #       LED body and the surface of the PCB.
+        configs.append(LedConfig(3.00, 3.80, 2.54, 4.5, 1.0, False, 'Clear', (0.7, 0.7, 0.7, 0.5)))
+        configs.append(LedConfig(3.00, 3.80, 2.54, 4.5, 1.0, False, 'Green', (0, 0.8, 0, 0.5)))
+        configs.append(LedConfig(3.00, 3.80, 2.54, 4.5, 1.0, False, 'Red', (0.8, 0, 0, 0.5)))
+        configs.append(LedConfig(3.00, 3.80, 2.54, 4.5, 1.0, False, 'Yellow', (0.8, 0.8, 0, 0.5)))
+        configs.append(LedConfig(3.00, 3.80, 2.54, 4.5, 5.0, True, 'Clear', (0.7, 0.7, 0.7, 0.5)))
+        configs.append(LedConfig(5.00, 5.80, 2.54, 8.7, 1.0, False, 'Clear', (0.7, 0.7, 0.7, 0.5)))
+        configs.append(LedConfig(5.00, 5.80, 2.54, 8.7, 1.0, False, 'Green', (0, 0.8, 0, 0.5)))
+        configs.append(LedConfig(5.00, 5.80, 2.54, 8.7, 1.0, False, 'Red', (0.8, 0, 0, 0.5)))
+        configs.append(LedConfig(5.00, 5.80, 2.54, 8.7, 1.0, False, 'Yellow', (0.8, 0.8, 0, 0.5)))
+        configs.append(LedConfig(5.00, 5.80, 2.54, 8.7, 5.0, True, 'Clear', (0.7, 0.7, 0.7, 0.5)))
+
+        generate_pkg(
+            library='LibrePCB_Base.lplib',
+            author='Danilo B., U. Bruhin',
+            configs=configs,
+            pkgcat='9c36c4be-3582-4f27-ae00-4c1229f1e870',
+            keywords='led,tht',
+            version='0.2',
+            create_date='2022-02-26T00:06:03Z',
+            generate_3d_models=generate_3d_models,
+        )
+        generate_dev(
+            library='LibrePCB_Base.lplib',
+            author='U. Bruhin',
+            configs=configs,
+            cmpcat='70421345-ae1d-4fed-aa60-e7619524b97f',
+            keywords='led,tht',
+            version='0.1.1',
+            create_date='2022-08-31T11:18:33Z',
+        )
+    finally:
+        save_cache(uuid_cache_file, uuid_cache)
@@ -1,12 +1,12 @@
 """
 Generate dual mosfet devices.
 """
-from os import makedirs, path
+from os import path
 from uuid import uuid4
 
 from typing import Any, Dict, Iterable, List, Optional
 
-from common import init_cache, now, save_cache
+from common import init_cache, now, save_cache, write_element_files
 
 generator = 'librepcb-parts-generator (generate_mosfet_dual.py)'
 
@@ -28,9 +28,10 @@ def uuid(category: str, full_name: str, identifier: str) -> str:
             For example 'pad-1' or 'pin-13'.
     """
     key = '{}-{}-{}'.format(category, full_name, identifier).lower().replace(' ', '~')
-    if key not in uuid_cache:
-        uuid_cache[key] = str(uuid4())
-    return uuid_cache[key]
+    value = uuid_cache.get(key)
+    if value is None:
+        value = uuid_cache[key] = str(uuid4())
+    return value
 
 
 class PackageConfig:
@@ -111,8 +112,6 @@ def generate_dev(
     configs: Iterable[FetConfig],
 ) -> None:
     for fet_config in configs:
-        lines = []
-
         fmt_params: Dict[str, Any] = {
             'name': fet_config.name,
             'max_voltage': fet_config.max_voltage,
@@ -143,116 +142,118 @@ def generate_dev(
             datasheet = ''
 
         print('Generating dev "{}": {}'.format(full_name, uuid_dev))
-        lines.append('(librepcb_device {}'.format(uuid_dev))
-        lines.append(' (name "{}")'.format(full_name))
-        lines.append(' (description "{}\\n\\n{}Generated with {}")'.format(full_desc, datasheet, generator))
-        lines.append(' (keywords "{}")'.format(keywords))
-        lines.append(' (author "{}")'.format(author))
-        lines.append(' (version "{}")'.format(version))
-        lines.append(' (created {})'.format(create_date or now()))
-        lines.append(' (deprecated false)')
-        lines.append(' (category {})'.format(uuid_cat))
-        lines.append(' (component {})'.format(uuid_cmp))
-        lines.append(' (package {})'.format(uuid_pkg))
-        pad_signal_mappings = []
-        for (pad, signal) in zip(uuid_pads, uuid_signals):
-            pad_signal_mappings.append(' (pad {} (signal {}))'.format(pad, signal))
-        lines.extend(sorted(pad_signal_mappings))
-        lines.append(')')
+        pad_signal_mappings = [f' (pad {pad} (signal {signal}))\n' for (pad, signal) in zip(uuid_pads, uuid_signals)]
+        pad_signal_mappings.sort()
+        content = ''.join((
+            f'(librepcb_device {uuid_dev}\n',
+            f' (name "{full_name}")\n',
+            f' (description "{full_desc}\\n\\n{datasheet}Generated with {generator}")\n',
+            f' (keywords "{keywords}")\n',
+            f' (author "{author}")\n',
+            f' (version "{version}")\n',
+            f' (created {create_date or now()})\n',
+            ' (deprecated false)\n',
+            f' (category {uuid_cat})\n',
+            f' (component {uuid_cmp})\n',
+            f' (package {uuid_pkg})\n',
+            *pad_signal_mappings,
+            ')\n',
+        ))
 
-        dev_dir_path = path.join('out', library, 'dev', uuid_dev)
-        if not (path.exists(dev_dir_path) and path.isdir(dev_dir_path)):
-            makedirs(dev_dir_path)
-        with open(path.join(dev_dir_path, '.librepcb-dev'), 'w') as f:
-            f.write('0.1\n')
-        with open(path.join(dev_dir_path, 'device.lp'), 'w') as f:
-            f.write('\n'.join(lines))
-            f.write('\n')
+        write_element_files(
+            path.join('out', library, 'dev', uuid_dev),
+            '.librepcb-dev',
+            b'0.1\n',
+            'device.lp',
+            content.encode('utf-8'),
+        )
 
 
 if __name__ == '__main__':
-    # Diodes Incorporated
-    generate_dev(
-        library='Diodes_Incorporated.lplib',
-        name='{name}',
-        author='Danilo B.',
-        description='Diodes Incorporated {name} Dual MOSFET N/P-Channel {max_voltage}V.',
-        version='0.1',
-        keywords='mosfet,p-channel,p-fet,n-channel,n-fet,dual',
-        create_date='2019-02-04T20:23:03Z',
-        uuid_cat='e9663545-80dd-4658-9357-d4ef62e55168',
-        uuid_cmp='9d043413-9574-4727-af3a-21c5623cffae',
-        configs=[
-            # SOIC127P600X175-8
-            FetConfig('DMC2020USD', 20, 'SOIC127P600X175-8', [
-                'sn', 'gn', 'sp', 'gp', 'dp', 'dp', 'dn', 'dn',
-            ], 'https://www.diodes.com/assets/Datasheets/DMC2020USD.pdf'),
-            FetConfig('DMC3016LSD', 30, 'SOIC127P600X175-8', [
-                'sn', 'gn', 'sp', 'gp', 'dp', 'dp', 'dn', 'dn',
-            ], 'https://www.diodes.com/assets/Datasheets/DMC3016LSD.pdf'),
-            FetConfig('DMC3021LSD[Q]', 30, 'SOIC127P600X175-8', [
-                'sn', 'gn', 'sp', 'gp', 'dp', 'dp', 'dn', 'dn',
-            ], [
-                'https://www.diodes.com/assets/Datasheets/ds32152.pdf',
-                'https://www.diodes.com/assets/Datasheets/DMC3021LSDQ.pdf',
-            ]),
-            FetConfig('DMC3025LSD[Q]', 30, 'SOIC127P600X175-8', [
-                'sn', 'gn', 'sp', 'gp', 'dp', 'dp', 'dn', 'dn',
-            ], [
-                'https://www.diodes.com/assets/Datasheets/DMC3025LSD.pdf',
-                'https://www.diodes.com/assets/Datasheets/DMC3025LSDQ.pdf',
-            ]),
-            FetConfig('DMC3028LSD[Q[X]]', 30, 'SOIC127P600X175-8', [
-                'sn', 'gn', 'sp', 'gp', 'dp', 'dp', 'dn', 'dn',
-            ], [
-                'https://www.diodes.com/assets/Datasheets/DMC3028LSD.pdf',
-                'https://www.diodes.com/assets/Datasheets/DMC3028LSDX.pdf',
-                'https://www.diodes.com/assets/Datasheets/DMC3028LSDXQ.pdf',
-            ]),
-            FetConfig('DMC3032LSD', 30, 'SOIC127P600X175-8', [
-                'sn', 'gn', 'sp', 'gp', 'dp', 'dp', 'dn', 'dn',
-            ], 'https://www.diodes.com/assets/Datasheets/ds32153.pdf'),
-            FetConfig('DMC4015SSD', 40, 'SOIC127P600X175-8', [
-                'sn', 'gn', 'sp', 'gp', 'dp', 'dp', 'dn', 'dn',
-            ], 'https://www.diodes.com/assets/Datasheets/DMC4015SSD.pdf'),
-            FetConfig('DMC4028SSD', 40, 'SOIC127P600X175-8', [
-                'sn', 'gn', 'sp', 'gp', 'dp', 'dp', 'dn', 'dn',
-            ], 'https://www.diodes.com/assets/Datasheets/DMC4028SSD.pdf'),
-            FetConfig('DMC4029SSD', 40, 'SOIC127P600X175-8', [
-                'sn', 'gn', 'sp', 'gp', 'dp', 'dp', 'dn', 'dn',
-            ], 'https://www.diodes.com/assets/Datasheets/DMC4029SSD.pdf'),
-            FetConfig('DMC4040SSD[Q]', 40, 'SOIC127P600X175-8', [
-                'sn', 'gn', 'sp', 'gp', 'dp', 'dp', 'dn', 'dn',
-            ], [
-                'https://www.diodes.com/assets/Datasheets/ds32120.pdf',
-                'https://www.diodes.com/assets/Datasheets/DMC4040SSDQ.pdf',
-            ]),
-            FetConfig('DMC4047LSD', 40, 'SOIC127P600X175-8', [
-                'sn', 'gn', 'sp', 'gp', 'dp', 'dp', 'dn', 'dn',
-            ], 'https://www.diodes.com/assets/Datasheets/DMC4047LSD.pdf'),
-            FetConfig('DMC4050SSD[Q]', 40, 'SOIC127P600X175-8', [
-                'sn', 'gn', 'sp', 'gp', 'dp', 'dp', 'dn', 'dn',
-            ], 'https://www.diodes.com/assets/Datasheets/DS33310.pdf'),
-            FetConfig('DMC6040SSD[Q]', 60, 'SOIC127P600X175-8', [
-                'sn', 'gn', 'sp', 'gp', 'dp', 'dp', 'dn', 'dn',
-            ], [
-                'https://www.diodes.com/assets/Datasheets/DMC6040SSD.pdf',
-                'https://www.diodes.com/assets/Datasheets/DMC6040SSDQ.pdf',
-            ]),
+    try:
+        # Diodes Incorporated
+        generate_dev(
+            library='Diodes_Incorporated.lplib',
+            name='{name}',
+            author='Danilo B.',
+            description='Diodes Incorporated {name} Dual MOSFET N/P-Channel {max_voltage}V.',
+            version='0.1',
+            keywords='mosfet,p-channel,p-fet,n-channel,n-fet,dual',
+            create_date='2019-02-04T20:23:03Z',
+            uuid_cat='e9663545-80dd-4658-9357-d4ef62e55168',
+            uuid_cmp='9d043413-9574-4727-af3a-21c5623cffae',
+            configs=[
+                # SOIC127P600X175-8
+                FetConfig('DMC2020USD', 20, 'SOIC127P600X175-8', [
+                    'sn', 'gn', 'sp', 'gp', 'dp', 'dp', 'dn', 'dn',
+                ], 'https://www.diodes.com/assets/Datasheets/DMC2020USD.pdf'),
+                FetConfig('DMC3016LSD', 30, 'SOIC127P600X175-8', [
+                    'sn', 'gn', 'sp', 'gp', 'dp', 'dp', 'dn', 'dn',
+                ], 'https://www.diodes.com/assets/Datasheets/DMC3016LSD.pdf'),
+                FetConfig('DMC3021LSD[Q]', 30, 'SOIC127P600X175-8', [
+                    'sn', 'gn', 'sp', 'gp', 'dp', 'dp', 'dn', 'dn',
+                ], [
+                    'https://www.diodes.com/assets/Datasheets/ds32152.pdf',
+                    'https://www.diodes.com/assets/Datasheets/DMC3021LSDQ.pdf',
+                ]),
+                FetConfig('DMC3025LSD[Q]', 30, 'SOIC127P600X175-8', [
+                    'sn', 'gn', 'sp', 'gp', 'dp', 'dp', 'dn', 'dn',
+                ], [
+                    'https://www.diodes.com/assets/Datasheets/DMC3025LSD.pdf',
+                    'https://www.diodes.com/assets/Datasheets/DMC3025LSDQ.pdf',
+                ]),
+                FetConfig('DMC3028LSD[Q[X]]', 30, 'SOIC127P600X175-8', [
+                    'sn', 'gn', 'sp', 'gp', 'dp', 'dp', 'dn', 'dn',
+                ], [
+                    'https://www.diodes.com/assets/Datasheets/DMC3028LSD.pdf',
+                    'https://www.diodes.com/assets/Datasheets/DMC3028LSDX.pdf',
+                    'https://www.diodes.com/assets/Datasheets/DMC3028LSDXQ.pdf',
+                ]),
+                FetConfig('DMC3032LSD', 30, 'SOIC127P600X175-8', [
+                    'sn', 'gn', 'sp', 'gp', 'dp', 'dp', 'dn', 'dn',
+                ], 'https://www.diodes.com/assets/Datasheets/ds32153.pdf'),
+                FetConfig('DMC4015SSD', 40, 'SOIC127P600X175-8', [
+                    'sn', 'gn', 'sp', 'gp', 'dp', 'dp', 'dn', 'dn',
+                ], 'https://www.diodes.com/assets/Datasheets/DMC4015SSD.pdf'),
+                FetConfig('DMC4028SSD', 40, 'SOIC127P600X175-8', [
+                    'sn', 'gn', 'sp', 'gp', 'dp', 'dp', 'dn', 'dn',
+                ], 'https://www.diodes.com/assets/Datasheets/DMC4028SSD.pdf'),
+                FetConfig('DMC4029SSD', 40, 'SOIC127P600X175-8', [
+                    'sn', 'gn', 'sp', 'gp', 'dp', 'dp', 'dn', 'dn',
+                ], 'https://www.diodes.com/assets/Datasheets/DMC4029SSD.pdf'),
+                FetConfig('DMC4040SSD[Q]', 40, 'SOIC127P600X175-8', [
+                    'sn', 'gn', 'sp', 'gp', 'dp', 'dp', 'dn', 'dn',
+                ], [
+                    'https://www.diodes.com/assets/Datasheets/ds32120.pdf',
+                    'https://www.diodes.com/assets/Datasheets/DMC4040SSDQ.pdf',
+                ]),
+                FetConfig('DMC4047LSD', 40, 'SOIC127P600X175-8', [
+                    'sn', 'gn', 'sp', 'gp', 'dp', 'dp', 'dn', 'dn',
+                ], 'https://www.diodes.com/assets/Datasheets/DMC4047LSD.pdf'),
+                FetConfig('DMC4050SSD[Q]', 40, 'SOIC127P600X175-8', [
+                    'sn', 'gn', 'sp', 'gp', 'dp', 'dp', 'dn', 'dn',
+                ], 'https://www.diodes.com/assets/Datasheets/DS33310.pdf'),
+                FetConfig('DMC6040SSD[Q]', 60, 'SOIC127P600X175-8', [
+                    'sn', 'gn', 'sp', 'gp', 'dp', 'dp', 'dn', 'dn',
+                ], [
+                    'https://www.diodes.com/assets/Datasheets/DMC6040SSD.pdf',
+                    'https://www.diodes.com/assets/Datasheets/DMC6040SSDQ.pdf',
+                ]),
 
-            # SOT95P280X145-6
-            FetConfig('DMC2053UVT', 20, 'SOT95P280X145-6', ['gn', 'sp', 'gp', 'dp', 'sn', 'dn'],
-                      'https://www.diodes.com/assets/Datasheets/DMC2053UVT.pdf'),
-            FetConfig('DMC2057UVT', 20, 'SOT95P280X145-6', ['gn', 'sp', 'gp', 'dp', 'sn', 'dn'],
-                      'https://www.diodes.com/assets/Datasheets/DMC2057UVT2.pdf'),
-            FetConfig('DMC3071LVT', 30, 'SOT95P280X145-6', ['gn', 'sp', 'gp', 'dp', 'sn', 'dn'],
-                      'https://www.diodes.com/assets/Datasheets/DMC3071LVT.pdf'),
-            FetConfig('DMC3730UVT', 25, 'SOT95P280X145-6', ['gn', 'sp', 'gp', 'dp', 'sn', 'dn'],
-                      'https://www.diodes.com/assets/Datasheets/DMC3730UVT.pdf'),
-            FetConfig('DMG6601LVT', 30, 'SOT95P280X145-6', ['gn', 'sp', 'gp', 'dp', 'sn', 'dn'],
-                      'https://www.diodes.com/assets/Datasheets/DMG6601LVT.pdf'),
-            FetConfig('DMG6602SVTQ', 30, 'SOT95P280X145-6', ['gn', 'sp', 'gp', 'dp', 'sn', 'dn'],
-                      'https://www.diodes.com/assets/Datasheets/DMG6602SVTQ.pdf'),
-        ],
-    )
-    save_cache(uuid_cache_file, uuid_cache)
+                # SOT95P280X145-6
+                FetConfig('DMC2053UVT', 20, 'SOT95P280X145-6', ['gn', 'sp', 'gp', 'dp', 'sn', 'dn'],
+                          'https://www.diodes.com/assets/Datasheets/DMC2053UVT.pdf'),
+                FetConfig('DMC2057UVT', 20, 'SOT95P280X145-6', ['gn', 'sp', 'gp', 'dp', 'sn', 'dn'],
+                          'https://www.diodes.com/assets/Datasheets/DMC2057UVT2.pdf'),
+                FetConfig('DMC3071LVT', 30, 'SOT95P280X145-6', ['gn', 'sp', 'gp', 'dp', 'sn', 'dn'],
+                          'https://www.diodes.com/assets/Datasheets/DMC3071LVT.pdf'),
+                FetConfig('DMC3730UVT', 25, 'SOT95P280X145-6', ['gn', 'sp', 'gp', 'dp', 'sn', 'dn'],
+                          'https://www.diodes.com/assets/Datasheets/DMC3730UVT.pdf'),
+                FetConfig('DMG6601LVT', 30, 'SOT95P280X145-6', ['gn', 'sp', 'gp', 'dp', 'sn', 'dn'],
+                          'https://www.diodes.com/assets/Datasheets/DMG6601LVT.pdf'),
+                FetConfig('DMG6602SVTQ', 30, 'SOT95P280X145-6', ['gn', 'sp', 'gp', 'dp', 'sn', 'dn'],
+                          'https://www.diodes.com/assets/Datasheets/DMG6602SVTQ.pdf'),
+            ],
+        )
+    finally:
+        save_cache(uuid_cache_file, uuid_cache)
@@ -11,6 +11,7 @@ Relevant standards:
 import sys
 from collections import namedtuple
 from copy import deepcopy
+from functools import lru_cache
 from itertools import chain
 from os import path
 from uuid import uuid4
@@ -18,7 +19,7 @@ from uuid import uuid4
 from typing import Iterable, List, Optional
 
 from common import format_ipc_dimension as fd
-from common import init_cache, now, save_cache, sign
+from common import init_cache, now, save_cache, serialize_parallel, sign
 from entities.common import (
     Align, Angle, Author, Category, Circle, Created, Deprecated, Description, Diameter, Fill, GeneratedBy, GrabArea,
     Height, Keywords, Layer, Name, Polygon, Position, Position3D, Rotation, Rotation3D, Value, Version, Vertex, Width
@@ -254,9 +255,10 @@ def uuid(category: str, full_name: str, identifier: str) -> str:
             For example 'pad-1' or 'pin-13'.
     """
     key = '{}-{}-{}'.format(category, full_name, identifier).lower().replace(' ', '~')
-    if key not in uuid_cache:
-        uuid_cache[key] = str(uuid4())
-    return uuid_cache[key]
+    value = uuid_cache.get(key)
+    if value is None:
+        value = uuid_cache[key] = str(uuid4())
+    return value
 
 
 class Pad:
@@ -266,6 +268,7 @@ class Pad:
         self.orientation = orientation  # Either 'horizontal' or 'vertical'
 
 
+@lru_cache(maxsize=None)  # The lead positions are the same for all density levels
 def get_pad_coords(
     # The current pad number (1 index based)
     pad_number: int,
@@ -340,6 +343,7 @@ def generate_pkg(
     create_date: Optional[str],
 ) -> None:
     category = 'pkg'
+    packages: List[Package] = []
     for config in configs:
         full_name = config.ipc_name()
         full_description = config.description()
@@ -408,9 +412,9 @@ def generate_pkg(
             # Pads
             pad_width = config.lead_width + excess.side * 2
             pad_length = config.lead_contact_length + excess.heel + excess.toe
+            pad_center_offset_x = config.lead_span_x / 2 - pad_length / 2 + excess.toe
             for p in range(1, config.lead_count + 1):
                 pad_uuid = uuid_pads[p - 1]
-                pad_center_offset_x = config.lead_span_x / 2 - pad_length / 2 + excess.toe
                 pos = get_pad_coords(p, config.lead_count, config.pitch, pad_center_offset_x)
                 pad_rotation = 90.0 if pos.orientation == 'horizontal' else 0.0
                 footprint.add_pad(FootprintPad(
@@ -646,7 +650,9 @@ def generate_pkg(
         for footprint in package.footprints:
             footprint.add_3d_model(Footprint3DModel(uuid_3d))
 
-        package.serialize(path.join('out', library, category))
+        packages.append(package)
+
+    serialize_parallel(packages, path.join('out', library, category))
 
 
 def generate_3d(
@@ -743,14 +749,16 @@ if __name__ == '__main__':
         warning = 'Note: Not generating 3D models unless the "--3d" argument is passed in!'
         print(f'\033[1;33m{warning}\033[0m')
 
-    configs = list(chain.from_iterable(c.get_configs() for c in JEDEC_CONFIGS))
-    generate_pkg(
-        library='LibrePCB_Base.lplib',
-        author='Danilo B.',
-        configs=configs,
-        generate_3d_models=generate_3d_models,
-        pkgcat='3363b8b1-6fa8-4041-962e-5f839cfd86b7',
-        version='0.4',
-        create_date='2019-02-07T21:03:03Z',
-    )
-    save_cache(uuid_cache_file, uuid_cache)
+    try:
+        configs = list(chain.from_iterable(c.get_configs() for c in JEDEC_CONFIGS))
+        generate_pkg(
+            library='LibrePCB_Base.lplib',
+            author='Danilo B.',
+            configs=configs,
+            generate_3d_models=generate_3d_models,
+            pkgcat='3363b8b1-6fa8-4041-962e-5f839cfd86b7',
+            version='0.4',
+            create_date='2019-02-07T21:03:03Z',
+        )
+    finally:
+        save_cache(uuid_cache_file, uuid_cache)
@@ -8,13 +8,14 @@ Generate the following SO packages:
 
 """
 import sys
+from functools import lru_cache
 from os import path
 from uuid import uuid4
 
 from typing import Dict, Iterable, List, Optional
 
 from common import format_ipc_dimension as fd
-from common import init_cache, now, save_cache
+from common import init_cache, now, save_cache, serialize_parallel
 from entities.common import (
     Align, Angle, Author, Category, Circle, Created, Deprecated, Description, Diameter, Fill, GeneratedBy, GrabArea,
     Height, Keywords, Layer, Name, Polygon, Position, Position3D, Rotation, Rotation3D, Value, Version, Vertex, Width,
@@ -66,9 +67,10 @@ def uuid(category: str, full_name: str, identifier: str) -> str:
             For example 'pad-1' or 'pin-13'.
     """
     key = '{}-{}-{}'.format(category, full_name, identifier).lower().replace(' ', '~')
-    if key not in uuid_cache:
-        uuid_cache[key] = str(uuid4())
-    return uuid_cache[key]
+    value = uuid_cache.get(key)
+    if value is None:
+        value = uuid_cache[key] = str(uuid4())
+    return value
 
 
 def get_by_density(pitch: float, level: str, key: str) -> float:
@@ -79,6 +81,7 @@ def get_by_density(pitch: float, level: str, key: str) -> float:
     return table[level][key]
 
 
+@lru_cache(maxsize=None)
 def get_y(pin_number: int, pin_count: int, spacing: float, grid_align: bool) -> float:
     """
     Return the y coordinate of the specified pin. Keep the pins grid aligned, if desired.
@@ -134,6 +137,7 @@ def generate_pkg(
     create_date: Optional[str],
 ) -> None:
     category = 'pkg'
+    packages: List[Package] = []
     for config in configs:
         pitch = config.pitch
         pin_count = config.pin_count
@@ -192,6 +196,11 @@ def generate_pkg(
         for p in range(1, pin_count + 1):
             package.add_pad(PackagePad(uuid_pads[p - 1], Name(str(p))))
 
+        # Pin y coordinates, down on the left and up on the right. They are
+        # the same for all footprint variants.
+        left_ys = [get_y(p, pin_count // 2, pitch, False) for p in range(1, pin_count // 2 + 1)]
+        ys = left_ys + [-y for y in left_ys]
+
         def add_footprint_variant(
             key: str,
             name: str,
@@ -233,13 +242,8 @@ def generate_pkg(
             pad_length = lead_contact_length + pad_heel + pad_toe
             pad_x_offset = total_width / 2 - lead_contact_length / 2 - pad_heel / 2 + pad_toe / 2
             for p in range(1, pin_count + 1):
-                mid = pin_count // 2
-                if p <= mid:
-                    y = get_y(p, pin_count // 2, pitch, False)
-                    pxo = -pad_x_offset
-                else:
-                    y = -get_y(p - mid, pin_count // 2, pitch, False)
-                    pxo = pad_x_offset
+                y = ys[p - 1]
+                pxo = -pad_x_offset if p <= pin_count // 2 else pad_x_offset
                 pad_uuid = uuid_pads[p - 1]
                 footprint.add_pad(FootprintPad(
                     uuid=pad_uuid,
@@ -262,14 +266,12 @@ def generate_pkg(
             # Documentation: Leads
             lead_contact_x_offset = total_width / 2 - lead_contact_length  # this is the inner side of the contact area
             for p in range(1, pin_count + 1):
-                mid = pin_count // 2
-                if p <= mid:  # left side
-                    y = get_y(p, pin_count // 2, pitch, False)
+                y = ys[p - 1]
+                if p <= pin_count // 2:  # left side
                     lcxo_max = -lead_contact_x_offset - lead_contact_length
                     lcxo_min = -lead_contact_x_offset
                     body_side = -body_width / 2
                 else:  # right side
-                    y = -get_y(p - mid, pin_count // 2, pitch, False)
                     lcxo_min = lead_contact_x_offset
                     lcxo_max = lead_contact_x_offset + lead_contact_length
                     body_side = body_width / 2
@@ -447,7 +449,9 @@ def generate_pkg(
         for footprint in package.footprints:
             footprint.add_3d_model(Footprint3DModel(uuid_3d))
 
-        package.serialize(path.join('out', library, category))
+        packages.append(package)
+
+    serialize_parallel(packages, path.join('out', library, category))
 
 
 def generate_3d(
@@ -535,375 +539,377 @@ if __name__ == '__main__':
         warning = 'Note: Not generating 3D models unless the "--3d" argument is passed in!'
         print(f'\033[1;33m{warning}\033[0m')
 
-    # SOIC
-    configs: List[SoConfig] = []
-    for pin_count in [6, 8, 10, 12, 14, 16, 18, 20, 22, 24, 28, 30, 32]:
-        for height in [1.2, 1.4, 1.7, 2.7]:
+    try:
+        # SOIC
+        configs: List[SoConfig] = []
+        for pin_count in [6, 8, 10, 12, 14, 16, 18, 20, 22, 24, 28, 30, 32]:
+            for height in [1.2, 1.4, 1.7, 2.7]:
+                pitch = 1.27
+                body_length = (pin_count / 2 - 1) * pitch + 2.0
+                body_width = 5.22
+                total_width = 8.42  # effective, not nominal (7.62)
+                configs.append(SoConfig(pin_count, pitch, body_length, body_width, total_width, height))
+        generate_pkg(
+            library='LibrePCB_Base.lplib',
+            author='Danilo B.',
+            name='SOIC{pitch}P762X{height}-{pin_count}',
+            description='{pin_count}-pin Small Outline Integrated Circuit (SOIC), '
+                        'standardized by EIAJ.\n\n'
+                        'Pitch: {pitch:.2f} mm\nNominal width: 7.62mm\nHeight: {height:.2f}mm',
+            configs=configs,
+            lead_width_lookup={1.27: 0.4},
+            lead_contact_length=0.8,
+            generate_3d_models=generate_3d_models,
+            pkgcat='a074fabf-4912-4c29-bc6b-451bf43c2193',
+            keywords='so,soic,small outline,smd,eiaj',
+            version='0.3',
+            create_date='2018-11-10T20:32:03Z',
+        )
+        configs = []
+        for pin_count in [20, 22, 24, 28, 30, 32, 36, 40, 42, 44]:
+            for height in [1.2, 1.4, 1.7, 2.7]:
+                pitch = 1.27
+                body_length = (pin_count / 2 - 1) * pitch + 2.0
+                body_width = 12.84
+                total_width = 16.04  # effective, not nominal (15.42)
+                configs.append(SoConfig(pin_count, pitch, body_length, body_width, total_width, height))
+        generate_pkg(
+            library='LibrePCB_Base.lplib',
+            author='Danilo B.',
+            name='SOIC{pitch}P1524X{height}-{pin_count}',
+            description='{pin_count}-pin Small Outline Integrated Circuit (SOIC), '
+                        'standardized by EIAJ.\n\n'
+                        'Pitch: {pitch:.2f} mm\nNominal width: 15.24mm\nHeight: {height:.2f}mm',
+            configs=configs,
+            lead_width_lookup={1.27: 0.4},
+            lead_contact_length=0.8,
+            generate_3d_models=generate_3d_models,
+            pkgcat='a074fabf-4912-4c29-bc6b-451bf43c2193',
+            keywords='so,soic,small outline,smd,eiaj',
+            version='0.3',
+            create_date='2018-11-10T20:32:03Z',
+        )
+        configs = []
+        for pin_count in [6, 8, 10, 12, 14, 16, 18, 20, 22, 24, 28, 30, 32, 36, 40, 42, 44, 48]:
             pitch = 1.27
-            body_length = (pin_count / 2 - 1) * pitch + 2.0
-            body_width = 5.22
-            total_width = 8.42  # effective, not nominal (7.62)
+            height = 1.75
+            body_length = (pin_count / 2 - 1) * pitch + 1.6
+            body_width = 3.9
+            total_width = 6.0
             configs.append(SoConfig(pin_count, pitch, body_length, body_width, total_width, height))
-    generate_pkg(
-        library='LibrePCB_Base.lplib',
-        author='Danilo B.',
-        name='SOIC{pitch}P762X{height}-{pin_count}',
-        description='{pin_count}-pin Small Outline Integrated Circuit (SOIC), '
-                    'standardized by EIAJ.\n\n'
-                    'Pitch: {pitch:.2f} mm\nNominal width: 7.62mm\nHeight: {height:.2f}mm',
-        configs=configs,
-        lead_width_lookup={1.27: 0.4},
-        lead_contact_length=0.8,
-        generate_3d_models=generate_3d_models,
-        pkgcat='a074fabf-4912-4c29-bc6b-451bf43c2193',
-        keywords='so,soic,small outline,smd,eiaj',
-        version='0.3',
-        create_date='2018-11-10T20:32:03Z',
-    )
-    configs = []
-    for pin_count in [20, 22, 24, 28, 30, 32, 36, 40, 42, 44]:
-        for height in [1.2, 1.4, 1.7, 2.7]:
+        generate_pkg(
+            library='LibrePCB_Base.lplib',
+            author='Danilo B.',
+            name='SOIC{pitch}P600X{height}-{pin_count}',
+            description='{pin_count}-pin Small Outline Integrated Circuit (SOIC), '
+                        'standardized by JEDEC (MS-012G).\n\n'
+                        'Pitch: {pitch:.2f} mm\nNominal width: 6.00mm\nHeight: {height:.2f}mm',
+            configs=configs,
+            lead_width_lookup={1.27: 0.45},
+            lead_contact_length=0.835,
+            generate_3d_models=generate_3d_models,
+            pkgcat='a074fabf-4912-4c29-bc6b-451bf43c2193',
+            keywords='so,soic,small outline,smd,jedec',
+            version='0.3',
+            create_date='2018-11-10T20:32:03Z',
+        )
+        configs = []
+        for pin_count in [14, 16, 18, 20, 24, 28]:
             pitch = 1.27
-            body_length = (pin_count / 2 - 1) * pitch + 2.0
-            body_width = 12.84
-            total_width = 16.04  # effective, not nominal (15.42)
+            height = 2.65
+            body_length = (pin_count / 2 - 1) * pitch + 1.6
+            body_width = 7.5
+            total_width = 10.3
             configs.append(SoConfig(pin_count, pitch, body_length, body_width, total_width, height))
-    generate_pkg(
-        library='LibrePCB_Base.lplib',
-        author='Danilo B.',
-        name='SOIC{pitch}P1524X{height}-{pin_count}',
-        description='{pin_count}-pin Small Outline Integrated Circuit (SOIC), '
-                    'standardized by EIAJ.\n\n'
-                    'Pitch: {pitch:.2f} mm\nNominal width: 15.24mm\nHeight: {height:.2f}mm',
-        configs=configs,
-        lead_width_lookup={1.27: 0.4},
-        lead_contact_length=0.8,
-        generate_3d_models=generate_3d_models,
-        pkgcat='a074fabf-4912-4c29-bc6b-451bf43c2193',
-        keywords='so,soic,small outline,smd,eiaj',
-        version='0.3',
-        create_date='2018-11-10T20:32:03Z',
-    )
-    configs = []
-    for pin_count in [6, 8, 10, 12, 14, 16, 18, 20, 22, 24, 28, 30, 32, 36, 40, 42, 44, 48]:
-        pitch = 1.27
-        height = 1.75
-        body_length = (pin_count / 2 - 1) * pitch + 1.6
-        body_width = 3.9
-        total_width = 6.0
-        configs.append(SoConfig(pin_count, pitch, body_length, body_width, total_width, height))
-    generate_pkg(
-        library='LibrePCB_Base.lplib',
-        author='Danilo B.',
-        name='SOIC{pitch}P600X{height}-{pin_count}',
-        description='{pin_count}-pin Small Outline Integrated Circuit (SOIC), '
-                    'standardized by JEDEC (MS-012G).\n\n'
-                    'Pitch: {pitch:.2f} mm\nNominal width: 6.00mm\nHeight: {height:.2f}mm',
-        configs=configs,
-        lead_width_lookup={1.27: 0.45},
-        lead_contact_length=0.835,
-        generate_3d_models=generate_3d_models,
-        pkgcat='a074fabf-4912-4c29-bc6b-451bf43c2193',
-        keywords='so,soic,small outline,smd,jedec',
-        version='0.3',
-        create_date='2018-11-10T20:32:03Z',
-    )
-    configs = []
-    for pin_count in [14, 16, 18, 20, 24, 28]:
-        pitch = 1.27
-        height = 2.65
-        body_length = (pin_count / 2 - 1) * pitch + 1.6
-        body_width = 7.5
-        total_width = 10.3
-        configs.append(SoConfig(pin_count, pitch, body_length, body_width, total_width, height))
-    generate_pkg(
-        library='LibrePCB_Base.lplib',
-        author='U. Bruhin',
-        name='SOIC{pitch}P1030X{height}-{pin_count}',
-        description='{pin_count}-pin Small Outline Integrated Circuit (SOIC), '
-                    'standardized by JEDEC (MS-013F).\n\n'
-                    'Pitch: {pitch:.2f} mm\nNominal width: 10.30mm\nHeight: {height:.2f}mm',
-        configs=configs,
-        lead_width_lookup={1.27: 0.45},
-        lead_contact_length=0.835,
-        generate_3d_models=generate_3d_models,
-        pkgcat='a074fabf-4912-4c29-bc6b-451bf43c2193',
-        keywords='so,soic,small outline,smd,jedec,ms-013f',
-        version='0.2',
-        create_date='2020-09-15T20:46:13Z',
-    )
+        generate_pkg(
+            library='LibrePCB_Base.lplib',
+            author='U. Bruhin',
+            name='SOIC{pitch}P1030X{height}-{pin_count}',
+            description='{pin_count}-pin Small Outline Integrated Circuit (SOIC), '
+                        'standardized by JEDEC (MS-013F).\n\n'
+                        'Pitch: {pitch:.2f} mm\nNominal width: 10.30mm\nHeight: {height:.2f}mm',
+            configs=configs,
+            lead_width_lookup={1.27: 0.45},
+            lead_contact_length=0.835,
+            generate_3d_models=generate_3d_models,
+            pkgcat='a074fabf-4912-4c29-bc6b-451bf43c2193',
+            keywords='so,soic,small outline,smd,jedec,ms-013f',
+            version='0.2',
+            create_date='2020-09-15T20:46:13Z',
+        )
 
-    # TSSOP
-    generate_pkg(
-        library='LibrePCB_Base.lplib',
-        author='Danilo B.',
-        # Name according to IPC7351C
-        name='TSSOP{pin_count}P{pitch}_{body_length}X{lead_span}X{height}L{lead_length}X{lead_width}',
-        description='{pin_count}-pin Thin-Shrink Small Outline Package (TSSOP), '
-                    'standardized by JEDEC (MO-153), variation {variation}.\n\n'
-                    'Pitch: {pitch:.2f} mm\nBody length: {body_length:.2f} mm\n'
-                    'Body width: {body_width:.2f} mm\nLead span: {lead_span:.2f} mm\n'
-                    'Height: {height:.2f} mm\n'
-                    'Lead length: {lead_length:.2f} mm\nLead width: {lead_width:.2f} mm',
-        configs=[
-            # pin count, pitch, body length, body width, total width, height
-
-            # Symbols based on JEDEC MO-153:
-            #        N    e     D     E1   E    A
-
-            # 4.40mm body width
-            #   0.65mm pitch
-            SoConfig( 8,  0.65,  3.0, 4.4, 6.4, 1.2, 'AA'),
-            SoConfig(14,  0.65,  5.0, 4.4, 6.4, 1.2, 'AB-1'),
-            SoConfig(16,  0.65,  5.0, 4.4, 6.4, 1.2, 'AB'),
-            SoConfig(20,  0.65,  6.5, 4.4, 6.4, 1.2, 'AC'),
-            SoConfig(24,  0.65,  7.8, 4.4, 6.4, 1.2, 'AD'),
-            SoConfig(28,  0.65,  9.7, 4.4, 6.4, 1.2, 'AE'),
-            #   0.5mm pitch
-            SoConfig(20,  0.50,  5.0, 4.4, 6.4, 1.2, 'BA'),
-            SoConfig(24,  0.50,  6.5, 4.4, 6.4, 1.2, 'BB'),
-            SoConfig(28,  0.50,  7.8, 4.4, 6.4, 1.2, 'BC'),
-            SoConfig(30,  0.50,  7.8, 4.4, 6.4, 1.2, 'BC-1'),
-            SoConfig(36,  0.50,  9.7, 4.4, 6.4, 1.2, 'BD'),
-            SoConfig(38,  0.50,  9.7, 4.4, 6.4, 1.2, 'BD-1'),
-            SoConfig(44,  0.50, 11.0, 4.4, 6.4, 1.2, 'BE'),
-            SoConfig(50,  0.50, 12.5, 4.4, 6.4, 1.2, 'BF'),
-            #   0.4mm pitch
-            SoConfig(24,  0.40,  5.0, 4.4, 6.4, 1.2, 'CA'),
-            SoConfig(32,  0.40,  6.5, 4.4, 6.4, 1.2, 'CB'),
-            SoConfig(36,  0.40,  7.8, 4.4, 6.4, 1.2, 'CC'),
-            SoConfig(48,  0.40,  9.7, 4.4, 6.4, 1.2, 'CD'),
-
-            # 6.10mm body width
-            #   0.65mm pitch
-            SoConfig(24,  0.65,  7.8, 6.1, 8.1, 1.2, 'DA'),
-            SoConfig(28,  0.65,  9.7, 6.1, 8.1, 1.2, 'DB'),
-            SoConfig(30,  0.65,  9.7, 6.1, 8.1, 1.2, 'DB-1'),
-            SoConfig(32,  0.65, 11.0, 6.1, 8.1, 1.2, 'DC'),
-            SoConfig(36,  0.65, 12.5, 6.1, 8.1, 1.2, 'DD'),
-            SoConfig(38,  0.65, 12.5, 6.1, 8.1, 1.2, 'DD-1'),
-            SoConfig(40,  0.65, 14.0, 6.1, 8.1, 1.2, 'DE'),
-            #  0.5mm pitch
-            SoConfig(28,  0.50,  7.8, 6.1, 8.1, 1.2, 'EA'),
-            SoConfig(36,  0.50,  9.7, 6.1, 8.1, 1.2, 'EB'),
-            SoConfig(40,  0.50, 11.0, 6.1, 8.1, 1.2, 'EC'),
-            SoConfig(44,  0.50, 11.0, 6.1, 8.1, 1.2, 'EC-1'),
-            SoConfig(48,  0.50, 12.5, 6.1, 8.1, 1.2, 'ED'),
-            SoConfig(56,  0.50, 14.0, 6.1, 8.1, 1.2, 'EE'),
-            SoConfig(64,  0.50, 17.0, 6.1, 8.1, 1.2, 'EF'),
-            #  0.4mm pitch
-            SoConfig(36,  0.40,  7.8, 6.1, 8.1, 1.2, 'FA'),
-            SoConfig(48,  0.40,  9.7, 6.1, 8.1, 1.2, 'FB'),
-            SoConfig(52,  0.40, 11.0, 6.1, 8.1, 1.2, 'FC'),
-            SoConfig(56,  0.40, 12.5, 6.1, 8.1, 1.2, 'FD'),
-            SoConfig(64,  0.40, 14.0, 6.1, 8.1, 1.2, 'FE'),
-            SoConfig(80,  0.40, 17.0, 6.1, 8.1, 1.2, 'FF'),
-
-            # 8.00mm body width
-            #   0.65mm pitch
-            SoConfig(28,  0.65,  9.7, 8.0, 10.0, 1.2, 'GA'),
-            SoConfig(32,  0.65, 11.0, 8.0, 10.0, 1.2, 'GB'),
-            SoConfig(36,  0.65, 12.5, 8.0, 10.0, 1.2, 'GC'),
-            SoConfig(40,  0.65, 14.0, 8.0, 10.0, 1.2, 'GD'),
-            #   0.5mm pitch
-            SoConfig(36,  0.50,  9.7, 8.0, 10.0, 1.2, 'HA'),
-            SoConfig(40,  0.50, 11.0, 8.0, 10.0, 1.2, 'HB'),
-            SoConfig(48,  0.50, 12.5, 8.0, 10.0, 1.2, 'HC'),
-            SoConfig(56,  0.50, 14.0, 8.0, 10.0, 1.2, 'HD'),
-            #   0.4mm pitch
-            SoConfig(48,  0.40,  9.7, 8.0, 10.0, 1.2, 'JA'),
-            SoConfig(52,  0.40, 11.0, 8.0, 10.0, 1.2, 'JB'),
-            SoConfig(56,  0.40, 12.5, 8.0, 10.0, 1.2, 'JC'),
-            SoConfig(60,  0.40, 12.5, 8.0, 10.0, 1.2, 'JC-1'),
-            SoConfig(64,  0.40, 14.0, 8.0, 10.0, 1.2, 'JD'),
-            SoConfig(68,  0.40, 14.0, 8.0, 10.0, 1.2, 'JD-1'),
-        ],
-        lead_width_lookup={
-            0.65: 0.3,
-            0.5: 0.27,
-            0.4: 0.23,
-        },
-        lead_contact_length=0.6,
-        generate_3d_models=generate_3d_models,
-        pkgcat='241d9d5d-8f74-4740-8901-3cf51cf50091',
-        keywords='so,sop,tssop,small outline package,smd',
-        version='0.3',
-        create_date='2019-06-16T12:46:54Z',
-    )
+        # TSSOP
+        generate_pkg(
+            library='LibrePCB_Base.lplib',
+            author='Danilo B.',
+            # Name according to IPC7351C
+            name='TSSOP{pin_count}P{pitch}_{body_length}X{lead_span}X{height}L{lead_length}X{lead_width}',
+            description='{pin_count}-pin Thin-Shrink Small Outline Package (TSSOP), '
+                        'standardized by JEDEC (MO-153), variation {variation}.\n\n'
+                        'Pitch: {pitch:.2f} mm\nBody length: {body_length:.2f} mm\n'
+                        'Body width: {body_width:.2f} mm\nLead span: {lead_span:.2f} mm\n'
+                        'Height: {height:.2f} mm\n'
+                        'Lead length: {lead_length:.2f} mm\nLead width: {lead_width:.2f} mm',
+            configs=[
+                # pin count, pitch, body length, body width, total width, height
+
+                # Symbols based on JEDEC MO-153:
+                #        N    e     D     E1   E    A
+
+                # 4.40mm body width
+                #   0.65mm pitch
+                SoConfig( 8,  0.65,  3.0, 4.4, 6.4, 1.2, 'AA'),
+                SoConfig(14,  0.65,  5.0, 4.4, 6.4, 1.2, 'AB-1'),
+                SoConfig(16,  0.65,  5.0, 4.4, 6.4, 1.2, 'AB'),
+                SoConfig(20,  0.65,  6.5, 4.4, 6.4, 1.2, 'AC'),
+                SoConfig(24,  0.65,  7.8, 4.4, 6.4, 1.2, 'AD'),
+                SoConfig(28,  0.65,  9.7, 4.4, 6.4, 1.2, 'AE'),
+                #   0.5mm pitch
+                SoConfig(20,  0.50,  5.0, 4.4, 6.4, 1.2, 'BA'),
+                SoConfig(24,  0.50,  6.5, 4.4, 6.4, 1.2, 'BB'),
+                SoConfig(28,  0.50,  7.8, 4.4, 6.4, 1.2, 'BC'),
+                SoConfig(30,  0.50,  7.8, 4.4, 6.4, 1.2, 'BC-1'),
+                SoConfig(36,  0.50,  9.7, 4.4, 6.4, 1.2, 'BD'),
+                SoConfig(38,  0.50,  9.7, 4.4, 6.4, 1.2, 'BD-1'),
+                SoConfig(44,  0.50, 11.0, 4.4, 6.4, 1.2, 'BE'),
+                SoConfig(50,  0.50, 12.5, 4.4, 6.4, 1.2, 'BF'),
+                #   0.4mm pitch
+                SoConfig(24,  0.40,  5.0, 4.4, 6.4, 1.2, 'CA'),
+                SoConfig(32,  0.40,  6.5, 4.4, 6.4, 1.2, 'CB'),
+                SoConfig(36,  0.40,  7.8, 4.4, 6.4, 1.2, 'CC'),
+                SoConfig(48,  0.40,  9.7, 4.4, 6.4, 1.2, 'CD'),
+
+                # 6.10mm body width
+                #   0.65mm pitch
+                SoConfig(24,  0.65,  7.8, 6.1, 8.1, 1.2, 'DA'),
+                SoConfig(28,  0.65,  9.7, 6.1, 8.1, 1.2, 'DB'),
+                SoConfig(30,  0.65,  9.7, 6.1, 8.1, 1.2, 'DB-1'),
+                SoConfig(32,  0.65, 11.0, 6.1, 8.1, 1.2, 'DC'),
+                SoConfig(36,  0.65, 12.5, 6.1, 8.1, 1.2, 'DD'),
+                SoConfig(38,  0.65, 12.5, 6.1, 8.1, 1.2, 'DD-1'),
+                SoConfig(40,  0.65, 14.0, 6.1, 8.1, 1.2, 'DE'),
+                #  0.5mm pitch
+                SoConfig(28,  0.50,  7.8, 6.1, 8.1, 1.2, 'EA'),
+                SoConfig(36,  0.50,  9.7, 6.1, 8.1, 1.2, 'EB'),
+                SoConfig(40,  0.50, 11.0, 6.1, 8.1, 1.2, 'EC'),
+                SoConfig(44,  0.50, 11.0, 6.1, 8.1, 1.2, 'EC-1'),
+                SoConfig(48,  0.50, 12.5, 6.1, 8.1, 1.2, 'ED'),
+                SoConfig(56,  0.50, 14.0, 6.1, 8.1, 1.2, 'EE'),
+                SoConfig(64,  0.50, 17.0, 6.1, 8.1, 1.2, 'EF'),
+                #  0.4mm pitch
+                SoConfig(36,  0.40,  7.8, 6.1, 8.1, 1.2, 'FA'),
+                SoConfig(48,  0.40,  9.7, 6.1, 8.1, 1.2, 'FB'),
+                SoConfig(52,  0.40, 11.0, 6.1, 8.1, 1.2, 'FC'),
+                SoConfig(56,  0.40, 12.5, 6.1, 8.1, 1.2, 'FD'),
+                SoConfig(64,  0.40, 14.0, 6.1, 8.1, 1.2, 'FE'),
+                SoConfig(80,  0.40, 17.0, 6.1, 8.1, 1.2, 'FF'),
+
+                # 8.00mm body width
+                #   0.65mm pitch
+                SoConfig(28,  0.65,  9.7, 8.0, 10.0, 1.2, 'GA'),
+                SoConfig(32,  0.65, 11.0, 8.0, 10.0, 1.2, 'GB'),
+                SoConfig(36,  0.65, 12.5, 8.0, 10.0, 1.2, 'GC'),
+                SoConfig(40,  0.65, 14.0, 8.0, 10.0, 1.2, 'GD'),
+                #   0.5mm pitch
+                SoConfig(36,  0.50,  9.7, 8.0, 10.0, 1.2, 'HA'),
+                SoConfig(40,  0.50, 11.0, 8.0, 10.0, 1.2, 'HB'),
+                SoConfig(48,  0.50, 12.5, 8.0, 10.0, 1.2, 'HC'),
+                SoConfig(56,  0.50, 14.0, 8.0, 10.0, 1.2, 'HD'),
+                #   0.4mm pitch
+                SoConfig(48,  0.40,  9.7, 8.0, 10.0, 1.2, 'JA'),
+                SoConfig(52,  0.40, 11.0, 8.0, 10.0, 1.2, 'JB'),
+                SoConfig(56,  0.40, 12.5, 8.0, 10.0, 1.2, 'JC'),
+                SoConfig(60,  0.40, 12.5, 8.0, 10.0, 1.2, 'JC-1'),
+                SoConfig(64,  0.40, 14.0, 8.0, 10.0, 1.2, 'JD'),
+                SoConfig(68,  0.40, 14.0, 8.0, 10.0, 1.2, 'JD-1'),
+            ],
+            lead_width_lookup={
+                0.65: 0.3,
+                0.5: 0.27,
+                0.4: 0.23,
+            },
+            lead_contact_length=0.6,
+            generate_3d_models=generate_3d_models,
+            pkgcat='241d9d5d-8f74-4740-8901-3cf51cf50091',
+            keywords='so,sop,tssop,small outline package,smd',
+            version='0.3',
+            create_date='2019-06-16T12:46:54Z',
+        )
 
-    # SSOP
-    generate_pkg(
-        library='LibrePCB_Base.lplib',
-        author='Danilo B.',
-        # Name according to IPC7351C
-        name='SSOP{pin_count}P{pitch}_{body_length}X{lead_span}X{height}L{lead_length}X{lead_width}',
-        description='{pin_count}-pin Plastic Shrink Small Outline Package (SSOP), '
-                    'standardized by JEDEC (MO-152), variation {variation}.\n\n'
-                    'Pitch: {pitch:.2f} mm\nBody length: {body_length:.2f} mm\n'
-                    'Body width: {body_width:.2f} mm\nLead span: {lead_span:.2f} mm\n'
-                    'Height: {height:.2f} mm\n'
-                    'Lead length: {lead_length:.2f} mm\nLead width: {lead_width:.2f} mm',
-        configs=[
-            # pin count, pitch, body length, body width, total width, height
-
-            # Symbols based on JEDEC MO-152:
-            #        N    e     D    E1   E    A
-
-            # 4.40mm body width
-            #   0.65mm pitch
-            SoConfig( 8,  0.65, 3.0, 4.4, 6.4, 2.0, 'AA'),
-            SoConfig(14,  0.65, 5.0, 4.4, 6.4, 2.0, 'AB-1'),
-            SoConfig(16,  0.65, 5.0, 4.4, 6.4, 2.0, 'AB'),
-            SoConfig(20,  0.65, 6.5, 4.4, 6.4, 2.0, 'AC'),
-            SoConfig(24,  0.65, 7.8, 4.4, 6.4, 2.0, 'AD'),
-            SoConfig(28,  0.65, 9.7, 4.4, 6.4, 2.0, 'AE'),
-            #   0.5mm pitch
-            SoConfig(20,  0.50, 5.0, 4.4, 6.4, 2.0, 'BA'),
-            SoConfig(24,  0.50, 6.5, 4.4, 6.4, 2.0, 'BB'),
-            SoConfig(28,  0.50, 7.8, 4.4, 6.4, 2.0, 'BC'),
-            SoConfig(36,  0.50, 9.7, 4.4, 6.4, 2.0, 'BD'),
-            #   0.4mm pitch
-            SoConfig(24,  0.40, 5.0, 4.4, 6.4, 2.0, 'CA'),
-            SoConfig(32,  0.40, 6.5, 4.4, 6.4, 2.0, 'CB'),
-            SoConfig(36,  0.40, 7.8, 4.4, 6.4, 2.0, 'CC'),
-            SoConfig(48,  0.40, 9.7, 4.4, 6.4, 2.0, 'CD'),
-
-            # 6.10mm body width
-            #   0.65mm pitch
-            SoConfig(24,  0.65,  7.8, 6.1, 8.1, 2.0, 'DA'),
-            SoConfig(28,  0.65,  9.7, 6.1, 8.1, 2.0, 'DB'),
-            SoConfig(30,  0.65,  9.7, 6.1, 8.1, 2.0, 'DB-1'),
-            SoConfig(32,  0.65, 11.0, 6.1, 8.1, 2.0, 'DC'),
-            SoConfig(36,  0.65, 12.5, 6.1, 8.1, 2.0, 'DD'),
-            SoConfig(40,  0.65, 14.0, 6.1, 8.1, 2.0, 'DE'),
-            #  0.5mm pitch
-            SoConfig(28,  0.50,  7.8, 6.1, 8.1, 2.0, 'EA'),
-            SoConfig(36,  0.50,  9.7, 6.1, 8.1, 2.0, 'EB'),
-            SoConfig(40,  0.50, 11.0, 6.1, 8.1, 2.0, 'EC'),
-            SoConfig(44,  0.50, 11.0, 6.1, 8.1, 2.0, 'EC-1'),
-            SoConfig(48,  0.50, 12.5, 6.1, 8.1, 2.0, 'ED'),
-            SoConfig(56,  0.50, 14.0, 6.1, 8.1, 2.0, 'EE'),
-            SoConfig(64,  0.50, 17.0, 6.1, 8.1, 2.0, 'EF'),
-            #  0.4mm pitch
-            SoConfig(36,  0.40,  7.8, 6.1, 8.1, 2.0, 'FA'),
-            SoConfig(48,  0.40,  9.7, 6.1, 8.1, 2.0, 'FB'),
-            SoConfig(52,  0.40, 11.0, 6.1, 8.1, 2.0, 'FC'),
-            SoConfig(56,  0.40, 12.5, 6.1, 8.1, 2.0, 'FD'),
-            SoConfig(64,  0.40, 14.0, 6.1, 8.1, 2.0, 'FE'),
-            SoConfig(80,  0.40, 17.0, 6.1, 8.1, 2.0, 'FF'),
-
-            # 8.00mm body width
-            #   0.65mm pitch
-            SoConfig(28,  0.65,  9.7, 8.0, 10.0, 2.0, 'GA'),
-            SoConfig(32,  0.65, 11.0, 8.0, 10.0, 2.0, 'GB'),
-            SoConfig(36,  0.65, 12.5, 8.0, 10.0, 2.0, 'GC'),
-            SoConfig(40,  0.65, 14.0, 8.0, 10.0, 2.0, 'GD'),
-            #   0.5mm pitch
-            SoConfig(36,  0.50,  9.7, 8.0, 10.0, 2.0, 'HA'),
-            SoConfig(40,  0.50, 11.0, 8.0, 10.0, 2.0, 'HB'),
-            SoConfig(48,  0.50, 12.5, 8.0, 10.0, 2.0, 'HC'),
-            SoConfig(56,  0.50, 14.0, 8.0, 10.0, 2.0, 'HD'),
-            #   0.4mm pitch
-            SoConfig(48,  0.40,  9.7, 8.0, 10.0, 2.0, 'JA'),
-            SoConfig(52,  0.40, 11.0, 8.0, 10.0, 2.0, 'JB'),
-            SoConfig(56,  0.40, 12.5, 8.0, 10.0, 2.0, 'JC'),
-            SoConfig(60,  0.40, 12.5, 8.0, 10.0, 2.0, 'JC-1'),
-            SoConfig(64,  0.40, 14.0, 8.0, 10.0, 2.0, 'JD'),
-            SoConfig(68,  0.40, 14.0, 8.0, 10.0, 2.0, 'JD-1'),
-        ],
-        lead_width_lookup={
-            0.65: 0.30,
-            0.50: 0.27,
-            0.40: 0.23,
-        },
-        lead_contact_length=0.6,
-        generate_3d_models=generate_3d_models,
-        pkgcat='3627bf02-2e6e-4d68-9ada-743fa69a4f8c',
-        keywords='so,sop,ssop,small outline package,smd,jedec,mo-152',
-        version='0.2',
-        create_date='2019-07-21T12:55:20Z',
-    )
-    generate_pkg(
-        library='LibrePCB_Base.lplib',
-        author='Danilo B.',
-        # Name according to IPC7351C
-        name='SSOP{pin_count}P{pitch}_{body_length}X{lead_span}X{height}L{lead_length}X{lead_width}',
-        description='{pin_count}-pin Plastic Shrink Small Outline Package (SSOP), '
-                    'standardized by JEDEC (MO-150), variation {variation}.\n\n'
-                    'Pitch: {pitch:.2f} mm\nBody length: {body_length:.2f} mm\n'
-                    'Body width: {body_width:.2f} mm\nLead span: {lead_span:.2f} mm\n'
-                    'Height: {height:.2f} mm\n'
-                    'Lead length: {lead_length:.2f} mm\nLead width: {lead_width:.2f} mm',
-        configs=[
-            # pin count, pitch, body length, body width, total width, height
-
-            # Symbols based on JEDEC MO-150:
-            #        N   e      D    E1   E    A
-
-            SoConfig( 8, 0.65,  3.0, 5.3, 7.8, 2.0, 'AA'),
-            SoConfig(14, 0.65,  6.2, 5.3, 7.8, 2.0, 'AB'),
-            SoConfig(16, 0.65,  6.2, 5.3, 7.8, 2.0, 'AC'),
-            SoConfig(18, 0.65,  7.2, 5.3, 7.8, 2.0, 'AD'),
-            SoConfig(20, 0.65,  7.2, 5.3, 7.8, 2.0, 'AE'),
-            SoConfig(22, 0.65,  8.2, 5.3, 7.8, 2.0, 'AF'),
-            SoConfig(24, 0.65,  8.2, 5.3, 7.8, 2.0, 'AG'),
-            SoConfig(28, 0.65, 10.2, 5.3, 7.8, 2.0, 'AH'),
-            SoConfig(30, 0.65, 10.2, 5.3, 7.8, 2.0, 'AJ'),
-            SoConfig(38, 0.65, 12.6, 5.3, 7.8, 2.0, 'AK'),
-        ],
-        lead_width_lookup={
-            0.65: 0.38,
-        },
-        lead_contact_length=0.75,
-        generate_3d_models=generate_3d_models,
-        pkgcat='3627bf02-2e6e-4d68-9ada-743fa69a4f8c',
-        keywords='so,sop,ssop,small outline package,smd,jedec,mo-150',
-        version='0.2',
-        create_date='2019-07-21T12:55:20Z',
-    )
+        # SSOP
+        generate_pkg(
+            library='LibrePCB_Base.lplib',
+            author='Danilo B.',
+            # Name according to IPC7351C
+            name='SSOP{pin_count}P{pitch}_{body_length}X{lead_span}X{height}L{lead_length}X{lead_width}',
+            description='{pin_count}-pin Plastic Shrink Small Outline Package (SSOP), '
+                        'standardized by JEDEC (MO-152), variation {variation}.\n\n'
+                        'Pitch: {pitch:.2f} mm\nBody length: {body_length:.2f} mm\n'
+                        'Body width: {body_width:.2f} mm\nLead span: {lead_span:.2f} mm\n'
+                        'Height: {height:.2f} mm\n'
+                        'Lead length: {lead_length:.2f} mm\nLead width: {lead_width:.2f} mm',
+            configs=[
+                # pin count, pitch, body length, body width, total width, height
+
+                # Symbols based on JEDEC MO-152:
+                #        N    e     D    E1   E    A
+
+                # 4.40mm body width
+                #   0.65mm pitch
+                SoConfig( 8,  0.65, 3.0, 4.4, 6.4, 2.0, 'AA'),
+                SoConfig(14,  0.65, 5.0, 4.4, 6.4, 2.0, 'AB-1'),
+                SoConfig(16,  0.65, 5.0, 4.4, 6.4, 2.0, 'AB'),
+                SoConfig(20,  0.65, 6.5, 4.4, 6.4, 2.0, 'AC'),
+                SoConfig(24,  0.65, 7.8, 4.4, 6.4, 2.0, 'AD'),
+                SoConfig(28,  0.65, 9.7, 4.4, 6.4, 2.0, 'AE'),
+                #   0.5mm pitch
+                SoConfig(20,  0.50, 5.0, 4.4, 6.4, 2.0, 'BA'),
+                SoConfig(24,  0.50, 6.5, 4.4, 6.4, 2.0, 'BB'),
+                SoConfig(28,  0.50, 7.8, 4.4, 6.4, 2.0, 'BC'),
+                SoConfig(36,  0.50, 9.7, 4.4, 6.4, 2.0, 'BD'),
+                #   0.4mm pitch
+                SoConfig(24,  0.40, 5.0, 4.4, 6.4, 2.0, 'CA'),
+                SoConfig(32,  0.40, 6.5, 4.4, 6.4, 2.0, 'CB'),
+                SoConfig(36,  0.40, 7.8, 4.4, 6.4, 2.0, 'CC'),
+                SoConfig(48,  0.40, 9.7, 4.4, 6.4, 2.0, 'CD'),
+
+                # 6.10mm body width
+                #   0.65mm pitch
+                SoConfig(24,  0.65,  7.8, 6.1, 8.1, 2.0, 'DA'),
+                SoConfig(28,  0.65,  9.7, 6.1, 8.1, 2.0, 'DB'),
+                SoConfig(30,  0.65,  9.7, 6.1, 8.1, 2.0, 'DB-1'),
+                SoConfig(32,  0.65, 11.0, 6.1, 8.1, 2.0, 'DC'),
+                SoConfig(36,  0.65, 12.5, 6.1, 8.1, 2.0, 'DD'),
+                SoConfig(40,  0.65, 14.0, 6.1, 8.1, 2.0, 'DE'),
+                #  0.5mm pitch
+                SoConfig(28,  0.50,  7.8, 6.1, 8.1, 2.0, 'EA'),
+                SoConfig(36,  0.50,  9.7, 6.1, 8.1, 2.0, 'EB'),
+                SoConfig(40,  0.50, 11.0, 6.1, 8.1, 2.0, 'EC'),
+                SoConfig(44,  0.50, 11.0, 6.1, 8.1, 2.0, 'EC-1'),
+                SoConfig(48,  0.50, 12.5, 6.1, 8.1, 2.0, 'ED'),
+                SoConfig(56,  0.50, 14.0, 6.1, 8.1, 2.0, 'EE'),
+                SoConfig(64,  0.50, 17.0, 6.1, 8.1, 2.0, 'EF'),
+                #  0.4mm pitch
+                SoConfig(36,  0.40,  7.8, 6.1, 8.1, 2.0, 'FA'),
+                SoConfig(48,  0.40,  9.7, 6.1, 8.1, 2.0, 'FB'),
+                SoConfig(52,  0.40, 11.0, 6.1, 8.1, 2.0, 'FC'),
+                SoConfig(56,  0.40, 12.5, 6.1, 8.1, 2.0, 'FD'),
+                SoConfig(64,  0.40, 14.0, 6.1, 8.1, 2.0, 'FE'),
+                SoConfig(80,  0.40, 17.0, 6.1, 8.1, 2.0, 'FF'),
+
+                # 8.00mm body width
+                #   0.65mm pitch
+                SoConfig(28,  0.65,  9.7, 8.0, 10.0, 2.0, 'GA'),
+                SoConfig(32,  0.65, 11.0, 8.0, 10.0, 2.0, 'GB'),
+                SoConfig(36,  0.65, 12.5, 8.0, 10.0, 2.0, 'GC'),
+                SoConfig(40,  0.65, 14.0, 8.0, 10.0, 2.0, 'GD'),
+                #   0.5mm pitch
+                SoConfig(36,  0.50,  9.7, 8.0, 10.0, 2.0, 'HA'),
+                SoConfig(40,  0.50, 11.0, 8.0, 10.0, 2.0, 'HB'),
+                SoConfig(48,  0.50, 12.5, 8.0, 10.0, 2.0, 'HC'),
+                SoConfig(56,  0.50, 14.0, 8.0, 10.0, 2.0, 'HD'),
+                #   0.4mm pitch
+                SoConfig(48,  0.40,  9.7, 8.0, 10.0, 2.0, 'JA'),
+                SoConfig(52,  0.40, 11.0, 8.0, 10.0, 2.0, 'JB'),
+                SoConfig(56,  0.40, 12.5, 8.0, 10.0, 2.0, 'JC'),
+                SoConfig(60,  0.40, 12.5, 8.0, 10.0, 2.0, 'JC-1'),
+                SoConfig(64,  0.40, 14.0, 8.0, 10.0, 2.0, 'JD'),
+                SoConfig(68,  0.40, 14.0, 8.0, 10.0, 2.0, 'JD-1'),
+            ],
+            lead_width_lookup={
+                0.65: 0.30,
+                0.50: 0.27,
+                0.40: 0.23,
+            },
+            lead_contact_length=0.6,
+            generate_3d_models=generate_3d_models,
+            pkgcat='3627bf02-2e6e-4d68-9ada-743fa69a4f8c',
+            keywords='so,sop,ssop,small outline package,smd,jedec,mo-152',
+            version='0.2',
+            create_date='2019-07-21T12:55:20Z',
+        )
+        generate_pkg(
+            library='LibrePCB_Base.lplib',
+            author='Danilo B.',
+            # Name according to IPC7351C
+            name='SSOP{pin_count}P{pitch}_{body_length}X{lead_span}X{height}L{lead_length}X{lead_width}',
+            description='{pin_count}-pin Plastic Shrink Small Outline Package (SSOP), '
+                        'standardized by JEDEC (MO-150), variation {variation}.\n\n'
+                        'Pitch: {pitch:.2f} mm\nBody length: {body_length:.2f} mm\n'
+                        'Body width: {body_width:.2f} mm\nLead span: {lead_span:.2f} mm\n'
+                        'Height: {height:.2f} mm\n'
+                        'Lead length: {lead_length:.2f} mm\nLead width: {lead_width:.2f} mm',
+            configs=[
+                # pin count, pitch, body length, body width, total width, height
+
+                # Symbols based on JEDEC MO-150:
+                #        N   e      D    E1   E    A
+
+                SoConfig( 8, 0.65,  3.0, 5.3, 7.8, 2.0, 'AA'),
+                SoConfig(14, 0.65,  6.2, 5.3, 7.8, 2.0, 'AB'),
+                SoConfig(16, 0.65,  6.2, 5.3, 7.8, 2.0, 'AC'),
+                SoConfig(18, 0.65,  7.2, 5.3, 7.8, 2.0, 'AD'),
+                SoConfig(20, 0.65,  7.2, 5.3, 7.8, 2.0, 'AE'),
+                SoConfig(22, 0.65,  8.2, 5.3, 7.8, 2.0, 'AF'),
+                SoConfig(24, 0.65,  8.2, 5.3, 7.8, 2.0, 'AG'),
+                SoConfig(28, 0.65, 10.2, 5.3, 7.8, 2.0, 'AH'),
+                SoConfig(30, 0.65, 10.2, 5.3, 7.8, 2.0, 'AJ'),
+                SoConfig(38, 0.65, 12.6, 5.3, 7.8, 2.0, 'AK'),
+            ],
+            lead_width_lookup={
+                0.65: 0.38,
+            },
+            lead_contact_length=0.75,
+            generate_3d_models=generate_3d_models,
+            pkgcat='3627bf02-2e6e-4d68-9ada-743fa69a4f8c',
+            keywords='so,sop,ssop,small outline package,smd,jedec,mo-150',
+            version='0.2',
+            create_date='2019-07-21T12:55:20Z',
+        )
 
-    # TSOP
-    generate_pkg(
-        library='LibrePCB_Base.lplib',
-        author='Tubbles',
-        # Name extrapolated from IPC7351C
-        name='TSOP{pin_count}P{pitch}_{body_length}X{lead_span}X{height}L{lead_length}X{lead_width}',
-        description='{pin_count}-pin Thin Small Outline Package (TSOP), '
-                    'standardized by JEDEC (MS-024), Type II (pins on longer side), variation {variation}.\n\n'
-                    'Pitch: {pitch:.2f} mm\nBody length: {body_length:.2f} mm\n'
-                    'Body width: {body_width:.2f} mm\nLead span: {lead_span:.2f} mm\n'
-                    'Height: {height:.2f} mm\n'
-                    'Lead length: {lead_length:.2f} mm\nLead width: {lead_width:.2f} mm',
-        configs=[
-            # pin count, pitch, body length, body width, total width, height
-
-            # Symbols based on JEDEC MS-024:
-            #        N    e     D      E1     E      A
-            SoConfig(28,  1.27, 18.41, 10.16, 11.76, 1.2, 'AA'),
-            SoConfig(32,  1.27, 20.95, 10.16, 11.76, 1.2, 'BA'),
-            SoConfig(50,  0.80, 20.95, 10.16, 11.76, 1.2, 'BC'),
-            SoConfig(80,  0.50, 20.95, 10.16, 11.76, 1.2, 'BD'),
-            SoConfig(36,  1.27, 23.49, 10.16, 11.76, 1.2, 'CA'),
-            SoConfig(70,  0.65, 23.49, 10.16, 11.76, 1.2, 'CB'),
-            SoConfig(40,  1.27, 26.03, 10.16, 11.76, 1.2, 'DA'),
-            SoConfig(70,  0.80, 28.57, 10.16, 11.76, 1.2, 'EA'),
-            SoConfig(54,  0.80, 22.22, 10.16, 11.76, 1.2, 'FA'),
-            SoConfig(86,  0.50, 22.22, 10.16, 11.76, 1.2, 'FB'),
-            SoConfig(66,  0.65, 22.22, 10.16, 11.76, 1.2, 'FC'),
-            SoConfig(54,  0.40, 11.20, 10.16, 11.76, 1.2, 'GA'),
-        ],
-        lead_width_lookup={
-            0.40: 0.18,
-            0.50: 0.22,
-            0.65: 0.30,
-            0.80: 0.375,
-            1.27: 0.41,
-        },
-        lead_contact_length=0.5,
-        generate_3d_models=generate_3d_models,
-        pkgcat='7993abb0-fb0a-4157-8f83-1db890755836',
-        keywords='so,sop,tsop,small outline package,smd',
-        version='0.2',
-        create_date='2020-12-26T16:14:30Z',
-    )
-    save_cache(uuid_cache_file, uuid_cache)
+        # TSOP
+        generate_pkg(
+            library='LibrePCB_Base.lplib',
+            author='Tubbles',
+            # Name extrapolated from IPC7351C
+            name='TSOP{pin_count}P{pitch}_{body_length}X{lead_span}X{height}L{lead_length}X{lead_width}',
+            description='{pin_count}-pin Thin Small Outline Package (TSOP), '
+                        'standardized by JEDEC (MS-024), Type II (pins on longer side), variation {variation}.\n\n'
+                        'Pitch: {pitch:.2f} mm\nBody length: {body_length:.2f} mm\n'
+                        'Body width: {body_width:.2f} mm\nLead span: {lead_span:.2f} mm\n'
+                        'Height: {height:.2f} mm\n'
+                        'Lead length: {lead_length:.2f} mm\nLead width: {lead_width:.2f} mm',
+            configs=[
+                # pin count, pitch, body length, body width, total width, height
+
+                # Symbols based on JEDEC MS-024:
+                #        N    e     D      E1     E      A
+                SoConfig(28,  1.27, 18.41, 10.16, 11.76, 1.2, 'AA'),
+                SoConfig(32,  1.27, 20.95, 10.16, 11.76, 1.2, 'BA'),
+                SoConfig(50,  0.80, 20.95, 10.16, 11.76, 1.2, 'BC'),
+                SoConfig(80,  0.50, 20.95, 10.16, 11.76, 1.2, 'BD'),
+                SoConfig(36,  1.27, 23.49, 10.16, 11.76, 1.2, 'CA'),
+                SoConfig(70,  0.65, 23.49, 10.16, 11.76, 1.2, 'CB'),
+                SoConfig(40,  1.27, 26.03, 10.16, 11.76, 1.2, 'DA'),
+                SoConfig(70,  0.80, 28.57, 10.16, 11.76, 1.2, 'EA'),
+                SoConfig(54,  0.80, 22.22, 10.16, 11.76, 1.2, 'FA'),
+                SoConfig(86,  0.50, 22.22, 10.16, 11.76, 1.2, 'FB'),
+                SoConfig(66,  0.65, 22.22, 10.16, 11.76, 1.2, 'FC'),
+                SoConfig(54,  0.40, 11.20, 10.16, 11.76, 1.2, 'GA'),
+            ],
+            lead_width_lookup={
+                0.40: 0.18,
+                0.50: 0.22,
+                0.65: 0.30,
+                0.80: 0.375,
+                1.27: 0.41,
+            },
+            lead_contact_length=0.5,
+            generate_3d_models=generate_3d_models,
+            pkgcat='7993abb0-fb0a-4157-8f83-1db890755836',
+            keywords='so,sop,tsop,small outline package,smd',
+            version='0.2',
+            create_date='2020-12-26T16:14:30Z',
+        )
+    finally:
+        save_cache(uuid_cache_file, uuid_cache)
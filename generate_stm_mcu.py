@@ -30,7 +30,7 @@ from collections import defaultdict
 from os import listdir, path
 from uuid import uuid4
 
-from typing import Any, DefaultDict, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from typing import Any, Callable, DefaultDict, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 import common
 from common import human_sort_key, init_cache, save_cache
@@ -78,9 +78,31 @@ def uuid(category: str, full_name: str, identifier: str) -> str:
             For example 'sym' or 'pin-pb9'.
     """
     key = '{}-{}-{}'.format(category, full_name, identifier).lower().replace(' ', '~')
-    if key not in uuid_cache:
-        uuid_cache[key] = str(uuid4())
-    return uuid_cache[key]
+    value = uuid_cache.get(key)
+    if value is None:
+        value = uuid_cache[key] = str(uuid4())
+    return value
+
+
+def uuid_factory(category: str, full_name: str) -> Callable[[str], str]:
+    """
+    Return a function which returns the uuid for an identifier of the
+    specified item, like `uuid`.
+
+    The cache key prefix is built only once, thus this is preferred over
+    `uuid` when the uuids of many pins or signals are needed.
+    """
+    prefix = '{}-{}-'.format(category, full_name).lower().replace(' ', '~')
+    cache = uuid_cache  # Local reference avoids global lookups in the closure
+
+    def _uuid(identifier: str) -> str:
+        key = prefix + identifier.lower().replace(' ', '~')
+        value = cache.get(key)
+        if value is None:
+            value = cache[key] = str(uuid4())
+        return value
+
+    return _uuid
 
 
 class Pin:
@@ -410,12 +432,13 @@ class MCU:
         """
         Get a description of the symbol.
         """
-        description = 'A {} MCU by ST Microelectronics with the following pins:\n\n'.format(self.family)
-        for pin_type in sorted(self.pin_types()):
-            count = len(self.get_pin_names_by_type(pin_type))
-            description += '- {} {} pins\n'.format(count, pin_type)
-        description += '\nGenerated with {}'.format(generator)
-        return description
+        pin_lines = ''.join(
+            '- {} {} pins\n'.format(len(self.get_pin_names_by_type(pin_type)), pin_type)
+            for pin_type in sorted(self.pin_types())
+        )
+        return 'A {} MCU by ST Microelectronics with the following pins:\n\n'.format(self.family) + \
+            pin_lines + \
+            '\nGenerated with {}'.format(generator)
 
     @property
     def component_identifier(self) -> str:
@@ -591,7 +614,9 @@ def generate_sym(mcus: List[MCU], symbol_map: Dict[str, str], debug: bool = Fals
         if debug:
             print(pin_mapping)
 
-        uuid_sym = uuid('sym', mcu.symbol_identifier, 'sym')
+        # The symbol identifier is derived from all pins, so look it up once
+        _uuid = uuid_factory('sym', mcu.symbol_identifier)
+        uuid_sym = _uuid('sym')
         symbol = Symbol(
             uuid_sym,
             Name(mcu.symbol_name),
@@ -608,7 +633,7 @@ def generate_sym(mcus: List[MCU], symbol_map: Dict[str, str], debug: bool = Fals
         placement_pins.sort(key=lambda x: (x[1].x, x[1].y))
         for pin_name, position, rotation in placement.pins(width, grid):
             symbol.add_pin(SymbolPin(
-                uuid('sym', mcu.symbol_identifier, 'pin-{}'.format(pin_name)),
+                _uuid('pin-{}'.format(pin_name)),
                 Name(pin_name),
                 position,
                 rotation,
@@ -619,7 +644,7 @@ def generate_sym(mcus: List[MCU], symbol_map: Dict[str, str], debug: bool = Fals
                 NameAlign('left center')
             ))
         polygon = Polygon(
-            uuid('sym', mcu.symbol_identifier, 'polygon'),
+            _uuid('polygon'),
             Layer('sym_outlines'),
             Width(line_width),
             Fill(False),
@@ -635,7 +660,7 @@ def generate_sym(mcus: List[MCU], symbol_map: Dict[str, str], debug: bool = Fals
         symbol.add_polygon(polygon)
 
         text_name = Text(
-            uuid('sym', mcu.symbol_identifier, 'text-name'),
+            _uuid('text-name'),
             Layer('sym_names'),
             Value('{{NAME}}'),
             Align('left bottom'),
@@ -644,7 +669,7 @@ def generate_sym(mcus: List[MCU], symbol_map: Dict[str, str], debug: bool = Fals
             Rotation(0.0),
         )
         text_value = Text(
-            uuid('sym', mcu.symbol_identifier, 'text-value'),
+            _uuid('text-value'),
             Layer('sym_values'),
             Value('{{VALUE}}'),
             Align('left top'),
@@ -695,8 +720,11 @@ def generate_cmp(
 
         cmp_version = '0.1'
 
+        _uuid = uuid_factory('cmp', mcu.component_identifier)
+        _uuid_sym = uuid_factory('sym', mcu.symbol_identifier)
+
         component = Component(
-            uuid('cmp', mcu.component_identifier, 'cmp'),
+            _uuid('cmp'),
             Name(name),
             Description(mcu.component_description),
             mcu.keywords,
@@ -717,7 +745,7 @@ def generate_cmp(
             component.add_signal(Signal(
                 # Use original signal name, so that changing the cleanup function
                 # does not influence the identifier.
-                uuid('cmp', mcu.component_identifier, 'signal-{}'.format(signal)),
+                _uuid('signal-{}'.format(signal)),
                 # Use cleaned up signal name for name
                 Name(signal),
                 Role.PASSIVE,
@@ -729,8 +757,8 @@ def generate_cmp(
 
         # Add symbol variant
         gate = Gate(
-            uuid('cmp', mcu.component_identifier, 'variant-single-gate1'),
-            SymbolUUID(uuid('sym', mcu.symbol_identifier, 'sym')),
+            _uuid('variant-single-gate1'),
+            SymbolUUID(_uuid_sym('sym')),
             Position(0, 0),
             Rotation(0.0),
             Required(True),
@@ -738,12 +766,12 @@ def generate_cmp(
         )
         for generic, concrete in pin_mapping.items():
             gate.add_pin_signal_map(PinSignalMap(
-                uuid('sym', mcu.symbol_identifier, 'pin-{}'.format(generic)),
-                SignalUUID(uuid('cmp', mcu.component_identifier, 'signal-{}'.format(concrete))),
+                _uuid_sym('pin-{}'.format(generic)),
+                SignalUUID(_uuid('signal-{}'.format(concrete))),
                 TextDesignator.SIGNAL_NAME,
             ))
         component.add_variant(Variant(
-            uuid('cmp', mcu.component_identifier, 'variant-single'),
+            _uuid('variant-single'),
             Norm.EMPTY,
             Name('single'),
             Description('Symbol with all MCU pins'),
@@ -787,6 +815,7 @@ def generate_dev(mcu: MCU, symbol_map: Dict[str, str], base_lib_path: str, debug
 
     pad_uuid_mapping = common.get_pad_uuids(base_lib_path, package_uuid_mapping[mcu.package])
 
+    _uuid_cmp = uuid_factory('cmp', mcu.component_identifier)
     device = Device(
         uuid('dev', mcu.ref, 'dev'),
         Name(mcu.ref),
@@ -798,14 +827,14 @@ def generate_dev(mcu: MCU, symbol_map: Dict[str, str], base_lib_path: str, debug
         Deprecated(False),
         GeneratedBy(''),
         cmpcat,
-        ComponentUUID(uuid('cmp', mcu.component_identifier, 'cmp')),
+        ComponentUUID(_uuid_cmp('cmp')),
         PackageUUID(package_uuid_mapping[mcu.package]),
     )
     for pin in mcu.pins:
         pad_uuid = pad_uuid_mapping[pin.number]
         device.add_pad(ComponentPad(
             pad_uuid,
-            SignalUUID(uuid('cmp', mcu.component_identifier, 'signal-{}'.format(pin.name))),
+            SignalUUID(_uuid_cmp('signal-{}'.format(pin.name))),
         ))
 
     device.serialize(path.join(outdir, 'dev'))
@@ -866,22 +895,24 @@ if __name__ == '__main__':
 
     # Load and parse all data
     data: Dict[str, MCU] = {}
+    # Note: Only process STM32 files for now, because the STM8 ref naming scheme is inconsistent.
+    # See https://github.com/LibrePCB-Libraries/STMicroelectronics.lplib/pull/5 for details.
+    match_filename = re.compile(r'(STM32.*)\.json$').match
     for filename in listdir(args.data_dir):
-        # Note: Only process STM32 files for now, because the STM8 ref naming scheme is inconsistent.
-        # See https://github.com/LibrePCB-Libraries/STMicroelectronics.lplib/pull/5 for details.
-        match = re.match(r'(STM32.*)\.json$', filename)
+        match = match_filename(filename)
         if match:
             mcu_ref = match.group(1)
-            info_path = path.join(args.data_dir, '{}.json'.format(mcu_ref))
-            with open(info_path, 'r') as f:
-                info = json.loads(f.read())
+            with open(path.join(args.data_dir, filename), 'r') as f:
+                info = json.load(f)
                 mcu = MCU.from_json(mcu_ref, info)
                 assert None not in mcu.pin_types()
             assert mcu_ref not in data
             data[mcu_ref] = mcu
 
-    # Generate library elements
-    generate(data, args.base_lib, args.debug)
+    try:
+        # Generate library elements
+        generate(data, args.base_lib, args.debug)
 
-    print()
-    save_cache(uuid_cache_file, uuid_cache)
+        print()
+    finally:
+        save_cache(uuid_cache_file, uuid_cache)
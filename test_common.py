@@ -1,6 +1,13 @@
+import os
+
 import pytest
 
-from common import escape_string, format_float, format_ipc_dimension, human_sort_key, sign
+import common
+from common import (
+    ensure_directory, escape_string, format_float, format_ipc_dimension, get_pad_uuids, get_sources_mtime, get_y,
+    human_sort_key, init_cache, is_up_to_date, save_cache, serialize_parallel, sign, write_element_files,
+    write_if_changed
+)
 
 
 @pytest.mark.parametrize(['inval', 'outval'], [
@@ -51,6 +58,17 @@ def test_sign(inval: float, outval: int) -> None:
     assert sign(inval) == outval
 
 
+@pytest.mark.parametrize(['pin_number', 'pin_count', 'spacing', 'grid_align', 'y'], [
+    (1, 4, 2.54, False, 3.81),
+    (4, 4, 2.54, False, -3.81),
+    (1, 4, 2.54, True, 2.54),
+    (2, 3, 1.27, False, 0.0),
+    (1, 2, 0.5, False, 0.25),
+])
+def test_get_y(pin_number: int, pin_count: int, spacing: float, grid_align: bool, y: float) -> None:
+    assert get_y(pin_number, pin_count, spacing, grid_align) == y
+
+
 @pytest.mark.parametrize(['inval', 'outval'], [
     ('123', [123]),
     ('PA10-PB1', ['PA', 10, '-PB', 1]),
@@ -64,3 +82,121 @@ def test_human_sort_key(inval, outval):
 ])
 def test_human_sort_key_list(inlist, sortedlist):
     assert sorted(inlist, key=human_sort_key) == sortedlist
+
+
+@pytest.mark.parametrize(['old', 'new'], [
+    (None, b'foo\n'),
+    (b'foo\n', b'foo\n'),
+    (b'foo\n', b'bar\n'),
+    (b'foobar\n', b'foo\n'),
+    (b'foo\n', b'foobar\n'),
+])
+def test_write_if_changed(tmp_path, old, new):
+    file_path = tmp_path / 'file.lp'
+    if old is not None:
+        file_path.write_bytes(old)
+    write_if_changed(str(file_path), new)
+    assert file_path.read_bytes() == new
+
+
+def test_get_pad_uuids(tmp_path):
+    pkg_dir = tmp_path / 'pkg' / 'pkg-uuid'
+    pkg_dir.mkdir(parents=True)
+    (pkg_dir / 'package.lp').write_text(
+        '(librepcb_package pkg-uuid\n'
+        ' (pad pad-uuid-1 (name "1"))\n'
+        ' (pad pad-uuid-2 (name "PA10"))\n'
+        ' (footprint fpt-uuid\n'
+        '  (pad fpt-pad-uuid (side top) (shape roundrect)\n'
+        '  )\n'
+        ' )\n'
+        ')\n'
+    )
+    assert get_pad_uuids(str(tmp_path), 'pkg-uuid') == {'1': 'pad-uuid-1', 'PA10': 'pad-uuid-2'}
+
+
+def test_get_sources_mtime(tmp_path, monkeypatch):
+    root = os.path.dirname(os.path.abspath(__file__))
+    expected = max(os.path.getmtime(os.path.join(root, f)) for f in ['common.py', 'entities/package.py'])
+    monkeypatch.chdir(tmp_path)  # Must not depend on the working directory
+    assert get_sources_mtime() >= expected
+    assert get_sources_mtime('generate_dip.py') >= os.path.getmtime(os.path.join(root, 'generate_dip.py'))
+
+
+@pytest.mark.parametrize(['output_mtime', 'sources_mtime', 'result'], [
+    (None, 1000.0, False),  # Output file doesn't exist
+    (1000.0, 2000.0, False),
+    (2000.0, 1000.0, True),
+])
+def test_is_up_to_date(tmp_path, output_mtime, sources_mtime, result):
+    file_path = tmp_path / 'package.lp'
+    if output_mtime is not None:
+        file_path.write_text('')
+        os.utime(file_path, (output_mtime, output_mtime))
+    assert is_up_to_date(str(file_path), sources_mtime) == result
+
+
+def test_ensure_directory(tmp_path):
+    dir_path = str(tmp_path / 'out' / 'pkg' / 'pkg-uuid')
+    assert ensure_directory(dir_path) is True
+    assert os.path.isdir(dir_path)
+    assert ensure_directory(dir_path) is False
+
+    # Directories created by someone else are accepted, but files are not
+    other_dir_path = tmp_path / 'other'
+    other_dir_path.mkdir()
+    assert ensure_directory(str(other_dir_path)) is False
+    file_path = tmp_path / 'file'
+    file_path.write_text('')
+    with pytest.raises(FileExistsError):
+        ensure_directory(str(file_path))
+
+
+def test_ensure_directory_after_chdir(tmp_path, monkeypatch):
+    (tmp_path / 'a').mkdir()
+    (tmp_path / 'b').mkdir()
+    monkeypatch.chdir(tmp_path / 'a')
+    assert ensure_directory(os.path.join('out', 'pkg', 'pkg-uuid')) is True
+    monkeypatch.chdir(tmp_path / 'b')  # Same relative path, other directory
+    assert ensure_directory(os.path.join('out', 'pkg', 'pkg-uuid')) is True
+    assert (tmp_path / 'b' / 'out' / 'pkg' / 'pkg-uuid').is_dir()
+
+
+class _Element:
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def serialize(self, output_directory: str) -> None:
+        with open(os.path.join(output_directory, self.name), 'w') as f:
+            f.write(self.name)
+
+
+def test_serialize_parallel_few_elements(tmp_path):
+    serialize_parallel([_Element('a'), _Element('b')], str(tmp_path))
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['a', 'b']
+
+
+def test_serialize_parallel_process_pool(tmp_path, monkeypatch):
+    monkeypatch.setattr(common, 'cpu_count', lambda: 4)
+    monkeypatch.setattr(common, 'SERIALIZE_PARALLEL_MIN_COUNT', 0)
+    names = [f'element-{i}' for i in range(20)]
+    serialize_parallel([_Element(name) for name in names], str(tmp_path))
+    assert sorted(p.name for p in tmp_path.iterdir()) == sorted(names)
+    assert all((tmp_path / name).read_text() == name for name in names)
+    assert common.shared_process_pool.cache_info().currsize == 1  # The pool was used
+
+
+def test_save_cache_sorts_unchanged_cache(tmp_path):
+    cache_file = str(tmp_path / 'uuid_cache.csv')
+    with open(cache_file, 'w') as f:
+        f.write('pkg-b,uuid-b\npkg-a,uuid-a\n')
+    save_cache(cache_file, init_cache(cache_file))
+    with open(cache_file, 'r') as f:
+        assert f.read() == 'pkg-a,uuid-a\npkg-b,uuid-b\n'
+
+
+def test_write_element_files(tmp_path):
+    dir_path = tmp_path / 'dev' / 'dev-uuid'
+    write_element_files(str(dir_path), '.librepcb-dev', b'1\n', 'device.lp', b'(librepcb_device dev-uuid)\n')
+    assert (dir_path / '.librepcb-dev').read_bytes() == b'1\n'
+    assert (dir_path / 'device.lp').read_bytes() == b'(librepcb_device dev-uuid)\n'
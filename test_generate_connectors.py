@@ -1,3 +1,5 @@
+import os
+
 import pytest
 
 import generate_connectors
@@ -40,6 +42,41 @@ def test_get_y_grid_align(pin_number, pin_count, rows, spacing, y):
     assert result == y
 
 
+@pytest.mark.parametrize(['pin_number', 'pin_count', 'rows', 'spacing', 'y'], [
+    # Even number of pins, centered
+    (1, 4, 1, 2.54, 3.81),
+    (2, 4, 1, 2.54, 1.27),
+    (3, 4, 1, 2.54, -1.27),
+    (4, 4, 1, 2.54, -3.81),
+
+    # Spacing not on the 0.01 grid
+    (1, 3, 1, 0.125, 0.12),
+    (3, 3, 1, 0.125, -0.12),
+])
+def test_get_y_no_grid_align(pin_number, pin_count, rows, spacing, y):
+    result = generate_connectors.get_y(pin_number, pin_count, rows, spacing, False)
+    assert result == y
+
+
+@pytest.mark.parametrize(['pin_count', 'rows', 'spacing', 'grid', 'expected'], [
+    (1, 1, 2.54, True, (0.0,)),
+    (4, 1, 2.54, False, (3.81, 1.27, -1.27, -3.81)),
+    (4, 2, 1.0, True, (0.0, 0.0, -1.0, -1.0)),
+])
+def test_get_ys(pin_count, rows, spacing, grid, expected):
+    result = generate_connectors.get_ys(pin_count, rows, spacing, grid)
+    assert result == expected
+
+
+@pytest.mark.parametrize(['pin_count', 'rows', 'spacing', 'expected'], [
+    (2, 1, 2.54, (0.0, 0.0)),
+    (4, 2, 2.54, (-1.27, 1.27, -1.27, 1.27)),
+])
+def test_get_xs(pin_count, rows, spacing, expected):
+    result = generate_connectors.get_xs(pin_count, rows, spacing)
+    assert result == expected
+
+
 @pytest.mark.parametrize(['pin_count', 'rows', 'spacing', 'top', 'grid', 'expected'], [
     # Special case: 1
     (1, 1, 1.6, 2, True, (2, -2)),
@@ -56,3 +93,30 @@ def test_get_y_grid_align(pin_number, pin_count, rows, spacing, y):
 def test_get_rectangle_bounds(pin_count, rows, spacing, top, grid, expected):
     result = generate_connectors.get_rectangle_bounds(pin_count, rows, spacing, top, grid)
     assert result == pytest.approx(expected)
+
+
+@pytest.mark.parametrize('up_to_date', [True, False])
+def test_generate_sym_incremental(tmp_path, monkeypatch, up_to_date):
+    monkeypatch.chdir(tmp_path)
+    uuid_sym = generate_connectors.uuid_factory('sym', generate_connectors.KIND_HEADER, '1x1')('sym')
+    file_path = tmp_path / 'out' / 'lib' / 'sym' / uuid_sym / 'symbol.lp'
+    file_path.parent.mkdir(parents=True)
+    file_path.write_text('old')
+    os.utime(file_path, (1000.0, 1000.0))
+    monkeypatch.setattr(generate_connectors, 'incremental', True)
+    monkeypatch.setattr(generate_connectors, 'sources_mtime', 500.0 if up_to_date else 2000.0)
+    generate_connectors.generate_sym(
+        library='lib',
+        author='John Doe',
+        name='Pin Header',
+        name_lower='male pin header',
+        kind=generate_connectors.KIND_HEADER,
+        cmpcat='4a4e3c72-94fb-45f9-a6d8-122d2af16fb1',
+        keywords='pin header',
+        rows=1,
+        min_pads=1,
+        max_pads=1,
+        version='0.1',
+        create_date='2018-10-17T19:13:41Z',
+    )
+    assert (file_path.read_text() == 'old') == up_to_date